@@ -0,0 +1,97 @@
+import time
+
+
+def linear(t):
+    return t
+
+
+def ease_out_cubic(t):
+    return 1 - (1 - t) ** 3
+
+
+def ease_in_out_quad(t):
+    return 2 * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 2 / 2
+
+
+class Animation:
+    """One canvas item moving from start to end over duration seconds."""
+    __slots__ = ('item', 'start', 'end', 'duration', 'easing', 'on_done', 'started', 'cancelled')
+
+    def __init__(self, item, start, end, duration, easing, on_done, started):
+        self.item = item
+        self.start = start
+        self.end = end
+        self.duration = duration
+        self.easing = easing
+        self.on_done = on_done
+        self.started = started
+        self.cancelled = False
+
+    def position(self, now):
+        """Returns (x, y, finished) at time now."""
+        progress = 1.0 if self.duration <= 0 else min((now - self.started) / self.duration, 1.0)
+        eased = self.easing(progress)
+        x = self.start[0] + (self.end[0] - self.start[0]) * eased
+        y = self.start[1] + (self.end[1] - self.start[1]) * eased
+        return x, y, progress >= 1.0
+
+
+class AnimationScheduler:
+    """
+    Frame-based animation on root.after: one timer drives every animation in flight,
+    at most fps frames per second, and stops itself when nothing is moving.
+    The Tk event loop is never re-entered, so the window stays responsive.
+    """
+
+    def __init__(self, root, canvas, fps=60, clock=time.perf_counter):
+        self.root = root
+        self.canvas = canvas
+        self.frame_ms = max(1, int(1000 / fps))
+        self.clock = clock
+        self._animations = []
+        self._after_id = None
+
+    @property
+    def active(self):
+        return len(self._animations)
+
+    def move(self, item, start, end, duration=0.3, easing=ease_out_cubic, on_done=None):
+        """Starts moving a canvas item and returns the Animation (usable with cancel)."""
+        animation = Animation(item, start, end, duration, easing, on_done, self.clock())
+        self.canvas.coords(item, *start)
+        self._animations.append(animation)
+        if self._after_id is None:
+            self._after_id = self.root.after(self.frame_ms, self._tick)
+        return animation
+
+    def cancel(self, animation):
+        """Stops an animation where it is; its on_done callback is not called."""
+        animation.cancelled = True
+        if animation in self._animations:
+            self._animations.remove(animation)
+
+    def cancel_all(self):
+        for animation in list(self._animations):
+            self.cancel(animation)
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _tick(self):
+        now = self.clock()
+        finished = []
+        for animation in self._animations:
+            x, y, done = animation.position(now)
+            self.canvas.coords(animation.item, x, y)
+            if done:
+                finished.append(animation)
+        for animation in finished:
+            self._animations.remove(animation)
+        for animation in finished:
+            if animation.on_done is not None:
+                animation.on_done()
+
+        if self._animations:
+            self._after_id = self.root.after(self.frame_ms, self._tick)
+        else:
+            self._after_id = None
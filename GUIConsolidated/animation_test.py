@@ -0,0 +1,100 @@
+#This file contains the tests for the Tkinter animation scheduler.
+import unittest
+
+from animation import AnimationScheduler, ease_in_out_quad, ease_out_cubic, linear
+
+
+class FakeRoot:
+    '''Stands in for tk.Tk: after() callbacks run only when the test calls run_next().'''
+
+    def __init__(self):
+        self.jobs = {}
+        self.next_id = 0
+
+    def after(self, delay, callback):
+        self.next_id += 1
+        self.jobs[self.next_id] = (delay, callback)
+        return self.next_id
+
+    def after_cancel(self, job):
+        self.jobs.pop(job, None)
+
+    def run_next(self):
+        job = min(self.jobs)
+        _, callback = self.jobs.pop(job)
+        callback()
+
+
+class FakeCanvas:
+    def __init__(self):
+        self.positions = {}
+
+    def coords(self, item, x, y):
+        self.positions[item] = (x, y)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class AnimationSchedulerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.root = FakeRoot()
+        self.canvas = FakeCanvas()
+        self.clock = FakeClock()
+        self.scheduler = AnimationScheduler(self.root, self.canvas, fps=50, clock=self.clock)
+
+    def test_easing_end_points(self):
+        for easing in (linear, ease_out_cubic, ease_in_out_quad):
+            self.assertEqual(easing(0.0), 0.0)
+            self.assertEqual(easing(1.0), 1.0)
+
+    def test_one_timer_drives_several_cards(self):
+        landed = []
+        self.scheduler.move("a", (0, 0), (100, 0), duration=1.0, easing=linear, on_done=lambda: landed.append("a"))
+        self.clock.now = 0.5
+        self.scheduler.move("b", (0, 0), (0, 100), duration=1.0, easing=linear, on_done=lambda: landed.append("b"))
+        self.assertEqual(len(self.root.jobs), 1)
+        self.assertEqual(self.root.jobs[1][0], 20)
+
+        self.root.run_next()
+        self.assertEqual(self.canvas.positions, {"a": (50, 0), "b": (0, 0)})
+        self.clock.now = 1.0
+        self.root.run_next()
+        self.assertEqual(landed, ["a"])
+        self.assertEqual(self.scheduler.active, 1)
+        self.clock.now = 2.0
+        self.root.run_next()
+        self.assertEqual(landed, ["a", "b"])
+        self.assertEqual(self.canvas.positions["b"], (0, 100))
+        self.assertEqual(self.root.jobs, {})
+
+    def test_cancel(self):
+        landed = []
+        animation = self.scheduler.move("a", (0, 0), (100, 0), on_done=lambda: landed.append("a"))
+        self.scheduler.move("b", (0, 0), (100, 0))
+        self.scheduler.cancel(animation)
+        self.assertTrue(animation.cancelled)
+        self.assertEqual(self.scheduler.active, 1)
+        self.scheduler.cancel_all()
+        self.assertEqual(self.root.jobs, {})
+        self.clock.now = 5.0
+        self.assertEqual(landed, [])
+
+    def test_on_done_can_start_next_animation(self):
+        def chain():
+            self.scheduler.move("b", (0, 0), (10, 10), duration=0.1)
+        self.scheduler.move("a", (0, 0), (10, 10), duration=0.1, on_done=chain)
+        self.clock.now = 0.2
+        self.root.run_next()
+        self.assertEqual(self.scheduler.active, 1)
+        self.assertEqual(len(self.root.jobs), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
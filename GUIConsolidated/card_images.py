@@ -0,0 +1,80 @@
+import io
+import os
+import zipfile
+
+from PIL import Image, ImageTk
+
+
+SUITS = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
+RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'Jack', 'Queen', 'King', 'Ace']
+CARD_SIZE = (100, 150)
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def find_card_source():
+    """
+    Returns where the card faces live: a cards/ folder next to the working directory
+    or this file, otherwise the cards.zip archive shipped with the project.
+    """
+    candidates = [
+        "cards",
+        os.path.join(_HERE, "cards"),
+        os.path.join(_HERE, "cards.zip"),
+        os.path.join(_HERE, os.pardir, "cards.zip"),
+    ]
+    for candidate in candidates:
+        if os.path.isdir(candidate) or (os.path.isfile(candidate) and zipfile.is_zipfile(candidate)):
+            return candidate
+    raise FileNotFoundError("No cards/ folder or cards.zip found")
+
+
+class CardImageCache:
+    """
+    Loads all 52 card faces once at startup into a single pre-scaled sprite atlas
+    (13 columns by 4 rows) and hands out PhotoImage objects cached by (rank, suit, size).
+    """
+
+    def __init__(self, source=None, size=CARD_SIZE):
+        self.size = tuple(size)
+        self.atlas = Image.new("RGBA", (self.size[0] * len(RANKS), self.size[1] * len(SUITS)))
+        self._sprites = {}
+        self._photos = {}
+        for (rank, suit), face in self._load_faces(source or find_card_source()):
+            x = RANKS.index(rank) * self.size[0]
+            y = SUITS.index(suit) * self.size[1]
+            self.atlas.paste(face.convert("RGBA").resize(self.size), (x, y))
+
+    @staticmethod
+    def _load_faces(source):
+        """Yields ((rank, suit), image) for every card from a folder or a zip archive."""
+        names = [(rank, suit) for suit in SUITS for rank in RANKS]
+        if os.path.isdir(source):
+            for rank, suit in names:
+                with Image.open(os.path.join(source, f"{rank}_{suit}.png")) as face:
+                    face.load()
+                    yield (rank, suit), face
+        else:
+            with zipfile.ZipFile(source) as archive:
+                for rank, suit in names:
+                    data = archive.read(f"cards/{rank}_{suit}.png")
+                    yield (rank, suit), Image.open(io.BytesIO(data))
+
+    def sprite(self, rank, suit, size=None):
+        """Returns the PIL image of a card, cut from the atlas and rescaled once per size."""
+        size = tuple(size or self.size)
+        key = (rank, suit, size)
+        if key not in self._sprites:
+            x = RANKS.index(rank) * self.size[0]
+            y = SUITS.index(suit) * self.size[1]
+            image = self.atlas.crop((x, y, x + self.size[0], y + self.size[1]))
+            self._sprites[key] = image if size == self.size else image.resize(size)
+        return self._sprites[key]
+
+    def photo(self, rank, suit, size=None):
+        """Returns the cached Tk PhotoImage of a card (needs a Tk root to exist)."""
+        size = tuple(size or self.size)
+        key = (rank, suit, size)
+        if key not in self._photos:
+            self._photos[key] = ImageTk.PhotoImage(self.sprite(rank, suit, size))
+        return self._photos[key]
@@ -0,0 +1,43 @@
+#This file contains the tests for the card image cache.
+import os
+import unittest
+from unittest.mock import patch
+
+from card_images import CARD_SIZE, CardImageCache
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+class CardImageCacheTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.cache = CardImageCache(os.path.join(HERE, "cards"))
+
+    def test_atlas_holds_all_faces(self):
+        self.assertEqual(self.cache.atlas.size, (CARD_SIZE[0] * 13, CARD_SIZE[1] * 4))
+        sprite = self.cache.sprite("Ace", "Spades")
+        self.assertEqual(sprite.size, CARD_SIZE)
+        self.assertIs(sprite, self.cache.sprite("Ace", "Spades"))
+        self.assertIsNot(sprite, self.cache.sprite("Ace", "Hearts"))
+
+    def test_zip_source_matches_folder(self):
+        from_zip = CardImageCache(os.path.join(HERE, os.pardir, "cards.zip"))
+        self.assertEqual(from_zip.atlas.tobytes(), self.cache.atlas.tobytes())
+
+    def test_other_sizes_are_scaled_once(self):
+        small = self.cache.sprite("10", "Clubs", (50, 75))
+        self.assertEqual(small.size, (50, 75))
+        self.assertIs(small, self.cache.sprite("10", "Clubs", (50, 75)))
+
+    @patch('card_images.ImageTk.PhotoImage')
+    def test_photo_images_are_cached(self, mock_photo):
+        first = self.cache.photo("King", "Hearts")
+        second = self.cache.photo("King", "Hearts")
+        self.assertIs(first, second)
+        self.cache.photo("King", "Hearts", (50, 75))
+        self.assertEqual(mock_photo.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import json
+import os
+import re
+import statistics
+import time
+from dataclasses import asdict, dataclass
+
+
+@dataclass(frozen=True)
+class DrillResult:
+    num_cards: int
+    cards_per_second: float
+    expected: int
+    answer: int
+    latency_ns: int
+
+    @property
+    def correct(self):
+        return self.answer == self.expected
+
+    @property
+    def latency_s(self):
+        return self.latency_ns / 1e9
+
+
+class FlashDrill:
+    """
+    One speed drill: num_cards cards are flashed at cards_per_second, then the trainee
+    gives the running count of those cards. The response latency is measured with
+    time.perf_counter_ns from the moment the prompt is shown to the moment of the answer.
+    """
+
+    def __init__(self, deck, counter, num_cards=10, cards_per_second=2.0, clock_ns=time.perf_counter_ns):
+        if num_cards < 1 or cards_per_second <= 0:
+            raise ValueError("A drill needs at least one card and a positive rate")
+        if len(deck.cards) < num_cards:
+            raise ValueError(f"Only {len(deck.cards)} cards left for a {num_cards}-card drill")
+        self.deck = deck
+        self.counter = counter
+        self.num_cards = num_cards
+        self.cards_per_second = cards_per_second
+        self.clock_ns = clock_ns
+        self.flashed = 0
+        self.prompt_started_ns = None
+        counter.reset()
+
+    @property
+    def interval_ms(self):
+        return max(1, round(1000 / self.cards_per_second))
+
+    def next_card(self):
+        """Deals and counts the next card to flash, or returns None once all have been shown."""
+        if self.flashed == self.num_cards:
+            return None
+        card = self.deck.deal_card()
+        self.counter.update_count(card)
+        self.flashed += 1
+        return card
+
+    def prompt(self):
+        """Marks the moment the running count question is shown."""
+        self.prompt_started_ns = self.clock_ns()
+
+    def answer(self, running_count):
+        """Times the trainee's answer and returns the DrillResult."""
+        if self.prompt_started_ns is None:
+            raise ValueError("The drill has not asked for the count yet")
+        latency = self.clock_ns() - self.prompt_started_ns
+        return DrillResult(self.num_cards, self.cards_per_second, self.counter.running_count,
+                           int(running_count), latency)
+
+
+class DrillRecorder:
+    """
+    Keeps every drill result per trainee in a JSON file under directory, so speed
+    curves build up across sessions.
+    """
+
+    def __init__(self, directory="drill_results"):
+        self.directory = directory
+
+    def path(self, trainee):
+        name = re.sub(r'[^A-Za-z0-9_-]+', '_', trainee.strip()) or 'trainee'
+        return os.path.join(self.directory, f"{name}.json")
+
+    def load(self, trainee):
+        try:
+            with open(self.path(trainee)) as f:
+                return [DrillResult(**entry) for entry in json.load(f)]
+        except FileNotFoundError:
+            return []
+
+    def record(self, trainee, result):
+        results = self.load(trainee) + [result]
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.path(trainee), 'w') as f:
+            json.dump([asdict(entry) for entry in results], f, indent=1)
+        return results
+
+    def speed_curve(self, trainee):
+        """
+        Returns (cards_per_second, drills, accuracy, median latency in seconds) for each
+        rate the trainee has drilled at, slowest rate first.
+        """
+        by_rate = {}
+        for result in self.load(trainee):
+            by_rate.setdefault(result.cards_per_second, []).append(result)
+        curve = []
+        for rate in sorted(by_rate):
+            results = by_rate[rate]
+            median = statistics.median(result.latency_s for result in results)
+            accuracy = sum(result.correct for result in results) / len(results)
+            curve.append((rate, len(results), accuracy, median))
+        return curve
+
+    def certified_rate(self, trainee, accuracy=0.9, max_latency_s=3.0, min_drills=5):
+        """Fastest rate drilled at least min_drills times within the accuracy and latency targets."""
+        passing = [rate for rate, drills, hit_rate, latency in self.speed_curve(trainee)
+                   if drills >= min_drills and hit_rate >= accuracy and latency <= max_latency_s]
+        return max(passing, default=None)
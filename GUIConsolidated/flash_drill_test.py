@@ -0,0 +1,82 @@
+#This file contains the tests for the flash drill speed training mode.
+import os
+import tempfile
+import unittest
+
+from flash_drill import DrillRecorder, DrillResult, FlashDrill
+from cardcount import CardCounter, Deck
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class FlashDrillTests(unittest.TestCase):
+
+    def test_flashes_exactly_num_cards_and_counts_them(self):
+        deck, counter = Deck(), CardCounter()
+        counter.running_count = 7
+        drill = FlashDrill(deck, counter, num_cards=5, cards_per_second=4)
+        cards = [drill.next_card() for _ in range(5)]
+        self.assertIsNone(drill.next_card())
+        self.assertEqual(len(deck.cards), 47)
+        self.assertEqual(drill.interval_ms, 250)
+        low = sum(card.rank in ('2', '3', '4', '5', '6') for card in cards)
+        high = sum(card.rank in ('10', 'Jack', 'Queen', 'King', 'Ace') for card in cards)
+        self.assertEqual(counter.running_count, low - high)
+
+    def test_latency_is_measured_from_the_prompt(self):
+        clock = FakeClock()
+        drill = FlashDrill(Deck(), CardCounter(), num_cards=1, clock_ns=clock)
+        drill.next_card()
+        with self.assertRaises(ValueError):
+            drill.answer(0)
+        clock.now = 1_000
+        drill.prompt()
+        clock.now = 1_500_001_000
+        result = drill.answer(str(drill.counter.running_count))
+        self.assertTrue(result.correct)
+        self.assertEqual(result.latency_ns, 1_500_000_000)
+        self.assertAlmostEqual(result.latency_s, 1.5)
+
+    def test_short_deck_is_rejected(self):
+        deck = Deck()
+        for _ in range(49):
+            deck.deal_card()
+        with self.assertRaises(ValueError):
+            FlashDrill(deck, CardCounter(), num_cards=4)
+
+
+class DrillRecorderTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.recorder = DrillRecorder(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_results_persist_per_trainee(self):
+        self.recorder.record("Ann Lee", DrillResult(10, 2.0, 3, 3, 2_000_000_000))
+        self.recorder.record("Ann Lee", DrillResult(10, 2.0, 1, 0, 4_000_000_000))
+        self.recorder.record("Bo", DrillResult(10, 4.0, 1, 1, 1_000_000_000))
+        self.assertTrue(os.path.exists(os.path.join(self.directory.name, "Ann_Lee.json")))
+        reloaded = DrillRecorder(self.directory.name)
+        self.assertEqual(len(reloaded.load("Ann Lee")), 2)
+        self.assertEqual(reloaded.speed_curve("Ann Lee"), [(2.0, 2, 0.5, 3.0)])
+        self.assertEqual(reloaded.load("nobody"), [])
+
+    def test_certified_rate_is_fastest_passing_rate(self):
+        for rate, correct in ((2.0, True), (3.0, True), (4.0, False)):
+            for _ in range(5):
+                self.recorder.record("ann", DrillResult(10, rate, 2, 2 if correct else 0, 1_000_000_000))
+        self.assertEqual(self.recorder.certified_rate("ann"), 3.0)
+        self.assertIsNone(self.recorder.certified_rate("ann", max_latency_s=0.5))
+
+
+if __name__ == "__main__":
+    unittest.main()
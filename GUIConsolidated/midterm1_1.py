@@ -1,8 +1,8 @@
-import random
 import tkinter as tk
 from tkinter import messagebox
-from PIL import Image, ImageTk
-from dataclasses import dataclass
+from card_images import CardImageCache
+from flash_drill import DrillRecorder, FlashDrill
+from cardcount import CardCounter, Deck
 
 # Card values for Hi-Lo counting system
 HI_LO_VALUES = {
@@ -11,71 +11,23 @@ HI_LO_VALUES = {
     '10': -1, 'J': -1, 'Q': -1, 'K': -1, 'A': -1
 }
 
-@dataclass
-class Card:
-    suit: str
-    rank: str
-
-    def __str__(self):
-        return f"{self.rank} of {self.suit}"
-
-class Deck:
-    suits = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
-    ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'Jack', 'Queen', 'King', 'Ace']
-    
-    def __init__(self, num_decks=1):
-        self.num_decks = num_decks
-        self.cards = []
-        for _ in range(num_decks):
-            for suit in self.suits:
-                for rank in self.ranks:
-                    self.cards.append(Card(suit, rank))
-        self.shuffle()
-
-    def shuffle(self):
-        random.shuffle(self.cards)
-
-    def deal_card(self):
-        if len(self.cards) == 0:
-            return None
-        return self.cards.pop()
-
-class CardCounter:
-    def __init__(self, num_decks=1):
-        self.running_count = 0
-        self.num_decks = num_decks
-        self.cards_dealt = 0
-
-    def update_count(self, card: Card):
-        if card.rank in ['2', '3', '4', '5', '6']:
-            self.running_count += 1
-        elif card.rank in ['10', 'Jack', 'Queen', 'King', 'Ace']:
-            self.running_count -= 1
-        self.cards_dealt += 1
-
-    def true_count(self, remaining_cards: int) -> float:
-        remaining_decks = remaining_cards / 52.0
-        if remaining_decks == 0:
-            return self.running_count
-        return self.running_count / remaining_decks
-
-    def reset(self):
-        self.running_count = 0
-        self.cards_dealt = 0
-
 # GUI with fixes
 class CardCountingGUI:
-    def __init__(self, root):
+    def __init__(self, root, drill_cards=10, drill_rate=2.0, recorder=None):
         self.root = root
         self.root.title("Blackjack Card Counting")
         self.root.geometry("800x600")
 
         self.deck = Deck(num_decks=1)
         self.counter = CardCounter(num_decks=1)
+        self.card_images = CardImageCache()
         self.running_count = 0
         self.attempts = []
         self.current_card = None
         self.mode = None  
+        self.drill = None
+        self.drill_cards = drill_cards
+        self.recorder = recorder or DrillRecorder()
 
         self.canvas = tk.Canvas(self.root, width=400, height=300, bg="lightgray")
         self.canvas.pack()
@@ -92,12 +44,33 @@ class CardCountingGUI:
         self.automated_button = tk.Button(self.root, text="Start Automated Mode", width=20, command=self.start_automated_mode)
         self.automated_button.pack()
 
+        self.drill_button = tk.Button(self.root, text="Start Flash Drill", width=20, command=self.start_drill_mode)
+        self.drill_button.pack()
+
+        self.trainee_entry = tk.Entry(self.root)
+        self.trainee_entry.insert(0, "trainee")
+        self.trainee_entry.pack()
+
+        self.rate_scale = tk.Scale(self.root, from_=0.5, to=8.0, resolution=0.5, orient=tk.HORIZONTAL, label="Cards per second")
+        self.rate_scale.set(drill_rate)
+        self.rate_scale.pack()
+
+        # The guess widgets are built once and shown or hidden as needed
+        self.guess_label = tk.Label(self.root, text="Enter Running Count Guess:", font=('Arial', 12))
+        self.guess_entry = tk.Entry(self.root)
+        self.submit_button = tk.Button(self.root, text="Submit", command=self.check_guess)
+        self.guess_entry.bind("<Return>", self.check_guess)
+        self.drill_label = tk.Label(self.root, text="", font=('Arial', 12))
+        self.drill_label.pack()
+
         self.card_image_item = None
+        self._flash_job = None
 
         self.root.bind("<Return>", self.handle_enter_key)
         self.root.bind("<q>", self.quit_program)
 
     def start_tutorial_mode(self):
+        self.stop_drill()
         self.mode = "tutorial"
         self.counter.reset()
         self.deck.shuffle()
@@ -105,11 +78,48 @@ class CardCountingGUI:
         self.display_card()
 
     def start_automated_mode(self):
+        self.stop_drill()
         self.mode = "automated"
         self.counter.reset()
         self.deck.shuffle()
         self.display_card()
 
+    def start_drill_mode(self):
+        self.stop_drill()
+        self.mode = "drill"
+        self.hide_guess()
+        if len(self.deck.cards) < self.drill_cards:
+            self.deck.reshuffle()
+        self.drill = FlashDrill(self.deck, self.counter, self.drill_cards, float(self.rate_scale.get()))
+        self.drill_label.config(text=f"Count {self.drill_cards} cards at {self.drill.cards_per_second:g} per second")
+        self.flash_next_card()
+
+    def stop_drill(self):
+        if self._flash_job is not None:
+            self.root.after_cancel(self._flash_job)
+            self._flash_job = None
+        self.drill = None
+
+    def flash_next_card(self):
+        self._flash_job = None
+        card = self.drill.next_card()
+        if card is None:
+            if self.card_image_item is not None:
+                self.canvas.itemconfig(self.card_image_item, state='hidden')
+            self.ask_for_guess()
+            self.drill.prompt()
+            return
+        self.show_card(card)
+        self._flash_job = self.root.after(self.drill.interval_ms, self.flash_next_card)
+
+    def show_card(self, card):
+        card_photo = self.card_images.photo(card.rank, card.suit)
+        if self.card_image_item is None:
+            self.card_image_item = self.canvas.create_image(200, 150, image=card_photo)
+        else:
+            self.canvas.itemconfig(self.card_image_item, image=card_photo, state='normal')
+        self.canvas.image = card_photo
+
     def display_card(self, event=None):
         if len(self.deck.cards) == 0:
             messagebox.showinfo("Game Over", "The deck is empty.")
@@ -120,16 +130,7 @@ class CardCountingGUI:
         remaining_cards = len(self.deck.cards)
         true_count = self.counter.true_count(remaining_cards)
 
-        card_image = Image.open(f"cards/{self.current_card.rank}_{self.current_card.suit}.png")
-        card_image = card_image.resize((100, 150))
-        card_photo = ImageTk.PhotoImage(card_image)
-
-        if self.card_image_item is None:
-            self.card_image_item = self.canvas.create_image(200, 150, image=card_photo)
-        else:
-            self.canvas.itemconfig(self.card_image_item, image=card_photo)
-
-        self.canvas.image = card_photo
+        self.show_card(self.current_card)
 
         self.running_count_label.config(text=f"Running Count: {self.counter.running_count}")
         self.true_count_label.config(text=f"True Count: {true_count:.2f}")
@@ -140,18 +141,20 @@ class CardCountingGUI:
             self.wait_for_input()
 
     def ask_for_guess(self):
-        self.guess_label = tk.Label(self.root, text="Enter Running Count Guess:", font=('Arial', 12))
+        self.guess_entry.delete(0, tk.END)
         self.guess_label.pack()
-
-        self.guess_entry = tk.Entry(self.root)
         self.guess_entry.pack()
-
-        self.submit_button = tk.Button(self.root, text="Submit", command=self.check_guess)
         self.submit_button.pack()
+        self.guess_entry.focus_set()
 
-        self.guess_entry.bind("<Return>", self.check_guess)
+    def hide_guess(self):
+        self.guess_label.pack_forget()
+        self.guess_entry.pack_forget()
+        self.submit_button.pack_forget()
 
     def check_guess(self, event=None):
+        if self.mode == "drill":
+            return self.check_drill_answer()
         try:
             user_guess = int(self.guess_entry.get())
             is_correct = user_guess == self.counter.running_count
@@ -160,15 +163,27 @@ class CardCountingGUI:
             else:
                 messagebox.showinfo("Incorrect Guess", f"❌ Incorrect. The correct running count is {self.counter.running_count}.")
             
-            self.guess_label.destroy()
-            self.guess_entry.destroy()
-            self.submit_button.destroy()
-
+            self.hide_guess()
             self.display_card()
 
         except ValueError:
             messagebox.showinfo("Invalid Input", "❌ Invalid input. Please enter a number.")
 
+    def check_drill_answer(self):
+        if self.drill is None or self.drill.prompt_started_ns is None:
+            return
+        try:
+            result = self.drill.answer(int(self.guess_entry.get()))
+        except ValueError:
+            messagebox.showinfo("Invalid Input", "❌ Invalid input. Please enter a number.")
+            return
+        self.hide_guess()
+        trainee = self.trainee_entry.get()
+        self.recorder.record(trainee, result)
+        verdict = "✅ Correct" if result.correct else f"❌ Incorrect, the count was {result.expected}"
+        self.drill_label.config(text=f"{verdict} in {result.latency_s:.2f} s")
+        self.drill = None
+
     def wait_for_input(self):
         if not hasattr(self, "info_label"):
             self.info_label = tk.Label(self.root, text="Press Enter for the next card or 'q' to quit.", font=('Arial', 12))
@@ -0,0 +1,134 @@
+import math
+
+
+DEALER = -1
+
+
+class TableLayout:
+    """
+    Positions on a blackjack table canvas: the dealer along the top edge and up to
+    seven player seats on an arc below, seat 0 on the left.
+    Cards within a hand fan out by offset pixels.
+    """
+
+    def __init__(self, width=780, height=420, seats=7, offset=(14, 12)):
+        self.width = width
+        self.height = height
+        self.seats = seats
+        self.offset = offset
+        self.shoe_position = (width - 60, 70)
+        self.dealer_position = (width / 2, 80)
+        center_x, center_y = width / 2, -height * 0.55
+        radius = height * 1.35
+        spread = math.radians(60)
+        self.seat_positions = []
+        for seat in range(seats):
+            fraction = 0.5 if seats == 1 else seat / (seats - 1)
+            angle = math.pi / 2 + spread / 2 - spread * fraction
+            self.seat_positions.append((center_x + radius * math.cos(angle), center_y + radius * math.sin(angle)))
+
+    def card_position(self, seat, index):
+        """Canvas position of the index-th card of a seat (DEALER for the dealer's hand)."""
+        x, y = self.dealer_position if seat == DEALER else self.seat_positions[seat]
+        return x + index * self.offset[0], y - (0 if seat == DEALER else index * self.offset[1])
+
+
+class CanvasItemPool:
+    """Reuses hidden canvas image items instead of creating and deleting one per card."""
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self._free = []
+        self.in_use = set()
+
+    def acquire(self, image, x, y):
+        if self._free:
+            item = self._free.pop()
+            self.canvas.itemconfig(item, image=image, state='normal')
+            self.canvas.coords(item, x, y)
+            self.canvas.tag_raise(item)
+        else:
+            item = self.canvas.create_image(x, y, image=image)
+        self.in_use.add(item)
+        return item
+
+    def release(self, item):
+        if item in self.in_use:
+            self.in_use.remove(item)
+            self.canvas.itemconfig(item, state='hidden')
+            self._free.append(item)
+
+    def release_all(self):
+        for item in list(self.in_use):
+            self.release(item)
+
+    @property
+    def size(self):
+        return len(self.in_use) + len(self._free)
+
+
+class FrameBatcher:
+    """
+    Collects widget updates and applies them once per frame. Only the latest update
+    per key survives, so a label changed several times in a frame is configured once.
+    """
+
+    def __init__(self, root, fps=60):
+        self.root = root
+        self.frame_ms = max(1, int(1000 / fps))
+        self._pending = {}
+        self._after_id = None
+
+    def config(self, widget, **options):
+        """Queues widget.config(**options) for the next frame."""
+        self.schedule((id(widget), tuple(sorted(options))), lambda: widget.config(**options))
+
+    def schedule(self, key, update):
+        self._pending[key] = update
+        if self._after_id is None:
+            self._after_id = self.root.after(self.frame_ms, self.flush)
+
+    def flush(self):
+        pending, self._pending = self._pending, {}
+        self._after_id = None
+        for update in pending.values():
+            update()
+
+    def cancel(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self._pending.clear()
+
+
+class TableView:
+    """Deals cards to seats on a canvas with pooled items, animated by an AnimationScheduler."""
+
+    def __init__(self, canvas, card_images, animations, layout=None, card_size=(60, 90), pool=None):
+        self.canvas = canvas
+        self.card_images = card_images
+        self.animations = animations
+        self.layout = layout or TableLayout()
+        self.card_size = card_size
+        self.pool = pool or CanvasItemPool(canvas)
+        self.hands = {}
+
+    def deal_to(self, seat, card, duration=0.25):
+        """Slides a card from the shoe to the next spot of a seat's hand and returns its item."""
+        hand = self.hands.setdefault(seat, [])
+        target = self.layout.card_position(seat, len(hand))
+        item = self.pool.acquire(self.card_images.photo(card.rank, card.suit, self.card_size), *self.layout.shoe_position)
+        hand.append(item)
+        self.animations.move(item, self.layout.shoe_position, target, duration=duration)
+        return item
+
+    def clear(self):
+        self.animations.cancel_all()
+        for hand in self.hands.values():
+            for item in hand:
+                self.pool.release(item)
+        self.hands = {}
+
+    @property
+    def cards_on_table(self):
+        return sum(len(hand) for hand in self.hands.values())
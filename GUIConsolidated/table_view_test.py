@@ -0,0 +1,63 @@
+#This file contains the tests for the multi-seat table view.
+import unittest
+from unittest.mock import MagicMock
+
+from cardcount import Card
+from table_view import DEALER, CanvasItemPool, FrameBatcher, TableLayout, TableView
+
+
+class TableViewTests(unittest.TestCase):
+
+    def test_layout_fits_canvas(self):
+        layout = TableLayout(780, 420, seats=7)
+        self.assertEqual(len(layout.seat_positions), 7)
+        for seat in range(7):
+            for index in range(7):
+                x, y = layout.card_position(seat, index)
+                self.assertTrue(0 <= x <= 780 and 0 <= y <= 420, (seat, index, x, y))
+        self.assertEqual(layout.card_position(DEALER, 0), layout.dealer_position)
+        xs = [x for x, _ in layout.seat_positions]
+        self.assertEqual(xs, sorted(xs))
+
+    def test_pool_reuses_items(self):
+        canvas = MagicMock()
+        canvas.create_image.side_effect = range(100)
+        pool = CanvasItemPool(canvas)
+        first = [pool.acquire("image", 0, 0) for _ in range(3)]
+        pool.release(first[0])
+        pool.release(first[0])
+        again = pool.acquire("other", 5, 5)
+        self.assertEqual(again, first[0])
+        self.assertEqual(canvas.create_image.call_count, 3)
+        canvas.itemconfig.assert_called_with(again, image="other", state='normal')
+        pool.release_all()
+        self.assertEqual(pool.in_use, set())
+        self.assertEqual(pool.size, 3)
+
+    def test_batcher_applies_latest_update_once_per_frame(self):
+        root = MagicMock()
+        label = MagicMock()
+        batcher = FrameBatcher(root, fps=50)
+        for count in range(5):
+            batcher.config(label, text=f"Running Count: {count}")
+        root.after.assert_called_once_with(20, batcher.flush)
+        label.config.assert_not_called()
+        batcher.flush()
+        label.config.assert_called_once_with(text="Running Count: 4")
+
+    def test_fifty_cards_with_constant_item_count(self):
+        canvas = MagicMock()
+        canvas.create_image.side_effect = range(1000)
+        animations = MagicMock()
+        table = TableView(canvas, MagicMock(), animations, TableLayout(seats=7))
+        for _ in range(3):
+            table.clear()
+            for seat in list(range(7)) * 7 + [DEALER] * 7:
+                table.deal_to(seat, Card("Hearts", "5"))
+            self.assertEqual(table.cards_on_table, 56)
+        self.assertEqual(canvas.create_image.call_count, 56)
+        self.assertEqual(animations.move.call_count, 168)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,9 @@
-import random
 import tkinter as tk
 from tkinter import messagebox
-from PIL import Image, ImageTk
-from dataclasses import dataclass
-import matplotlib.pyplot as plt
+from animation import AnimationScheduler
+from table_view import DEALER, CanvasItemPool, FrameBatcher, TableLayout, TableView
 from collections import deque
+from cardcount import CardCounter, Deck
 
 
 # Card values for Hi-Lo counting system
@@ -17,64 +16,14 @@ HI_LO_VALUES = {
 # Standard 52-card deck
 DECK = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A'] * 4
 
-@dataclass
-class Card:
-    suit: str
-    rank: str
-
-    def __str__(self):
-        return f"{self.rank} of {self.suit}"
-
-class Deck:
-    suits = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
-    ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'Jack', 'Queen', 'King', 'Ace']
-    
-    def __init__(self, num_decks=1):
-        self.num_decks = num_decks
-        self.cards = []
-        for _ in range(num_decks):
-            for suit in self.suits:
-                for rank in self.ranks:
-                    self.cards.append(Card(suit, rank))
-        self.shuffle()
-
-    def shuffle(self):
-        random.shuffle(self.cards)
-
-    def deal_card(self):
-        if len(self.cards) == 0:
-            return None
-        return self.cards.pop()
-
-class CardCounter:
-    def __init__(self, num_decks=1):
-        self.running_count = 0
-        self.num_decks = num_decks
-        self.cards_dealt = 0
-
-    def update_count(self, card: Card):
-        if card.rank in ['2', '3', '4', '5', '6']:
-            self.running_count += 1
-        elif card.rank in ['10', 'Jack', 'Queen', 'King', 'Ace']:
-            self.running_count -= 1
-        self.cards_dealt += 1
-
-    def true_count(self, remaining_cards: int) -> float:
-        remaining_decks = remaining_cards / 52.0
-        if remaining_decks == 0:
-            return self.running_count
-        return self.running_count / remaining_decks
-
-    def reset(self):
-        self.running_count = 0
-        self.cards_dealt = 0
-
 
 def get_true_count(running_count, decks_remaining):
     return round(running_count / decks_remaining, 2) if decks_remaining > 0 else running_count
 
 
 def plot_accuracy(attempts, window_size=10):
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 6))
     correct_counts = [1 if result else 0 for result in attempts]
     running_accuracy = []
@@ -99,7 +48,7 @@ def plot_accuracy(attempts, window_size=10):
 
 # GUI code with Tkinter
 class CardCountingGUI:
-    def __init__(self, root):
+    def __init__(self, root, cards_per_second=2.0, fps=60, seats=7, cards_per_hand=2):
         self.root = root
         self.root.title("Blackjack Card Counting")
         self.root.geometry("800x600")
@@ -107,10 +56,14 @@ class CardCountingGUI:
         # Initialize deck and card counter
         self.deck = Deck(num_decks=1)
         self.counter = CardCounter(num_decks=1)
+        # PIL loads with the card faces, not when the module is imported
+        from card_images import CardImageCache
+        self.card_images = CardImageCache()
         self.running_count = 0
         self.attempts = []
 
-        # Create canvas to display cards
+        # Create canvas to display cards; table mode enlarges it, the single-card modes restore it
+        self.card_canvas_size = (400, 300)
         self.canvas = tk.Canvas(self.root, width=400, height=300, bg="lightgray")
         self.canvas.pack()
 
@@ -128,55 +81,131 @@ class CardCountingGUI:
         self.automated_button = tk.Button(self.root, text="Start Automated Mode", width=20, command=self.start_automated_mode)
         self.automated_button.pack()
 
+        self.table_button = tk.Button(self.root, text="Start Table Mode", width=20, command=self.start_table_mode)
+        self.table_button.pack()
+
         # Initialize the card image as a canvas item
         self.card_image_item = None
+        # Single-mode cards still sliding in; cancelling their animation skips _card_landed
+        self._cards_in_flight = set()
+
+        # Cards slide in on a frame-based scheduler instead of a blocking update() loop
+        self.animations = AnimationScheduler(self.root, self.canvas, fps=fps)
+        self.cards_per_second = cards_per_second
+        self._deal_job = None
+
+        # Canvas items come from a pool and label changes are applied once per frame
+        self.pool = CanvasItemPool(self.canvas)
+        self.batcher = FrameBatcher(self.root, fps=fps)
+        self.table = TableView(self.canvas, self.card_images, self.animations,
+                               TableLayout(780, 420, seats=seats), pool=self.pool)
+        self.seats = seats
+        self.cards_per_hand = cards_per_hand
+        self._table_queue = []
+
+    @property
+    def deal_interval_ms(self):
+        return max(1, int(1000 / self.cards_per_second))
+
+    def stop_dealing(self):
+        """Cancels the next scheduled deal and any cards still in flight."""
+        if self._deal_job is not None:
+            self.root.after_cancel(self._deal_job)
+            self._deal_job = None
+        self.animations.cancel_all()
+        for item in self._cards_in_flight:
+            self.pool.release(item)
+        self._cards_in_flight.clear()
+        self.batcher.cancel()
+
+    def _use_card_canvas(self):
+        width, height = self.card_canvas_size
+        self.canvas.config(width=width, height=height)
 
     def start_tutorial_mode(self):
+        self.stop_dealing()
+        self.table.clear()
+        self._use_card_canvas()
         self.counter.reset()
         self.deck.shuffle()
         self.attempts = []
         self.display_card()
 
     def start_automated_mode(self):
+        self.stop_dealing()
+        self.table.clear()
+        self._use_card_canvas()
         self.counter.reset()
         self.deck.shuffle()
         self.display_card()
 
-    def display_card(self):
+    def start_table_mode(self):
+        """Deals rounds to every seat and the dealer on a full-size table canvas."""
+        self.stop_dealing()
+        self.table.clear()
+        self._release_single_card()
+        self.canvas.config(width=self.table.layout.width, height=self.table.layout.height)
+        self.counter.reset()
+        self.deck.shuffle()
+        self._table_queue = []
+        self.deal_table_card()
+
+    def deal_table_card(self):
+        self._deal_job = None
+        if not self._table_queue:
+            # New round: clear the table and deal cards_per_hand passes around it
+            self.table.clear()
+            seats = list(range(self.seats)) + [DEALER]
+            self._table_queue = [seat for _ in range(self.cards_per_hand) for seat in seats]
         if len(self.deck.cards) == 0:
             messagebox.showinfo("Game Over", "The deck is empty.")
             return
 
         card = self.deck.deal_card()
         self.counter.update_count(card)
-        remaining_cards = len(self.deck.cards)
-        true_count = self.counter.true_count(remaining_cards)
+        self.table.deal_to(self._table_queue.pop(0), card, duration=min(0.25, 0.8 / self.cards_per_second))
+        self._update_count_labels()
+        self._deal_job = self.root.after(self.deal_interval_ms, self.deal_table_card)
+
+    def _update_count_labels(self):
+        true_count = self.counter.true_count(len(self.deck.cards))
+        self.batcher.config(self.running_count_label, text=f"Running Count: {self.counter.running_count}")
+        self.batcher.config(self.true_count_label, text=f"True Count: {true_count:.2f}")
+
+    def _release_single_card(self):
+        if self.card_image_item is not None:
+            self.pool.release(self.card_image_item)
+            self.card_image_item = None
+
+    def display_card(self):
+        self._deal_job = None
+        if len(self.deck.cards) == 0:
+            messagebox.showinfo("Game Over", "The deck is empty.")
+            return
 
-        # Display card image (assuming the images are in a folder named 'cards' and are named by rank_suit.png)
-        card_image = Image.open(f"cards/{card.rank}_{card.suit}.png")
-        card_image = card_image.resize((100, 150))
-        card_photo = ImageTk.PhotoImage(card_image)
+        card = self.deck.deal_card()
+        self.counter.update_count(card)
 
-        # If there's no existing card, create it on the canvas
-        if self.card_image_item is None:
-            self.card_image_item = self.canvas.create_image(50, 100, image=card_photo)
-        else:
-            # Update the image source of the existing card
-            self.canvas.itemconfig(self.card_image_item, image=card_photo)
+        # Card faces are preloaded into the sprite atlas, so this is a cache lookup
+        card_photo = self.card_images.photo(card.rank, card.suit)
 
-        # Store the reference to the image to avoid it being garbage collected
-        self.canvas.image = card_photo
+        # Every dealt card gets its own pooled item so several can be in flight at once
+        item = self.pool.acquire(card_photo, 50, 100)
+        self._cards_in_flight.add(item)
+        self.animations.move(item, (50, 100), (240, 100),
+                             duration=min(0.3, 0.8 / self.cards_per_second),
+                             on_done=lambda: self._card_landed(item))
 
         # Update running count and true count labels
-        self.running_count_label.config(text=f"Running Count: {self.counter.running_count}")
-        self.true_count_label.config(text=f"True Count: {true_count:.2f}")
+        self._update_count_labels()
 
-        # Animate card drawing by moving it on the canvas
-        for i in range(0, 200, 10):
-            self.canvas.coords(self.card_image_item, 50 + i, 100)
-            self.root.update()
+        self._deal_job = self.root.after(self.deal_interval_ms, self.display_card)
 
-        self.root.after(500, self.display_card)
+    def _card_landed(self, item):
+        """Replaces the previously shown card once the new one has arrived."""
+        self._cards_in_flight.discard(item)
+        self._release_single_card()
+        self.card_image_item = item
 
 def main():
     root = tk.Tk()
@@ -0,0 +1,81 @@
+#This file contains the tests for the v3 card counting GUI.
+import os
+import subprocess
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+from v3_GUIConsolidated import CardCountingGUI
+
+
+class CardCountingGUITests(unittest.TestCase):
+
+    def setUp(self):
+        self.root = MagicMock()  # Mocking the Tk root window
+        with patch('card_images.ImageTk.PhotoImage'):
+            self.app = CardCountingGUI(self.root, cards_per_second=4)
+            self.app.card_images.photo = MagicMock()
+
+    def test_deal_is_scheduled_not_blocking(self):
+        self.app.display_card()
+        self.root.update.assert_not_called()
+        delays = [call.args[0] for call in self.root.after.call_args_list]
+        self.assertIn(250, delays)
+        self.assertEqual(self.app.counter.cards_dealt, 1)
+        self.assertEqual(self.app.animations.active, 1)
+
+    def test_restart_cancels_pending_deal(self):
+        self.app.display_card()
+        self.app.start_automated_mode()
+        self.root.after_cancel.assert_called()
+        self.assertEqual(self.app.counter.cards_dealt, 1)
+
+    def test_restart_mid_deal_releases_cards_in_flight(self):
+        self.app.display_card()
+        self.app.stop_dealing()
+        self.assertEqual(self.app.pool.in_use, set())
+        self.app.display_card()
+        self.app.start_table_mode()
+        # Only the card just dealt to the table is on the canvas
+        self.assertEqual(len(self.app.pool.in_use), 1)
+        self.assertEqual(self.app.table.cards_on_table, 1)
+
+    def test_table_mode_deals_rounds(self):
+        self.app.start_table_mode()
+        for _ in range(15):
+            self.app.deal_table_card()
+        self.assertEqual(self.app.table.cards_on_table, 16)
+        self.assertEqual(len(self.app.table.hands), 8)
+        self.app.deal_table_card()
+        self.assertEqual(self.app.table.cards_on_table, 1)
+        self.assertEqual(self.app.counter.cards_dealt, 17)
+
+    def test_single_card_modes_restore_canvas_size(self):
+        self.app.canvas.config = MagicMock()
+        self.app.start_table_mode()
+        self.app.canvas.config.assert_called_with(width=780, height=420)
+        for start in (self.app.start_automated_mode, self.app.start_tutorial_mode):
+            self.app.start_table_mode()
+            start()
+            self.app.canvas.config.assert_called_with(width=400, height=300)
+
+    @patch('v3_GUIConsolidated.messagebox.showinfo')
+    def test_empty_deck_stops(self, mock_messagebox):
+        while len(self.app.deck.cards):
+            self.app.deck.deal_card()
+        self.app.display_card()
+        mock_messagebox.assert_called_with("Game Over", "The deck is empty.")
+        self.assertIsNone(self.app._deal_job)
+
+
+    def test_import_does_not_load_matplotlib_or_pil(self):
+        code = "import sys, v3_GUIConsolidated; print(*[m for m in ('matplotlib', 'PIL') if m in sys.modules])"
+        here = os.path.dirname(os.path.abspath(__file__))
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([os.path.dirname(here), os.environ.get('PYTHONPATH', '')]))
+        result = subprocess.run([sys.executable, '-c', code], cwd=here, env=env,
+                                capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
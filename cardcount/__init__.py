@@ -0,0 +1,16 @@
+"""
+Blackjack card counting: one shared core for the tutorials, the GUI and the simulators.
+
+The core (cards, compact shoes, counters) and the counting systems are imported here.
+The NumPy simulators live in their own modules (batch_simulation, monte_carlo, bankroll,
+blackjack, shuffle_models, ...) and are only loaded when imported, so plain counting
+scripts start fast.
+"""
+from .core import (RANK_CODES, Card, CardCounter, CardSource, CompactDeck, Deck, ShoeComposition, card_code,
+                   card_from_code, decks_remaining, true_count_for)
+from .counting_systems import COUNTING_SYSTEMS, CountingSystem, get_system, register_system
+
+__all__ = [
+    'RANK_CODES', 'Card', 'CardCounter', 'CardSource', 'CompactDeck', 'Deck', 'ShoeComposition', 'card_code',
+    'card_from_code', 'decks_remaining', 'true_count_for', 'COUNTING_SYSTEMS', 'CountingSystem', 'get_system', 'register_system',
+]
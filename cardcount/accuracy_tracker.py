@@ -0,0 +1,47 @@
+from collections import deque
+
+
+class AccuracyTracker:
+    """
+    Counting accuracy over a tutorial session, updated in O(1) per answer: a running
+    sum over the last window_size answers and a running total over all of them.
+    history keeps the recent accuracy after every answer for plotting.
+    """
+
+    def __init__(self, window_size=10):
+        self.window_size = window_size
+        self._window = deque(maxlen=window_size)
+        self._window_sum = 0
+        self.correct = 0
+        self.attempts = 0
+        self.history = []
+
+    @classmethod
+    def from_attempts(cls, attempts, window_size=10):
+        tracker = cls(window_size)
+        for result in attempts:
+            tracker.record(result)
+        return tracker
+
+    def __len__(self):
+        return self.attempts
+
+    def record(self, correct):
+        correct = 1 if correct else 0
+        if len(self._window) == self.window_size:
+            self._window_sum -= self._window[0]
+        self._window.append(correct)
+        self._window_sum += correct
+        self.correct += correct
+        self.attempts += 1
+        self.history.append(self.recent_accuracy)
+
+    @property
+    def recent_accuracy(self):
+        """Percentage correct over the last window_size answers."""
+        return self._window_sum / len(self._window) * 100 if self._window else 0.0
+
+    @property
+    def overall_accuracy(self):
+        """Percentage correct over every answer so far."""
+        return self.correct / self.attempts * 100 if self.attempts else 0.0
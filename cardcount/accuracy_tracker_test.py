@@ -0,0 +1,35 @@
+#This file contains the tests for the incremental accuracy tracker.
+import unittest
+from collections import deque
+
+from cardcount.accuracy_tracker import AccuracyTracker
+
+
+class AccuracyTrackerTests(unittest.TestCase):
+
+    def test_matches_rescanning_the_window(self):
+        attempts = [True, False, True, True, False, False, True, True, True, False, True, False, True] * 3
+        tracker = AccuracyTracker(window_size=4)
+        window = deque(maxlen=4)
+        for result in attempts:
+            tracker.record(result)
+            window.append(result)
+            self.assertAlmostEqual(tracker.recent_accuracy, sum(window) / len(window) * 100)
+        self.assertEqual(len(tracker), len(attempts))
+        self.assertEqual(len(tracker.history), len(attempts))
+        self.assertAlmostEqual(tracker.overall_accuracy, sum(attempts) / len(attempts) * 100)
+
+    def test_empty_tracker(self):
+        tracker = AccuracyTracker()
+        self.assertFalse(tracker)
+        self.assertEqual(tracker.recent_accuracy, 0.0)
+        self.assertEqual(tracker.overall_accuracy, 0.0)
+
+    def test_from_attempts(self):
+        tracker = AccuracyTracker.from_attempts([True, True, False], window_size=2)
+        self.assertEqual(tracker.history, [100.0, 100.0, 50.0])
+        self.assertAlmostEqual(tracker.overall_accuracy, 200 / 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
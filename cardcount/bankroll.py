@@ -0,0 +1,172 @@
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+
+class BetRamp:
+    """
+    Bet spread compiled into a table of units per true-count bucket
+    (the true count rounded down, clamped to [min_count, max_count]).
+
+    steps maps the lowest true count of each step to its bet, e.g.
+    {1: 2, 2: 4, 3: 8} bets 1 unit below +1, 2 units at +1, and so on.
+    """
+
+    def __init__(self, steps, min_bet=1.0, min_count=-10, max_count=20):
+        self.min_count = min_count
+        self.max_count = max_count
+        buckets = np.arange(min_count, max_count + 1)
+        self.table = np.full(buckets.size, float(min_bet))
+        for count, units in sorted(steps.items()):
+            self.table[buckets >= count] = units
+
+    def bucket_index(self, true_counts):
+        buckets = np.floor(np.asarray(true_counts, dtype=float)).astype(np.int64)
+        return np.clip(buckets, self.min_count, self.max_count) - self.min_count
+
+    def bets(self, true_counts):
+        """Units bet for each true count in the array."""
+        return self.table[self.bucket_index(true_counts)]
+
+    @property
+    def spread(self):
+        return self.table.max() / self.table.min()
+
+
+@dataclass
+class CountModel:
+    """Per true-count bucket: how often it occurs and the per-unit EV and SD of a round played at it."""
+    buckets: np.ndarray
+    probabilities: np.ndarray
+    ev: np.ndarray
+    sd: np.ndarray
+
+    @classmethod
+    def from_ev_table(cls, results, default_sd=1.15):
+        """Builds the model from a blackjack.EVByTrueCount filled by BlackjackTable.simulate."""
+        rounds = np.asarray(results.rounds, dtype=float)
+        seen = rounds > 0
+        units = np.asarray(results.units)[seen]
+        squares = np.asarray(results.squares)[seen]
+        ev = units / rounds[seen]
+        variance = squares / rounds[seen] - ev ** 2
+        sd = np.where(rounds[seen] > 1, np.sqrt(np.maximum(variance, 0.0)), default_sd)
+        buckets = np.arange(results.min_count, results.max_count + 1)[seen]
+        return cls(buckets, rounds[seen] / rounds.sum(), ev, sd)
+
+
+@dataclass
+class BankrollReport:
+    """Outcome of a bankroll simulation. paths is None unless the trajectories were kept."""
+    initial_bankroll: float
+    final: np.ndarray
+    ruined: np.ndarray
+    ev_per_round: float
+    sd_per_round: float
+    paths: np.ndarray = None
+
+    @property
+    def risk_of_ruin(self):
+        """Fraction of sessions whose bankroll reached zero."""
+        return float(self.ruined.mean())
+
+    @property
+    def n0(self):
+        """Rounds needed for the expected win to equal one standard deviation."""
+        if self.ev_per_round <= 0:
+            return math.inf
+        return (self.sd_per_round / self.ev_per_round) ** 2
+
+    @property
+    def score(self):
+        """Expected win per 100 rounds with a 10,000 unit bankroll bet at full Kelly."""
+        return 1e6 / self.n0
+
+    @property
+    def analytic_risk_of_ruin(self):
+        return analytic_risk_of_ruin(self.ev_per_round, self.sd_per_round, self.initial_bankroll)
+
+
+def analytic_risk_of_ruin(ev, sd, bankroll):
+    """Long-run risk of ruin of a bankroll for a game with the given per-round EV and SD."""
+    if ev <= 0:
+        return 1.0
+    return math.exp(-2 * ev * bankroll / sd ** 2)
+
+
+def _track_bankrolls(results, initial_bankroll, final, ruined, paths=None):
+    """
+    Turns a chunk of per-round results into bankrolls in place (results becomes the
+    running bankroll) and fills the chunk's slices of final, ruined and paths.
+    """
+    bankroll = np.cumsum(results, axis=1, out=results)
+    bankroll += initial_bankroll
+    final[:] = bankroll[:, -1]
+    ruined[:] = bankroll.min(axis=1) <= 0
+    if paths is not None:
+        paths[:, 0] = initial_bankroll
+        paths[:, 1:] = bankroll
+
+
+def _report(initial_bankroll, final, ruined, paths, total, total_squares, rounds):
+    ev = total / rounds
+    sd = math.sqrt(max(total_squares / rounds - ev ** 2, 0.0))
+    return BankrollReport(initial_bankroll, final, ruined, ev, sd, paths)
+
+
+def simulate_bankroll(true_counts, outcomes, ramp, initial_bankroll, keep_paths=False, chunk_size=1000,
+                      dtype=np.float32):
+    """
+    Applies the bet ramp to recorded rounds and tracks one bankroll per session.
+
+    true_counts and outcomes are (sessions, rounds) arrays: the true count at the
+    start of each round and the result of that round per unit bet. Sessions are
+    processed chunk_size at a time, as in simulate_sessions, so only one chunk of
+    bankrolls is held besides the optional preallocated paths.
+    """
+    num_sessions, num_rounds = np.shape(outcomes)
+    paths = np.empty((num_sessions, num_rounds + 1), dtype=dtype) if keep_paths else None
+    final = np.empty(num_sessions)
+    ruined = np.empty(num_sessions, dtype=bool)
+    total = total_squares = 0.0
+
+    for start in range(0, num_sessions, chunk_size):
+        stop = min(start + chunk_size, num_sessions)
+        results = ramp.bets(true_counts[start:stop]) * np.asarray(outcomes[start:stop], dtype=float)
+        total += results.sum()
+        total_squares += np.square(results).sum()
+        _track_bankrolls(results, initial_bankroll, final[start:stop], ruined[start:stop],
+                         paths[start:stop] if keep_paths else None)
+
+    return _report(initial_bankroll, final, ruined, paths, total, total_squares, num_sessions * num_rounds)
+
+
+def simulate_sessions(num_sessions, num_rounds, ramp, model, initial_bankroll,
+                      rng=None, keep_paths=False, chunk_size=1000, dtype=np.float32):
+    """
+    Simulates num_sessions sessions of num_rounds rounds from a CountModel.
+
+    Every round draws a true-count bucket with the model's frequencies and a normally
+    distributed result with that bucket's EV and SD. Sessions are generated chunk_size
+    at a time; with keep_paths the bankroll trajectories are written into one
+    preallocated (sessions, rounds + 1) array of dtype.
+    """
+    rng = np.random.default_rng(rng)
+    bets = ramp.bets(model.buckets)
+    paths = np.empty((num_sessions, num_rounds + 1), dtype=dtype) if keep_paths else None
+    final = np.empty(num_sessions)
+    ruined = np.empty(num_sessions, dtype=bool)
+    total = total_squares = 0.0
+
+    for start in range(0, num_sessions, chunk_size):
+        stop = min(start + chunk_size, num_sessions)
+        picks = rng.choice(model.buckets.size, size=(stop - start, num_rounds), p=model.probabilities)
+        results = bets[picks] * rng.normal(model.ev[picks], model.sd[picks])
+        total += results.sum()
+        total_squares += np.square(results).sum()
+        _track_bankrolls(results, initial_bankroll, final[start:stop], ruined[start:stop],
+                         paths[start:stop] if keep_paths else None)
+
+    return _report(initial_bankroll, final, ruined, paths, total, total_squares, num_sessions * num_rounds)
+
@@ -0,0 +1,79 @@
+#This file contains the tests for the bet-spread and bankroll simulator.
+import math
+import unittest
+
+import numpy as np
+
+from cardcount.bankroll import BankrollReport, BetRamp, CountModel, analytic_risk_of_ruin, simulate_bankroll, simulate_sessions
+from cardcount.blackjack import EVByTrueCount
+
+
+class BetRampTests(unittest.TestCase):
+
+    def test_ramp_steps(self):
+        ramp = BetRamp({1: 2, 2: 4, 4: 8})
+        self.assertEqual(ramp.bets([-3.0, 0.9, 1.0, 2.5, 3.99, 4.0, 50.0]).tolist(), [1, 1, 2, 4, 4, 8, 8])
+        self.assertEqual(ramp.spread, 8)
+
+
+class BankrollTests(unittest.TestCase):
+
+    def test_recorded_rounds(self):
+        ramp = BetRamp({2: 5})
+        true_counts = np.array([[0.0, 2.0, 3.0], [2.5, -1.0, 0.0]])
+        outcomes = np.array([[-1.0, 1.0, 1.0], [-1.0, -1.0, -1.0]])
+        report = simulate_bankroll(true_counts, outcomes, ramp, initial_bankroll=7, keep_paths=True)
+        self.assertEqual(report.paths.tolist(), [[7, 6, 11, 16], [7, 2, 1, 0]])
+        self.assertEqual(report.ruined.tolist(), [False, True])
+        self.assertEqual(report.risk_of_ruin, 0.5)
+
+    def test_recorded_rounds_in_chunks(self):
+        rng = np.random.default_rng(2)
+        true_counts = rng.normal(0, 2, size=(25, 60))
+        outcomes = rng.choice([-1.0, 0.0, 1.0, 1.5], size=(25, 60))
+        ramp = BetRamp({1: 2, 3: 6})
+        whole = simulate_bankroll(true_counts, outcomes, ramp, 50, keep_paths=True, chunk_size=100)
+        chunked = simulate_bankroll(true_counts, outcomes, ramp, 50, keep_paths=True, chunk_size=7)
+        results = ramp.bets(true_counts) * outcomes
+        np.testing.assert_allclose(chunked.final, 50 + results.sum(axis=1))
+        np.testing.assert_allclose(chunked.paths, whole.paths)
+        self.assertTrue(np.array_equal(chunked.ruined, whole.ruined))
+        self.assertAlmostEqual(chunked.ev_per_round, results.mean())
+        self.assertAlmostEqual(chunked.sd_per_round, results.std())
+
+    def test_sessions_fill_preallocated_paths(self):
+        model = CountModel(np.array([0, 3]), np.array([0.8, 0.2]), np.array([-0.01, 0.02]), np.array([1.1, 1.2]))
+        report = simulate_sessions(250, 400, BetRamp({3: 10}), model, 1000, rng=3, keep_paths=True, chunk_size=100)
+        self.assertEqual(report.paths.shape, (250, 401))
+        self.assertEqual(report.paths.dtype, np.float32)
+        self.assertTrue(np.all(report.paths[:, 0] == 1000))
+        np.testing.assert_allclose(report.paths[:, -1], report.final, rtol=1e-5)
+        # expected EV per round: 0.8 * -0.01 + 0.2 * 10 * 0.02 = 0.032
+        self.assertAlmostEqual(report.ev_per_round, 0.032, delta=0.02)
+
+    def test_sessions_reproducible(self):
+        model = CountModel(np.array([0]), np.array([1.0]), np.array([0.0]), np.array([1.0]))
+        first = simulate_sessions(10, 50, BetRamp({}), model, 100, rng=9)
+        second = simulate_sessions(10, 50, BetRamp({}), model, 100, rng=9)
+        self.assertTrue(np.array_equal(first.final, second.final))
+        self.assertIsNone(first.paths)
+
+    def test_model_from_ev_table(self):
+        results = EVByTrueCount(min_count=-1, max_count=1)
+        for true_count, result in [(0.0, 1.0), (0.5, -1.0), (1.0, 1.0), (1.2, 1.0), (1.5, 2.0), (1.7, 0.0)]:
+            results.add(true_count, result)
+        model = CountModel.from_ev_table(results)
+        self.assertEqual(model.buckets.tolist(), [0, 1])
+        np.testing.assert_allclose(model.probabilities, [2 / 6, 4 / 6])
+        np.testing.assert_allclose(model.ev, [0.0, 1.0])
+
+    def test_n0_score_and_ror(self):
+        report = BankrollReport(100, np.zeros(1), np.zeros(1, dtype=bool), ev_per_round=0.01, sd_per_round=1.0)
+        self.assertAlmostEqual(report.n0, 10000)
+        self.assertAlmostEqual(report.score, 100)
+        self.assertAlmostEqual(report.analytic_risk_of_ruin, math.exp(-2))
+        self.assertEqual(analytic_risk_of_ruin(-0.01, 1.0, 100), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import numpy as np
+
+from .core import Deck
+from .counting_systems import get_system
+
+
+def rank_code(rank):
+    """Returns the integer rank code (0 for '2' ... 12 for 'Ace') of a rank name."""
+    return Deck.ranks.index(rank)
+
+
+def cards_per_shoe(num_decks=1, reshuffle_threshold=0.25):
+    """
+    Number of cards dealt from a shoe before Deck.reshuffle_if_needed() triggers,
+    i.e. the first count of dealt cards that leaves fewer than
+    reshuffle_threshold * shoe size cards in the shoe.
+    """
+    shoe_size = 52 * num_decks
+    dealt = int(shoe_size - reshuffle_threshold * shoe_size) + 1
+    return min(dealt, shoe_size)
+
+
+def shuffled_shoes(num_shoes, num_decks=1, rng=None, shuffle=None):
+    """
+    Returns a (num_shoes, 52 * num_decks) array of rank codes, one independently
+    shuffled shoe per row, in the order the cards are dealt.
+
+    shuffle is an optional shuffle_models procedure applied to shoes starting in
+    new-deck order; by default every shoe is a uniform random permutation.
+    """
+    rng = np.random.default_rng(rng)
+    # New-deck order: each suit runs 2 through Ace, as in CompactDeck before shuffling
+    shoe = np.tile(np.arange(13, dtype=np.int8), 4 * num_decks)
+    shoes = np.broadcast_to(shoe, (num_shoes, shoe.size))
+    if shuffle is not None:
+        return shuffle(shoes, rng)
+    return rng.permuted(shoes, axis=1)
+
+
+def count_shoes(shoes, num_decks=1, reshuffle_threshold=0.25, system='hilo'):
+    """
+    Computes the per-card running and true counts for every shoe at once.
+
+    shoes is a 2-D array of rank codes (one shoe per row, in deal order). Only the
+    cards dealt before the reshuffle point are counted, matching simulate_deal.
+    system is a counting_systems registry key or CountingSystem.
+    Returns (running_counts, true_counts), both shaped (num_shoes, cards_dealt).
+    """
+    shoes = np.asarray(shoes)
+    shoe_size = 52 * num_decks
+    dealt = cards_per_shoe(num_decks, reshuffle_threshold)
+    tags = np.asarray(get_system(system).tags)
+
+    running = np.cumsum(tags[shoes[:, :dealt]], axis=1, dtype=np.result_type(tags.dtype, np.int32))
+    remaining_decks = (shoe_size - np.arange(1, dealt + 1)) / 52.0
+    # CardCounter.true_count returns the running count when the shoe is empty
+    divisor = np.where(remaining_decks == 0, 1.0, remaining_decks)
+    true = running / divisor
+    return running, true
+
+
+def simulate_shoes(num_shoes, num_decks=1, reshuffle_threshold=0.25, rng=None, system='hilo', shuffle=None):
+    """
+    Shuffles num_shoes shoes and returns (shoes, running_counts, true_counts).
+    Vectorized equivalent of running simulate_deal once per shoe.
+    """
+    shoes = shuffled_shoes(num_shoes, num_decks, rng, shuffle)
+    running, true = count_shoes(shoes, num_decks, reshuffle_threshold, system)
+    return shoes, running, true
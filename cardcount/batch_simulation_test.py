@@ -0,0 +1,81 @@
+#This file contains the tests for the vectorized shoe simulation.
+import unittest
+from array import array
+
+import numpy as np
+
+from cardcount.batch_simulation import cards_per_shoe, count_shoes, rank_code, shuffled_shoes, simulate_shoes
+from cardcount.core import CardCounter, Deck
+
+
+def scalar_count_series(shoe, num_decks=1, system='hilo'):
+    '''
+    Replays one shoe of rank codes through Deck and CardCounter the same way
+    simulate_deal does and returns the logged running and true counts.
+    '''
+    deck = Deck(num_decks=num_decks, reshuffle_threshold=0.25)
+    deck.codes = array('B', [code * 4 for code in shoe])
+    counter = CardCounter(num_decks=num_decks, system=system)
+    running_counts, true_counts = [], []
+    while True:
+        card = deck.deal_card()
+        counter.update_count(card)
+        running_counts.append(counter.running_count)
+        true_counts.append(counter.true_count(deck.remaining_cards))
+        if deck.reshuffle_if_needed():
+            break
+    return running_counts, true_counts
+
+
+class BatchSimulationTests(unittest.TestCase):
+
+    def test_shoes_are_permutations(self):
+        shoes = shuffled_shoes(20, num_decks=2, rng=1)
+        self.assertEqual(shoes.shape, (20, 104))
+        for shoe in shoes:
+            self.assertTrue(np.array_equal(np.bincount(shoe, minlength=13), [8] * 13))
+
+    def test_shuffle_procedures_start_in_new_deck_order(self):
+        shoes = shuffled_shoes(2, num_decks=2, shuffle=lambda shoes, rng: shoes)
+        new_deck = [code >> 2 for code in Deck(num_decks=2)._create_codes()]
+        self.assertEqual(shoes[0].tolist(), new_deck)
+        self.assertEqual(shoes[1].tolist()[:14], list(range(13)) + [0])
+
+    def test_cards_per_shoe_matches_reshuffle_threshold(self):
+        self.assertEqual(cards_per_shoe(1, 0.25), 40)
+        self.assertEqual(cards_per_shoe(8, 0.25), 313)
+        self.assertEqual(cards_per_shoe(1, 0.0), 52)
+
+    def test_matches_scalar_counter(self):
+        '''
+        The batch engine must reproduce the per-card series of the scalar path.
+        '''
+        for num_decks in (1, 6):
+            shoes, running, true = simulate_shoes(5, num_decks=num_decks, rng=7)
+            for shoe, batch_running, batch_true in zip(shoes, running, true):
+                scalar_running, scalar_true = scalar_count_series(shoe, num_decks)
+                self.assertEqual(batch_running.tolist(), scalar_running)
+                np.testing.assert_allclose(batch_true, scalar_true)
+
+    def test_other_systems_match_scalar_counter(self):
+        shoes = shuffled_shoes(3, num_decks=2, rng=3)
+        for system in ('ko', 'omega2', 'halves'):
+            running, true = count_shoes(shoes, num_decks=2, system=system)
+            for shoe, batch_running, batch_true in zip(shoes, running, true):
+                scalar_running, scalar_true = scalar_count_series(shoe, 2, system)
+                np.testing.assert_allclose(batch_running, scalar_running)
+                np.testing.assert_allclose(batch_true, scalar_true)
+
+    def test_full_shoe_ends_at_zero(self):
+        shoes = shuffled_shoes(3, rng=0)
+        running, true = count_shoes(shoes, reshuffle_threshold=0.0)
+        self.assertTrue(np.all(running[:, -1] == 0))
+        self.assertTrue(np.all(true[:, -1] == running[:, -1]))
+
+    def test_rank_code(self):
+        self.assertEqual(rank_code('2'), 0)
+        self.assertEqual(rank_code('Ace'), 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
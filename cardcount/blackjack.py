@@ -0,0 +1,430 @@
+import math
+from dataclasses import dataclass
+
+from .core import CardCounter, Deck
+
+
+# Player actions
+HIT, STAND, DOUBLE, SPLIT, SURRENDER = range(5)
+ACTION_NAMES = ('Hit', 'Stand', 'Double', 'Split', 'Surrender')
+
+# Blackjack value of each rank code (aces count 1 here, soft totals add 10)
+RANK_VALUES = (2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 1)
+
+# Column of the strategy tables for each dealer upcard rank code: 2-9, ten, ace
+UPCARD_COLUMNS = (0, 1, 2, 3, 4, 5, 6, 7, 8, 8, 8, 8, 9)
+
+
+@dataclass(frozen=True)
+class Rules:
+    """Table rules for a blackjack game."""
+    num_decks: int = 6
+    dealer_hits_soft_17: bool = False
+    double_after_split: bool = True
+    surrender: bool = False
+    max_hands: int = 4
+    resplit_aces: bool = False
+    hit_split_aces: bool = False
+    blackjack_payout: float = 1.5
+    penetration: float = 0.75
+    cut_card_variation: float = 0.0
+    burn_cards: int = 1
+
+
+# Basic strategy charts for multi-deck S17, one character per dealer upcard 2..A.
+#   H hit, S stand, D double else hit, d double else stand,
+#   R surrender else hit, r surrender else stand
+HARD_CHART = {
+    **{total: 'HHHHHHHHHH' for total in range(4, 9)},
+    9: 'HDDDDHHHHH',
+    10: 'DDDDDDDDHH',
+    11: 'DDDDDDDDDH',
+    12: 'HHSSSHHHHH',
+    13: 'SSSSSHHHHH',
+    14: 'SSSSSHHHHH',
+    15: 'SSSSSHHHRH',
+    16: 'SSSSSHHRRR',
+    **{total: 'SSSSSSSSSS' for total in range(17, 22)},
+}
+SOFT_CHART = {
+    12: 'HHHHHHHHHH',
+    13: 'HHHDDHHHHH',
+    14: 'HHHDDHHHHH',
+    15: 'HHDDDHHHHH',
+    16: 'HHDDDHHHHH',
+    17: 'HDDDDHHHHH',
+    18: 'SddddSSHHH',
+    19: 'SSSSSSSSSS',
+    20: 'SSSSSSSSSS',
+    21: 'SSSSSSSSSS',
+}
+# Keyed by the value of the paired card (1 for aces).
+#   P split, p split only if doubling after split is allowed, anything else means don't split
+PAIR_CHART = {
+    1: 'PPPPPPPPPP',
+    2: 'ppPPPPHHHH',
+    3: 'ppPPPPHHHH',
+    4: 'HHHppHHHHH',
+    5: 'HHHHHHHHHH',
+    6: 'pPPPPHHHHH',
+    7: 'PPPPPPHHHH',
+    8: 'PPPPPPPPPP',
+    9: 'PPPPPSPPSS',
+    10: 'SSSSSSSSSS',
+}
+# Changes to the charts when the dealer hits soft 17: (chart, total, upcard column) -> action
+H17_CHANGES = {
+    ('hard', 11, 9): 'D',
+    ('hard', 15, 9): 'R',
+    ('hard', 17, 9): 'r',
+    ('soft', 18, 0): 'd',
+    ('soft', 19, 4): 'd',
+}
+
+# chart character -> (action, fallback when the action is not allowed)
+_CHART_ACTIONS = {
+    'H': (HIT, HIT),
+    'S': (STAND, STAND),
+    'D': (DOUBLE, HIT),
+    'd': (DOUBLE, STAND),
+    'R': (SURRENDER, HIT),
+    'r': (SURRENDER, STAND),
+}
+
+
+def hand_total(ranks):
+    """Returns (total, soft) for a list of rank codes."""
+    total = 0
+    has_ace = False
+    for rank in ranks:
+        value = RANK_VALUES[rank]
+        total += value
+        if value == 1:
+            has_ace = True
+    if has_ace and total <= 11:
+        return total + 10, True
+    return total, False
+
+
+class BasicStrategy:
+    """
+    Basic strategy compiled into lookup tables for a set of rules.
+
+    hard[total][column] and soft[total][column] hold (action, fallback) pairs,
+    split[pair value][column] holds whether the pair should be split.
+    h17_changes patches the S17 charts for H17 games; pass {} with charts that
+    were made for the rules already (e.g. strategy_generator output).
+    """
+    # Whether decide() and should_split() depend on the true count
+    count_dependent = False
+
+    def __init__(self, rules=Rules(), hard_chart=HARD_CHART, soft_chart=SOFT_CHART, pair_chart=PAIR_CHART,
+                 h17_changes=H17_CHANGES):
+        hard_chart = dict(hard_chart)
+        soft_chart = dict(soft_chart)
+        if rules.dealer_hits_soft_17:
+            charts = {'hard': hard_chart, 'soft': soft_chart}
+            for (name, total, column), action in h17_changes.items():
+                row = charts[name][total]
+                charts[name][total] = row[:column] + action + row[column + 1:]
+
+        self.rules = rules
+        self.charts = {'hard': hard_chart, 'soft': soft_chart, 'pair': pair_chart}
+        self.hard = self._compile(hard_chart)
+        self.soft = self._compile(soft_chart)
+        split_codes = 'Pp' if rules.double_after_split else 'P'
+        self.split = tuple(
+            tuple(action in split_codes for action in pair_chart.get(value, 'H' * 10))
+            for value in range(11)
+        )
+
+    @staticmethod
+    def _compile(chart):
+        default = 'H' * 10
+        return tuple(
+            tuple(_CHART_ACTIONS[action] for action in chart.get(total, default))
+            for total in range(22)
+        )
+
+    def decide(self, total, soft, column, can_double, can_surrender, true_count=0.0):
+        """
+        Returns the action for a hand total against the dealer upcard column.
+        Basic strategy ignores true_count; see DeviationStrategy.
+        """
+        action, fallback = (self.soft if soft else self.hard)[total][column]
+        if (action == DOUBLE and not can_double) or (action == SURRENDER and not can_surrender):
+            return fallback
+        return action
+
+    def should_split(self, value, column, true_count=0.0):
+        """Whether to split a pair of cards worth value (1 for aces) against the upcard column."""
+        return self.split[value][column]
+
+
+# Hi-Lo index plays for multi-deck S17 (the Illustrious 18 without insurance, which
+# the table does not offer): (chart, total or pair value, upcard column) ->
+# (index, chart character below the index, chart character at or above it)
+ILLUSTRIOUS_18 = {
+    ('hard', 16, 8): (0, 'H', 'S'),
+    ('hard', 15, 8): (4, 'H', 'S'),
+    ('pair', 10, 3): (5, 'S', 'P'),
+    ('pair', 10, 4): (4, 'S', 'P'),
+    ('hard', 10, 8): (4, 'H', 'D'),
+    ('hard', 12, 1): (2, 'H', 'S'),
+    ('hard', 12, 0): (3, 'H', 'S'),
+    ('hard', 11, 9): (1, 'H', 'D'),
+    ('hard', 9, 0): (1, 'H', 'D'),
+    ('hard', 10, 9): (4, 'H', 'D'),
+    ('hard', 9, 5): (3, 'H', 'D'),
+    ('hard', 16, 7): (5, 'H', 'S'),
+    ('hard', 13, 0): (-1, 'H', 'S'),
+    ('hard', 12, 2): (0, 'H', 'S'),
+    ('hard', 12, 3): (-2, 'H', 'S'),
+    ('hard', 12, 4): (-1, 'H', 'S'),
+    ('hard', 13, 1): (-2, 'H', 'S'),
+}
+# Hi-Lo surrender indexes (the Fab 4): (hard total, upcard column) -> surrender at or above
+FAB_4 = {
+    (14, 8): 3,
+    (15, 8): 0,
+    (15, 7): 2,
+    (15, 9): 1,
+}
+
+
+class DeviationStrategy(BasicStrategy):
+    """
+    Basic strategy plus count-based index plays, compiled into dense tables so every
+    decision is a table lookup and a compare against the true count.
+
+    hard_cells[total][column] and soft_cells[total][column] hold
+    (index, (below, at or above), surrender index): the (action, fallback) pair is
+    picked with entries[true_count >= index], and surrendering (when allowed) wins
+    once true_count >= surrender index. Cells without an index play use +inf, and
+    surrender cells of the chart use -inf. split_cells[value][column] holds
+    (index, (below, at or above)) for pairs.
+
+    deviations and surrender_indexes default to the Hi-Lo Illustrious 18 and Fab 4;
+    they replace the chart cells they name, whatever the rules.
+    """
+    count_dependent = True
+
+    def __init__(self, rules=Rules(), deviations=ILLUSTRIOUS_18, surrender_indexes=FAB_4, **charts):
+        super().__init__(rules, **charts)
+        self.deviations = dict(deviations)
+        self.surrender_indexes = dict(surrender_indexes)
+        self.hard_cells = self._compile_cells('hard')
+        self.soft_cells = self._compile_cells('soft')
+        split_codes = 'Pp' if rules.double_after_split else 'P'
+        self.split_cells = tuple(
+            tuple(self._split_cell(value, column, split_codes) for column in range(10))
+            for value in range(11)
+        )
+
+    @staticmethod
+    def _play_pair(action):
+        """Chart character -> (action, fallback) with surrender left to the surrender index."""
+        return _CHART_ACTIONS[{'R': 'H', 'r': 'S'}.get(action, action)]
+
+    def _compile_cells(self, name):
+        chart = self.charts[name]
+        cells = []
+        for total in range(22):
+            row = []
+            for column, action in enumerate(chart.get(total, 'H' * 10)):
+                play = self._play_pair(action)
+                index, entries = math.inf, (play, play)
+                if (name, total, column) in self.deviations:
+                    index, below, above = self.deviations[name, total, column]
+                    entries = (self._play_pair(below), self._play_pair(above))
+                surrender = -math.inf if action in 'Rr' else math.inf
+                if name == 'hard':
+                    surrender = self.surrender_indexes.get((total, column), surrender)
+                row.append((index, entries, surrender))
+            cells.append(tuple(row))
+        return tuple(cells)
+
+    def _split_cell(self, value, column, split_codes):
+        split = self.split[value][column]
+        if ('pair', value, column) not in self.deviations:
+            return math.inf, (split, split)
+        index, below, above = self.deviations['pair', value, column]
+        return index, (below in split_codes, above in split_codes)
+
+    def decide(self, total, soft, column, can_double, can_surrender, true_count=0.0):
+        """Returns the action for a hand total against the dealer upcard column at true_count."""
+        index, entries, surrender = (self.soft_cells if soft else self.hard_cells)[total][column]
+        if can_surrender and true_count >= surrender:
+            return SURRENDER
+        action, fallback = entries[true_count >= index]
+        if action == DOUBLE and not can_double:
+            return fallback
+        return action
+
+    def should_split(self, value, column, true_count=0.0):
+        index, entries = self.split_cells[value][column]
+        return entries[true_count >= index]
+
+
+class EVByTrueCount:
+    """Accumulates round results per true-count bucket (the true count rounded down)."""
+
+    def __init__(self, min_count=-10, max_count=10):
+        self.min_count = min_count
+        self.max_count = max_count
+        size = max_count - min_count + 1
+        self.rounds = [0] * size
+        self.units = [0.0] * size
+        self.squares = [0.0] * size
+
+    def add(self, true_count, result):
+        bucket = min(max(math.floor(true_count), self.min_count), self.max_count)
+        index = bucket - self.min_count
+        self.rounds[index] += 1
+        self.units[index] += result
+        self.squares[index] += result * result
+
+    @property
+    def total_rounds(self):
+        return sum(self.rounds)
+
+    @property
+    def overall_ev(self):
+        return sum(self.units) / max(self.total_rounds, 1)
+
+    def items(self):
+        """Yields (true count bucket, rounds, EV per initial unit) for every non-empty bucket."""
+        for index, rounds in enumerate(self.rounds):
+            if rounds:
+                yield index + self.min_count, rounds, self.units[index] / rounds
+
+
+class BlackjackTable:
+    """
+    Plays headless blackjack rounds with one player hand against the dealer.
+    Cards come off a Deck and every card the player can see is fed to the CardCounter.
+    """
+
+    def __init__(self, rules=Rules(), strategy=None, deck=None, counter=None, system='hilo', rng=None):
+        self.rules = rules
+        if deck is None:
+            cut_card = (rules.penetration - rules.cut_card_variation, rules.penetration + rules.cut_card_variation)
+            deck = Deck(num_decks=rules.num_decks, rng=rng, cut_card=cut_card, burn_cards=rules.burn_cards)
+        self.deck = deck
+        self.counter = counter if counter is not None else CardCounter(num_decks=rules.num_decks, system=system)
+        self.strategy = strategy if strategy is not None else BasicStrategy(rules)
+
+    def true_count(self):
+        return self.counter.true_count(self.deck.remaining_cards)
+
+    def _draw(self):
+        code = self.deck.deal_code()
+        self.counter.update_code(code)
+        return code >> 2
+
+    def play_round(self, bet=1.0):
+        """
+        Plays one round and returns the player's net result in the same units as bet.
+        The shoe is reshuffled after the round if the cut card came out during it.
+        """
+        result = self._play(bet)
+        if self.deck.end_round():
+            self.counter.reset()
+        return result
+
+    def _play(self, bet):
+        rules = self.rules
+        draw = self._draw
+        first = draw()
+        up = draw()
+        second = draw()
+        hole_code = self.deck.deal_code()  # counted once it is turned over
+        hole = hole_code >> 2
+
+        up_value = RANK_VALUES[up]
+        dealer_blackjack = {up_value, RANK_VALUES[hole]} == {1, 10}
+        player_blackjack = {RANK_VALUES[first], RANK_VALUES[second]} == {1, 10}
+        if dealer_blackjack or player_blackjack:
+            self.counter.update_code(hole_code)
+            if dealer_blackjack and player_blackjack:
+                return 0.0
+            return bet * rules.blackjack_payout if player_blackjack else -bet
+
+        column = UPCARD_COLUMNS[up]
+        strategy = self.strategy
+        count_dependent = strategy.count_dependent
+        hands = [[first, second]]
+        bets = [bet]
+        finished = []  # (total, bet) for hands still standing; busts and surrenders settle immediately
+        result = 0.0
+        index = 0
+        while index < len(hands):
+            cards = hands[index]
+            split_hand = len(hands) > 1
+            surrendered = False
+            while True:
+                if len(cards) == 1:
+                    cards.append(draw())
+                    if cards[0] == 12 and not rules.hit_split_aces and not (
+                            rules.resplit_aces and cards[1] == 12 and len(hands) < rules.max_hands):
+                        break
+                total, soft = hand_total(cards)
+                if total >= 21:
+                    break
+                two_cards = len(cards) == 2
+                true_count = self.true_count() if count_dependent else 0.0
+                if two_cards and RANK_VALUES[cards[0]] == RANK_VALUES[cards[1]] and len(hands) < rules.max_hands \
+                        and (cards[0] != 12 or not split_hand or rules.resplit_aces) \
+                        and strategy.should_split(RANK_VALUES[cards[0]], column, true_count):
+                    hands.insert(index + 1, [cards.pop()])
+                    bets.insert(index + 1, bets[index])
+                    split_hand = True
+                    continue
+                action = strategy.decide(total, soft, column,
+                                         two_cards and (not split_hand or rules.double_after_split),
+                                         two_cards and not split_hand and rules.surrender, true_count)
+                if action == HIT:
+                    cards.append(draw())
+                elif action == DOUBLE:
+                    bets[index] *= 2
+                    cards.append(draw())
+                    break
+                else:
+                    surrendered = action == SURRENDER
+                    break
+
+            total = hand_total(cards)[0]
+            if surrendered:
+                result -= bets[index] / 2
+            elif total > 21:
+                result -= bets[index]
+            else:
+                finished.append((total, bets[index]))
+            index += 1
+
+        self.counter.update_code(hole_code)
+        if not finished:
+            return result
+
+        dealer = [up, hole]
+        dealer_total, dealer_soft = hand_total(dealer)
+        while dealer_total < 17 or (dealer_total == 17 and dealer_soft and rules.dealer_hits_soft_17):
+            dealer.append(draw())
+            dealer_total, dealer_soft = hand_total(dealer)
+
+        for total, hand_bet in finished:
+            if dealer_total > 21 or total > dealer_total:
+                result += hand_bet
+            elif total < dealer_total:
+                result -= hand_bet
+        return result
+
+    def simulate(self, num_rounds, bet=1.0, results=None):
+        """
+        Plays num_rounds rounds and returns an EVByTrueCount with each result
+        filed under the true count at the start of its round.
+        """
+        results = results if results is not None else EVByTrueCount()
+        for _ in range(num_rounds):
+            results.add(self.true_count(), self.play_round(bet))
+        return results
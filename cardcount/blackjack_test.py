@@ -0,0 +1,172 @@
+#This file contains the tests for the blackjack round engine.
+import unittest
+from array import array
+
+from cardcount.blackjack import (DOUBLE, HIT, STAND, SURRENDER, BasicStrategy, BlackjackTable,
+                                 DeviationStrategy, EVByTrueCount, Rules, hand_total)
+
+# Rank codes used to stack the shoe
+TWO, FIVE, SIX, SEVEN, EIGHT, NINE, TEN, KING, ACE = 0, 3, 4, 5, 6, 7, 8, 11, 12
+
+
+def stacked_table(ranks, rules=Rules(num_decks=1)):
+    '''
+    Returns a table whose shoe deals the given rank codes first
+    (player, dealer up, player, dealer hole, then hits in order).
+    '''
+    table = BlackjackTable(rules)
+    filler = [code for code in table.deck.codes if code >> 2 not in ranks]
+    table.deck.codes = array('B', [rank * 4 for rank in ranks] + filler[:52 - len(ranks)])
+    table.deck.cursor = 0
+    return table
+
+
+class BasicStrategyTests(unittest.TestCase):
+
+    def test_hard_totals(self):
+        strategy = BasicStrategy(Rules())
+        self.assertEqual(strategy.decide(16, False, 8, True, True), SURRENDER)
+        self.assertEqual(strategy.decide(16, False, 8, True, False), HIT)
+        self.assertEqual(strategy.decide(12, False, 2, True, False), STAND)
+        self.assertEqual(strategy.decide(11, False, 9, True, False), HIT)
+        self.assertEqual(strategy.decide(10, False, 5, False, False), HIT)
+
+    def test_soft_totals(self):
+        strategy = BasicStrategy(Rules())
+        self.assertEqual(strategy.decide(18, True, 3, True, False), DOUBLE)
+        self.assertEqual(strategy.decide(18, True, 3, False, False), STAND)
+        self.assertEqual(strategy.decide(18, True, 8, True, False), HIT)
+
+    def test_h17_changes(self):
+        strategy = BasicStrategy(Rules(dealer_hits_soft_17=True))
+        self.assertEqual(strategy.decide(11, False, 9, True, False), DOUBLE)
+        self.assertEqual(strategy.decide(17, False, 9, True, True), SURRENDER)
+        self.assertEqual(strategy.decide(17, False, 9, True, False), STAND)
+
+    def test_pair_splits_depend_on_das(self):
+        self.assertTrue(BasicStrategy(Rules(double_after_split=True)).split[2][0])
+        self.assertFalse(BasicStrategy(Rules(double_after_split=False)).split[2][0])
+        self.assertTrue(BasicStrategy(Rules()).split[1][9])
+        self.assertFalse(BasicStrategy(Rules()).split[10][4])
+
+    def test_hand_total(self):
+        self.assertEqual(hand_total([ACE, SIX]), (17, True))
+        self.assertEqual(hand_total([ACE, SIX, TEN]), (17, False))
+        self.assertEqual(hand_total([ACE, ACE]), (12, True))
+
+
+class DeviationStrategyTests(unittest.TestCase):
+
+    def test_index_plays(self):
+        strategy = DeviationStrategy(Rules())
+        # 16 v 10 stands from 0, 12 v 4 hits below 0
+        self.assertEqual(strategy.decide(16, False, 8, True, False, -0.5), HIT)
+        self.assertEqual(strategy.decide(16, False, 8, True, False, 0.0), STAND)
+        self.assertEqual(strategy.decide(12, False, 2, True, False, -0.1), HIT)
+        self.assertEqual(strategy.decide(12, False, 2, True, False, 0.0), STAND)
+        # 10 v 10 doubles from +4, but only on two cards
+        self.assertEqual(strategy.decide(10, False, 8, True, False, 4.0), DOUBLE)
+        self.assertEqual(strategy.decide(10, False, 8, False, False, 4.0), HIT)
+        self.assertEqual(strategy.decide(10, False, 8, True, False, 3.9), HIT)
+
+    def test_surrender_indexes(self):
+        strategy = DeviationStrategy(Rules(surrender=True))
+        # 15 v 10: hit below 0, surrender from 0, stand from +4 when surrender is not possible
+        self.assertEqual(strategy.decide(15, False, 8, True, True, -1.0), HIT)
+        self.assertEqual(strategy.decide(15, False, 8, True, True, 0.0), SURRENDER)
+        self.assertEqual(strategy.decide(15, False, 8, True, False, 3.0), HIT)
+        self.assertEqual(strategy.decide(15, False, 8, True, False, 4.0), STAND)
+        self.assertEqual(strategy.decide(14, False, 8, True, True, 3.0), SURRENDER)
+        self.assertEqual(strategy.decide(16, False, 9, True, True, -5.0), SURRENDER)
+
+    def test_pair_indexes(self):
+        strategy = DeviationStrategy(Rules())
+        self.assertFalse(strategy.should_split(10, 3, 4.9))
+        self.assertTrue(strategy.should_split(10, 3, 5.0))
+        self.assertTrue(strategy.should_split(8, 8, -10.0))
+
+    def test_other_cells_follow_basic_strategy(self):
+        for rules in (Rules(), Rules(dealer_hits_soft_17=True, surrender=True, double_after_split=False)):
+            basic = BasicStrategy(rules)
+            strategy = DeviationStrategy(rules, deviations={}, surrender_indexes={})
+            for true_count in (-6.0, 0.0, 6.0):
+                for total in range(4, 22):
+                    for column in range(10):
+                        for soft in (False, True):
+                            for flags in ((True, True), (True, False), (False, False)):
+                                self.assertEqual(strategy.decide(total, soft, column, *flags, true_count),
+                                                 basic.decide(total, soft, column, *flags))
+                for value in range(1, 11):
+                    for column in range(10):
+                        self.assertEqual(strategy.should_split(value, column, true_count), basic.split[value][column])
+
+
+class BlackjackTableTests(unittest.TestCase):
+
+    def test_deviation_strategy_uses_the_true_count(self):
+        # 10+6 against a 10 with a 7 in the hole, then a 5: hitting wins, standing loses
+        ranks = [TEN, TEN, SIX, SEVEN, FIVE]
+        self.assertEqual(stacked_table(ranks).play_round(), 1.0)
+        table = stacked_table(ranks)
+        table.strategy = DeviationStrategy(table.rules)
+        self.assertEqual(table.play_round(), 1.0)
+        table = stacked_table(ranks)
+        table.strategy = DeviationStrategy(table.rules)
+        table.counter.running_count = 3
+        self.assertEqual(table.play_round(), -1.0)
+
+    def test_player_blackjack_pays_three_to_two(self):
+        table = stacked_table([ACE, NINE, KING, SEVEN])
+        self.assertEqual(table.play_round(2.0), 3.0)
+
+    def test_dealer_blackjack_beats_twenty(self):
+        table = stacked_table([TEN, ACE, KING, TEN])
+        self.assertEqual(table.play_round(), -1.0)
+
+    def test_double_down_win(self):
+        # 6+5 against a 6, double onto a ten for 21; dealer 6+10 draws a ten and busts
+        table = stacked_table([SIX, SIX, FIVE, TEN, TEN, TEN])
+        self.assertEqual(table.play_round(), 2.0)
+
+    def test_split_eights(self):
+        # 8,8 against a 7: split, both hands get a ten; dealer 7+10 stands on 17
+        table = stacked_table([EIGHT, SEVEN, EIGHT, TEN, TEN, TEN])
+        self.assertEqual(table.play_round(), 2.0)
+
+    def test_surrender(self):
+        table = stacked_table([TEN, TEN, SIX, SEVEN], Rules(num_decks=1, surrender=True))
+        self.assertEqual(table.play_round(), -0.5)
+
+    def test_counts_every_seen_card(self):
+        table = stacked_table([TWO, SIX, FIVE, TWO, TEN])
+        table.play_round()
+        self.assertEqual(table.counter.cards_dealt, table.deck.cursor)
+
+    def test_reshuffles_between_rounds(self):
+        table = BlackjackTable(Rules(num_decks=1, penetration=0.5), rng=8)
+        shoes = 0
+        for _ in range(200):
+            before = table.deck.cursor
+            table.play_round()
+            if table.deck.cursor < before:
+                shoes += 1
+                self.assertEqual(table.counter.running_count, 0)
+                self.assertEqual(table.deck.cursor, table.rules.burn_cards)
+        self.assertGreater(shoes, 10)
+
+    def test_basic_strategy_edge_is_small(self):
+        results = BlackjackTable(Rules(num_decks=6), rng=1234).simulate(20000)
+        self.assertEqual(results.total_rounds, 20000)
+        self.assertTrue(-0.04 < results.overall_ev < 0.03)
+
+    def test_ev_buckets(self):
+        results = EVByTrueCount(min_count=-2, max_count=2)
+        results.add(-7.5, -1.0)
+        results.add(0.4, 1.0)
+        results.add(0.9, 0.0)
+        results.add(-0.1, 1.5)
+        self.assertEqual(list(results.items()), [(-2, 1, -1.0), (-1, 1, 1.5), (0, 2, 0.5)])
+
+
+if __name__ == "__main__":
+    unittest.main()
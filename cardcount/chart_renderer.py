@@ -0,0 +1,124 @@
+import logging
+import math
+import os
+import tempfile
+import threading
+import time
+
+
+def save_atomically(figure, path):
+    """Saves a figure as PNG through a temporary file, so readers never see a partial image."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.png.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            figure.savefig(f, format='png')
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+class AccuracyChartRenderer:
+    """
+    Draws the accuracy chart on a background thread so the tutorial never waits on
+    matplotlib. One figure is built on the first render and only its line data changes
+    afterwards. Requests are coalesced: at most one render runs per min_interval seconds,
+    and it draws the latest submitted series.
+    """
+
+    def __init__(self, path="counting_accuracy.png", min_interval=0.5, clock=time.monotonic):
+        self.path = path
+        self.min_interval = min_interval
+        self.clock = clock
+        self.renders = 0
+        self._figure = None
+        self._pending = None
+        self._busy = False
+        self._urgent = False
+        self._closing = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="accuracy-chart", daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def submit(self, series):
+        """
+        Asks for the chart of series (recent accuracy per attempt) to be drawn.
+        series may keep growing; only the first len(series) values at submit time are drawn.
+        """
+        with self._condition:
+            if self._closing:
+                raise RuntimeError("The chart renderer is closed")
+            self._pending = (series, len(series))
+            self._condition.notify_all()
+
+    def flush(self):
+        """Renders the latest request now, skipping the throttle, and waits for it."""
+        with self._condition:
+            self._urgent = True
+            self._condition.notify_all()
+            self._condition.wait_for(lambda: self._pending is None and not self._busy)
+            self._urgent = False
+
+    def close(self):
+        """Renders whatever is still pending and stops the worker thread."""
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _run(self):
+        last_render = -math.inf
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None or self._closing)
+                if self._pending is None:
+                    return
+                while not (self._closing or self._urgent):
+                    delay = last_render + self.min_interval - self.clock()
+                    if delay <= 0:
+                        break
+                    self._condition.wait(delay)
+                (series, length), self._pending = self._pending, None
+                self._busy = True
+            try:
+                self._render(series, length)
+            except Exception:
+                logging.exception("Rendering the accuracy chart failed.")
+            finally:
+                last_render = self.clock()
+                with self._condition:
+                    self._busy = False
+                    self.renders += 1
+                    self._condition.notify_all()
+
+    def _render(self, series, length):
+        if self._figure is None:
+            self._build_figure()
+        self._line.set_data(range(1, length + 1), series[:length])
+        self._axes.set_xlim(1, max(length, 2))
+        save_atomically(self._figure, self.path)
+
+    def _build_figure(self):
+        # The Agg canvas draws off-screen and is safe to use away from the main thread
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        self._figure = Figure(figsize=(10, 6))
+        FigureCanvasAgg(self._figure)
+        self._axes = self._figure.add_subplot()
+        self._line, = self._axes.plot([], [], 'b-', label='Running Accuracy')
+        self._axes.axhline(y=100, color='g', linestyle='--', label='Perfect Accuracy')
+        self._axes.set_ylim(-5, 105)
+        self._axes.set_title('Card Counting Accuracy Over Time')
+        self._axes.set_xlabel('Number of Attempts')
+        self._axes.set_ylabel('Accuracy (%)')
+        self._axes.legend()
+        self._axes.grid(True)
@@ -0,0 +1,58 @@
+#This file contains the tests for the background accuracy chart renderer.
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from cardcount.chart_renderer import AccuracyChartRenderer
+
+
+class AccuracyChartRendererTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "charts", "accuracy.png")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_bursts_are_coalesced_to_the_latest_state(self):
+        drawn = []
+        with patch.object(AccuracyChartRenderer, '_render', lambda self, series, length: drawn.append(length)):
+            with AccuracyChartRenderer(self.path, min_interval=60) as renderer:
+                series = []
+                for attempt in range(200):
+                    series.append(100.0)
+                    renderer.submit(series)
+        self.assertLessEqual(len(drawn), 2)
+        self.assertEqual(drawn[-1], 200)
+        self.assertEqual(renderer.renders, len(drawn))
+
+    def test_flush_skips_the_throttle(self):
+        drawn = []
+        with patch.object(AccuracyChartRenderer, '_render', lambda self, series, length: drawn.append(length)):
+            renderer = AccuracyChartRenderer(self.path, min_interval=60)
+            renderer.submit([50.0])
+            renderer.flush()
+            renderer.submit([50.0, 75.0])
+            renderer.flush()
+            self.assertEqual(drawn, [1, 2])
+            renderer.close()
+        with self.assertRaises(RuntimeError):
+            renderer.submit([])
+
+    def test_writes_png_atomically_and_reuses_the_figure(self):
+        with AccuracyChartRenderer(self.path, min_interval=0) as renderer:
+            renderer.submit([100.0, 50.0])
+            renderer.flush()
+            figure = renderer._figure
+            renderer.submit([100.0, 50.0, 66.7])
+        self.assertIs(renderer._figure, figure)
+        self.assertEqual(renderer._line.get_xdata()[-1], 3)
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(8), b'\x89PNG\r\n\x1a\n')
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["accuracy.png"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+Command line entry point, e.g.
+
+    cardcount simulate --decks 8 --shoes 1e6 --system hilo --workers 32 --out stats.parquet
+
+Runs without any prompts, so batch jobs use the same core as the tutorials.
+"""
+import argparse
+import csv
+import json
+import os
+
+from .counting_systems import COUNTING_SYSTEMS
+
+OUTPUT_FORMATS = ('.csv', '.json', '.npz', '.parquet')
+
+
+def shoe_count(text):
+    """Parses a shoe count, accepting scientific notation such as 1e6."""
+    try:
+        value = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid shoe count: {text!r}")
+    if value < 1 or not value.is_integer():
+        raise argparse.ArgumentTypeError(f"shoe count must be a positive whole number: {text!r}")
+    return int(value)
+
+
+def histogram_rows(histogram):
+    """Yields (bin_low, bin_high, count, frequency) for every bin of a TrueCountHistogram."""
+    frequencies = histogram.frequencies
+    for index, count in enumerate(histogram.counts):
+        yield (float(histogram.bin_edges[index]), float(histogram.bin_edges[index + 1]),
+               int(count), float(frequencies[index]))
+
+
+def write_histogram(histogram, path, metadata):
+    """Writes a TrueCountHistogram in the format given by the extension of path."""
+    extension = os.path.splitext(path)[1].lower()
+    columns = ('bin_low', 'bin_high', 'count', 'frequency')
+    rows = list(histogram_rows(histogram))
+    if extension == '.csv':
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            writer.writerows(rows)
+    elif extension == '.json':
+        with open(path, 'w') as f:
+            json.dump({**metadata, 'bins': [dict(zip(columns, row)) for row in rows]}, f, indent=1)
+    elif extension == '.npz':
+        import numpy as np
+        np.savez(path, bin_edges=histogram.bin_edges, counts=histogram.counts, metadata=json.dumps(metadata))
+    elif extension == '.parquet':
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        table = pa.table({name: [row[i] for row in rows] for i, name in enumerate(columns)})
+        table = table.replace_schema_metadata({key: str(value) for key, value in metadata.items()})
+        pq.write_table(table, path)
+    else:
+        raise ValueError(f"Unsupported output format {extension!r}; use one of {', '.join(OUTPUT_FORMATS)}")
+
+
+def check_output(path):
+    """Fails early, before any simulation runs, if the output cannot be written."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format {extension!r}; use one of {', '.join(OUTPUT_FORMATS)}")
+    if extension == '.parquet':
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            raise ValueError("Writing .parquet needs pyarrow (pip install pyarrow); "
+                             "use .csv, .json or .npz instead")
+
+
+def simulate(args):
+    from .monte_carlo import run_monte_carlo
+
+    histogram = run_monte_carlo(args.shoes, args.decks, workers=args.workers, seed=args.seed, system=args.system,
+                                reshuffle_threshold=args.threshold, chunk_size=args.chunk_size)
+    centers = (histogram.bin_edges[:-1] + histogram.bin_edges[1:]) / 2
+    frequencies = histogram.frequencies
+    print(f"Shoes: {histogram.num_shoes}  Decks: {args.decks}  System: {args.system}")
+    print(f"True count samples: {histogram.total}")
+    print(f"Mean true count: {float((centers * frequencies).sum()):.3f}")
+    print(f"Share at true count +2 or more: {float(frequencies[histogram.bin_edges[:-1] >= 2].sum()):.2%}")
+    if args.out:
+        metadata = {'decks': args.decks, 'shoes': args.shoes, 'system': args.system,
+                    'reshuffle_threshold': args.threshold, 'seed': args.seed}
+        write_histogram(histogram, args.out, metadata)
+        print(f"Wrote {args.out}")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='cardcount', description="Blackjack card counting tools.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    simulate_parser = commands.add_parser('simulate', help="true count distribution over many simulated shoes")
+    simulate_parser.add_argument('--decks', type=int, default=6, help="decks per shoe (default 6)")
+    simulate_parser.add_argument('--shoes', type=shoe_count, default=10000, help="number of shoes, e.g. 1e6")
+    simulate_parser.add_argument('--system', choices=sorted(COUNTING_SYSTEMS), default='hilo')
+    simulate_parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all cores)")
+    simulate_parser.add_argument('--seed', type=int, default=None)
+    simulate_parser.add_argument('--threshold', type=float, default=0.25,
+                                 help="fraction of the shoe left when it is reshuffled (default 0.25)")
+    simulate_parser.add_argument('--chunk-size', type=int, default=1000, help="shoes per worker task")
+    simulate_parser.add_argument('--out', help="write the histogram to a .csv, .json, .npz or .parquet file")
+    simulate_parser.set_defaults(handler=simulate)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.out:
+        try:
+            check_output(args.out)
+        except ValueError as e:
+            parser.error(str(e))
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
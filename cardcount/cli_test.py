@@ -0,0 +1,70 @@
+#This file contains the tests for the cardcount command line interface.
+import argparse
+import csv
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+import numpy as np
+
+from cardcount.cli import main, shoe_count
+from cardcount.monte_carlo import expected_samples
+
+
+class CommandLineTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def run_cli(self, *argv):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            status = main(list(argv))
+        return status, output.getvalue()
+
+    def test_shoe_count_accepts_scientific_notation(self):
+        self.assertEqual(shoe_count("1e6"), 1000000)
+        self.assertEqual(shoe_count("250"), 250)
+        for text in ("0", "1.5", "many"):
+            with self.assertRaises(argparse.ArgumentTypeError):
+                shoe_count(text)
+
+    def test_simulate_writes_csv_and_json(self):
+        for extension in ('.csv', '.json'):
+            path = os.path.join(self.directory.name, "stats" + extension)
+            status, output = self.run_cli('simulate', '--decks', '2', '--shoes', '2e2', '--workers', '1',
+                                          '--seed', '3', '--chunk-size', '50', '--out', path)
+            self.assertEqual(status, 0)
+            self.assertIn("Shoes: 200", output)
+            if extension == '.csv':
+                with open(path, newline='') as f:
+                    rows = list(csv.DictReader(f))
+                self.assertEqual(len(rows), 80)
+                self.assertEqual(sum(int(row['count']) for row in rows), expected_samples(200, num_decks=2))
+            else:
+                with open(path) as f:
+                    data = json.load(f)
+                self.assertEqual((data['decks'], data['shoes'], data['seed']), (2, 200, 3))
+
+    def test_simulate_writes_npz(self):
+        path = os.path.join(self.directory.name, "stats.npz")
+        self.run_cli('simulate', '--decks', '1', '--shoes', '100', '--workers', '1', '--out', path)
+        with np.load(path) as data:
+            self.assertEqual(int(data['counts'].sum()), expected_samples(100, num_decks=1))
+            self.assertEqual(json.loads(str(data['metadata']))['system'], 'hilo')
+
+    def test_bad_output_fails_before_simulating(self):
+        path = os.path.join(self.directory.name, "stats.xlsx")
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            self.run_cli('simulate', '--shoes', '1e9', '--out', path)
+        self.assertFalse(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,330 @@
+import random
+import logging
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from .counting_systems import get_system
+
+
+@dataclass(frozen=True)
+class Card:
+    __slots__ = ('suit', 'rank')
+    suit: str
+    rank: str
+
+    def __str__(self):
+        return f"{self.rank} of {self.suit}"
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+
+def card_code(card: Card) -> int:
+    """Returns the compact code (rank * 4 + suit) of a card."""
+    return Deck.ranks.index(card.rank) * 4 + Deck.suits.index(card.suit)
+
+
+_CARD_TABLE = [None] * 52
+
+
+def card_from_code(code: int) -> Card:
+    """Returns the Card for a compact code, creating it only the first time it is needed."""
+    card = _CARD_TABLE[code]
+    if card is None:
+        card = _CARD_TABLE[code] = Card(Deck.suits[code & 3], Deck.ranks[code >> 2])
+    return card
+
+
+def fisher_yates(codes, rng=random, start=0):
+    """
+    Shuffles codes[start:] in place.
+    rng may be the random module, a random.Random or a NumPy Generator; NumPy
+    shuffles a zero-copy view of the buffer in C.
+    """
+    if hasattr(rng, 'bit_generator'):
+        import numpy as np
+        rng.shuffle(np.frombuffer(codes, dtype=np.uint8)[start:])
+    elif start == 0:
+        rng.shuffle(codes)
+    else:
+        uniform = rng.random
+        for i in range(len(codes) - 1, start, -1):
+            j = start + int(uniform() * (i - start + 1))
+            codes[i], codes[j] = codes[j], codes[i]
+
+
+def make_random(rng=None):
+    """
+    Normalizes an rng argument: None keeps the global random module, an int seeds a
+    new random.Random, anything else (random.Random, NumPy Generator) is used as-is.
+    """
+    if rng is None:
+        return random
+    if isinstance(rng, int):
+        return random.Random(rng)
+    return rng
+
+
+def decks_remaining(remaining_cards, resolution='exact'):
+    """
+    Estimated decks left for the true count division.
+    'exact' uses remaining_cards / 52, 'half' rounds to the nearest half deck and
+    'full' to the nearest whole deck (never below half a deck / one deck).
+    """
+    if resolution == 'exact':
+        return remaining_cards / 52.0
+    if resolution == 'half':
+        return max(0.5, round(remaining_cards / 26.0) / 2)
+    if resolution == 'full':
+        return max(1, round(remaining_cards / 52.0))
+    raise ValueError(f"Unknown deck resolution {resolution!r}")
+
+
+def true_count_for(running_count, remaining_cards, resolution='exact'):
+    remaining_decks = decks_remaining(remaining_cards, resolution)
+    if remaining_decks == 0:
+        return running_count
+    return running_count / remaining_decks
+
+
+class ShoeComposition:
+    """
+    Number of unseen cards of each rank (13 slots indexed by rank code), updated in O(1)
+    as cards are seen. Burn cards are never seen, so they stay in the composition.
+    """
+    __slots__ = ('num_decks', 'counts', 'remaining')
+
+    def __init__(self, num_decks=1):
+        self.num_decks = num_decks
+        self.reset()
+
+    def reset(self):
+        self.counts = [4 * self.num_decks] * 13
+        self.remaining = 52 * self.num_decks
+
+    def remove(self, code: int):
+        """Removes a card by its compact code (rank * 4 + suit)."""
+        self.counts[code >> 2] -= 1
+        self.remaining -= 1
+
+    def remove_rank(self, rank_code: int):
+        self.counts[rank_code] -= 1
+        self.remaining -= 1
+
+    def as_tuple(self):
+        return tuple(self.counts)
+
+    def decks_remaining(self, resolution='exact'):
+        return decks_remaining(self.remaining, resolution)
+
+    def true_count(self, running_count, resolution='exact'):
+        return true_count_for(running_count, self.remaining, resolution)
+
+
+class CardSource:
+    """
+    Cards read in order from a buffer of card codes: an array('B'), bytes, an mmap,
+    a NumPy uint8 array, ... cursor is the index of the next card, so dealing is O(1)
+    and the buffer is never copied. Iterating yields Card objects until the buffer
+    runs out; peek and lookahead look at upcoming cards without dealing them.
+    """
+
+    def __init__(self, codes, cursor=0):
+        self.codes = codes
+        self.cursor = cursor
+
+    @classmethod
+    def shuffled(cls, num_decks=1, rng=None):
+        """A source over num_decks freshly shuffled decks."""
+        codes = array('B', range(52)) * num_decks
+        fisher_yates(codes, make_random(rng))
+        return cls(codes)
+
+    @property
+    def remaining_cards(self):
+        return len(self.codes) - self.cursor
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.cursor >= len(self.codes):
+            raise StopIteration
+        return card_from_code(self.deal_code())
+
+    def deal_code(self):
+        if self.cursor >= len(self.codes):
+            raise ValueError("No cards left in the deck!")
+        code = self.codes[self.cursor]
+        self.cursor += 1
+        return code
+
+    def deal_card(self):
+        return card_from_code(self.deal_code())
+
+    def peek(self, offset=0):
+        """The card offset places after the next one, without dealing it; None past the end."""
+        index = self.cursor + offset
+        return card_from_code(self.codes[index]) if index < len(self.codes) else None
+
+    def lookahead(self, count):
+        """Codes of the next count cards (fewer near the end), as a view into the buffer."""
+        return memoryview(self.codes)[self.cursor:self.cursor + count]
+
+
+class CompactDeck(CardSource):
+    """
+    Shoe stored as an array('B') of card codes (rank * 4 + suit).
+    Cards are dealt by advancing a cursor and reshuffles happen in place.
+    rng is passed through make_random(), so a seed makes the deck reproducible.
+
+    The shoe follows a casino lifecycle: after each shuffle burn_cards cards go
+    straight to the discard tray and a cut card is placed. cut_card is a
+    (low, high) range for the fraction of the shoe dealt before the cut card,
+    drawn again for every shoe; without it the cut card sits where fewer than
+    reshuffle_threshold of the cards would remain. Dealt cards stay in
+    codes[:cursor] as the discard tray and are reshuffled in place.
+
+    composition tracks the unseen cards of the current shoe. A recorder (e.g. a
+    shoe_archive.ShoeWriter) gets the full card order of every shoe as it starts.
+    """
+    suits = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
+    ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'Jack', 'Queen', 'King', 'Ace']
+
+    def __init__(self, num_decks=1, reshuffle_threshold=0.25, rng=None, cut_card=None, burn_cards=0, recorder=None):
+        self.num_decks = num_decks
+        self.recorder = recorder
+        self.rng = make_random(rng)
+        self.reshuffle_threshold = reshuffle_threshold
+        self.cut_card = cut_card
+        self.burn_cards = burn_cards
+        self._initial_deck_size = 52 * num_decks
+        self.composition = ShoeComposition(num_decks)
+        super().__init__(array('B', self._create_codes()))
+        self.shuffle()
+        self._start_shoe()
+
+    def _create_codes(self):
+        return [rank * 4 + suit
+                for _ in range(self.num_decks)
+                for suit in range(len(self.suits))
+                for rank in range(len(self.ranks))]
+
+    def _start_shoe(self):
+        """Places the cut card and burns cards for a freshly shuffled shoe."""
+        size = self._initial_deck_size
+        if self.cut_card is None:
+            cut_index = int(size - self.reshuffle_threshold * size) + 1
+        else:
+            low, high = (round(fraction * size) for fraction in self.cut_card)
+            if hasattr(self.rng, 'bit_generator'):
+                cut_index = int(self.rng.integers(low, high + 1))
+            else:
+                cut_index = self.rng.randint(low, high)
+        self._cut_index = min(max(cut_index, self.burn_cards + 1), size)
+        self.cursor = self.burn_cards
+        self.composition.reset()
+        if self.recorder is not None:
+            self.recorder.write_shoe(self.codes)
+
+    @property
+    def cut_card_reached(self):
+        return self.cursor >= self._cut_index
+
+    @property
+    def penetration(self):
+        """Fraction of the shoe dealt so far, burn cards included."""
+        return self.cursor / self._initial_deck_size
+
+    @property
+    def discard_tray(self):
+        """Codes of the burned and dealt cards of the current shoe (a view, not a copy)."""
+        return memoryview(self.codes)[:self.cursor]
+
+    def shuffle(self):
+        """Shuffles the cards that have not been dealt yet."""
+        fisher_yates(self.codes, self.rng, self.cursor)
+
+    def reshuffle(self):
+        """Gathers the discard tray back into the shoe, shuffles it and starts a new shoe."""
+        self.cursor = 0
+        self.shuffle()
+        self._start_shoe()
+
+    def reshuffle_if_needed(self):
+        if self.cursor < self._cut_index:
+            return False
+        logging.info("Reshuffling deck as threshold reached.")
+        self.reshuffle()
+        return True
+
+    def end_round(self):
+        """
+        Call after every round: reshuffles only once the cut card has come out,
+        so a shoe is never reshuffled in the middle of a round.
+        """
+        return self.reshuffle_if_needed()
+
+    def deal_code(self):
+        if self.cursor >= len(self.codes):
+            raise ValueError("No cards left in the deck!")
+        code = self.codes[self.cursor]
+        self.cursor += 1
+        self.composition.remove(code)
+        return code
+
+
+class CardView(Sequence):
+    """Read-only sequence of the undealt Card objects of a CompactDeck, next card first."""
+    __slots__ = ('_deck',)
+
+    def __init__(self, deck):
+        self._deck = deck
+
+    def __len__(self):
+        return self._deck.remaining_cards
+
+    def __getitem__(self, index):
+        remaining = range(self._deck.cursor, len(self._deck.codes))[index]
+        if isinstance(remaining, range):
+            return [card_from_code(self._deck.codes[i]) for i in remaining]
+        return card_from_code(self._deck.codes[remaining])
+
+
+class Deck(CompactDeck):
+    """Object API over CompactDeck: exposes the undealt cards as a view."""
+
+    @property
+    def cards(self):
+        return CardView(self)
+
+
+# Rank name -> rank code, including the short names used by HI_LO_VALUES
+RANK_CODES = {rank: code for code, rank in enumerate(CompactDeck.ranks)}
+RANK_CODES.update({'J': 9, 'Q': 10, 'K': 11, 'A': 12})
+
+
+class CardCounter:
+    def __init__(self, num_decks=1, system='hilo'):
+        self.running_count = 0
+        self.num_decks = num_decks
+        self.cards_dealt = 0
+        self.system = get_system(system)
+        self._tags = self.system.tags
+
+    def update_count(self, card: Card):
+        self.running_count += self._tags[RANK_CODES[card.rank]]
+        self.cards_dealt += 1
+
+    def update_code(self, code: int):
+        """Same as update_count for a compact card code (rank * 4 + suit)."""
+        self.running_count += self._tags[code >> 2]
+        self.cards_dealt += 1
+
+    def true_count(self, remaining_cards: int, resolution='exact') -> float:
+        return true_count_for(self.running_count, remaining_cards, resolution)
+
+    def reset(self):
+        self.running_count = 0
+        self.cards_dealt = 0
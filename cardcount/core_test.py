@@ -0,0 +1,186 @@
+#This file contains the tests for the card counting core.
+import random
+import unittest
+
+from cardcount.core import (Card, CardCounter, CardSource, Deck, ShoeComposition, card_code, card_from_code,
+                            decks_remaining, true_count_for)
+
+
+class TestCardCounting(unittest.TestCase):
+    def test_update_count(self):
+        counter = CardCounter()
+        card1 = Card("Hearts", "5")
+        counter.update_count(card1)
+        self.assertEqual(counter.running_count, 1)
+        card2 = Card("Spades", "King")
+        counter.update_count(card2)
+        self.assertEqual(counter.running_count, 0)
+        card3 = Card("Clubs", "8")
+        counter.update_count(card3)
+        self.assertEqual(counter.running_count, 0)
+
+    def test_counting_systems(self):
+        cards = [Card("Hearts", rank) for rank in Deck.ranks]
+        for key, expected in [('hilo', 0), ('ko', 1), ('omega2', 0), ('zen', 0), ('halves', 0)]:
+            counter = CardCounter(system=key)
+            for card in cards:
+                counter.update_count(card)
+            self.assertEqual(counter.running_count, expected, key)
+        counter = CardCounter(system='omega2')
+        counter.update_code(card_code(Card("Clubs", "Queen")))
+        self.assertEqual(counter.running_count, -2)
+        with self.assertRaises(ValueError):
+            CardCounter(system='nope')
+
+    def test_true_count(self):
+        counter = CardCounter()
+        counter.update_count(Card("Diamonds", "3"))
+        counter.update_count(Card("Diamonds", "4"))
+        self.assertAlmostEqual(counter.true_count(40), counter.running_count / (40 / 52))
+
+    def test_deck_reshuffle(self):
+        deck = Deck(num_decks=1, reshuffle_threshold=0.5)
+        initial_size = len(deck.cards)
+        for _ in range(int(initial_size * 0.6)):
+            deck.deal_card()
+        reshuffled = deck.reshuffle_if_needed()
+        self.assertTrue(reshuffled)
+        self.assertEqual(len(deck.cards), 52)
+
+    def test_card_codes(self):
+        for code in range(52):
+            self.assertEqual(card_code(card_from_code(code)), code)
+        self.assertIs(card_from_code(51), card_from_code(51))
+        self.assertEqual(card_from_code(card_code(Card("Spades", "Ace"))), Card("Spades", "Ace"))
+
+    def test_deal_advances_cursor(self):
+        deck = Deck(num_decks=2)
+        self.assertEqual(sorted(deck.codes), sorted(list(range(52)) * 2))
+        next_card = deck.cards[0]
+        self.assertEqual(deck.deal_card(), next_card)
+        self.assertEqual(deck.cursor, 1)
+        self.assertEqual(len(deck.cards), 103)
+
+    def test_reshuffle_reuses_buffer(self):
+        deck = Deck(num_decks=1, reshuffle_threshold=0.5)
+        codes = deck.codes
+        for _ in range(40):
+            deck.deal_code()
+        self.assertTrue(deck.reshuffle_if_needed())
+        self.assertIs(deck.codes, codes)
+        self.assertEqual(sorted(deck.codes), list(range(52)))
+
+    def test_seeded_decks_are_reproducible(self):
+        self.assertEqual(Deck(num_decks=2, rng=42).codes, Deck(num_decks=2, rng=42).codes)
+        self.assertNotEqual(Deck(num_decks=2, rng=42).codes, Deck(num_decks=2, rng=43).codes)
+
+    def test_numpy_generator_shuffle(self):
+        import numpy as np
+        deck = Deck(num_decks=1, rng=np.random.Generator(np.random.Philox(7)))
+        same = Deck(num_decks=1, rng=np.random.Generator(np.random.Philox(7)))
+        self.assertEqual(deck.codes, same.codes)
+        self.assertEqual(sorted(deck.codes), list(range(52)))
+
+    def test_partial_shuffle_keeps_dealt_cards(self):
+        for rng in (random.Random(1), 5):
+            deck = Deck(num_decks=1, rng=rng)
+            dealt = [deck.deal_code() for _ in range(10)]
+            remaining = sorted(deck.codes[10:])
+            deck.shuffle()
+            self.assertEqual(list(deck.codes[:10]), dealt)
+            self.assertEqual(sorted(deck.codes[10:]), remaining)
+
+    def test_cut_card_and_burn(self):
+        deck = Deck(num_decks=2, rng=3, cut_card=(0.6, 0.8), burn_cards=1)
+        self.assertEqual(deck.cursor, 1)
+        self.assertEqual(len(deck.discard_tray), 1)
+        self.assertTrue(62 <= deck._cut_index <= 83)
+        rounds = 0
+        while not deck.cut_card_reached:
+            for _ in range(5):
+                deck.deal_code()
+            rounds += 1
+            if not deck.cut_card_reached:
+                self.assertFalse(deck.end_round())
+        self.assertGreater(deck.remaining_cards, 0)
+        codes = deck.codes
+        self.assertTrue(deck.end_round())
+        self.assertIs(deck.codes, codes)
+        self.assertEqual(deck.cursor, 1)
+        self.assertEqual(sorted(deck.codes), sorted(list(range(52)) * 2))
+
+    def test_threshold_cut_index(self):
+        deck = Deck(num_decks=1, reshuffle_threshold=0.25)
+        for _ in range(39):
+            deck.deal_code()
+        self.assertFalse(deck.reshuffle_if_needed())
+        deck.deal_code()
+        self.assertTrue(deck.cut_card_reached)
+
+    def test_composition_tracks_dealt_cards(self):
+        deck = Deck(num_decks=2, rng=1, burn_cards=1)
+        self.assertEqual(deck.composition.remaining, 104)
+        dealt = [deck.deal_code() for _ in range(30)]
+        for rank in range(13):
+            self.assertEqual(deck.composition.counts[rank], 8 - sum(1 for code in dealt if code >> 2 == rank))
+        self.assertEqual(deck.composition.remaining, 74)
+        deck.reshuffle()
+        self.assertEqual(deck.composition.as_tuple(), (8,) * 13)
+
+    def test_true_count_resolutions(self):
+        composition = ShoeComposition(num_decks=6)
+        for _ in range(100):
+            composition.remove_rank(0)
+        self.assertEqual(composition.remaining, 212)
+        self.assertAlmostEqual(composition.true_count(12), 12 / (212 / 52))
+        self.assertEqual(composition.true_count(12, 'half'), 12 / 4.0)
+        self.assertEqual(composition.true_count(12, 'full'), 3.0)
+        self.assertEqual(true_count_for(5, 10, 'full'), 5)
+        self.assertEqual(true_count_for(5, 0), 5)
+        self.assertEqual(CardCounter().true_count(10, 'half'), 0)
+        with self.assertRaises(ValueError):
+            decks_remaining(52, 'quarter')
+
+    def test_deal_card_error(self):
+        deck = Deck(num_decks=1)
+        for _ in range(52):
+            deck.deal_card()
+        with self.assertRaises(ValueError):
+            deck.deal_card()
+
+    def test_card_source_reads_with_a_cursor(self):
+        codes = bytes([card_code(Card("Hearts", "5")), card_code(Card("Spades", "King")), card_code(Card("Clubs", "8"))])
+        source = CardSource(codes)
+        self.assertEqual(source.peek(), Card("Hearts", "5"))
+        self.assertEqual(source.peek(2), Card("Clubs", "8"))
+        self.assertIsNone(source.peek(3))
+        self.assertEqual(source.deal_card(), Card("Hearts", "5"))
+        self.assertEqual(bytes(source.lookahead(5)), codes[1:])
+        self.assertEqual(list(source), [Card("Spades", "King"), Card("Clubs", "8")])
+        self.assertEqual(source.remaining_cards, 0)
+        with self.assertRaises(ValueError):
+            source.deal_code()
+
+    def test_lookahead_is_a_view(self):
+        deck = Deck(num_decks=1, rng=3)
+        window = deck.lookahead(4)
+        self.assertEqual(len(window), 4)
+        self.assertEqual(card_from_code(window[0]), deck.peek())
+        deck.codes[deck.cursor] = 51
+        self.assertEqual(window[0], 51)
+
+    def test_iterating_a_deck_deals_the_shoe(self):
+        deck = Deck(num_decks=2, rng=4)
+        cards = list(deck)
+        self.assertEqual(len(cards), 104)
+        self.assertEqual(deck.composition.remaining, 0)
+        self.assertEqual(sorted(cards, key=card_code), sorted(Deck(num_decks=2).cards, key=card_code))
+
+    def test_shuffled_source(self):
+        first, second = CardSource.shuffled(2, rng=9), CardSource.shuffled(2, rng=9)
+        self.assertEqual(bytes(first.codes), bytes(second.codes))
+        self.assertEqual(sorted(first.codes), sorted(list(range(52)) * 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
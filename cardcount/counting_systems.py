@@ -0,0 +1,64 @@
+from dataclasses import dataclass
+
+
+# Rank codes are the positions of the ranks in Deck.ranks:
+# 2, 3, 4, 5, 6, 7, 8, 9, 10, Jack, Queen, King, Ace
+RANK_NAMES = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'Jack', 'Queen', 'King', 'Ace')
+
+
+@dataclass(frozen=True)
+class CountingSystem:
+    """
+    A card counting system compiled to a 13-entry tag table indexed by rank code.
+    """
+    name: str
+    tags: tuple
+    description: str = ""
+
+    def __post_init__(self):
+        if len(self.tags) != len(RANK_NAMES):
+            raise ValueError(f"{self.name}: expected {len(RANK_NAMES)} tags, got {len(self.tags)}")
+        object.__setattr__(self, 'tags', tuple(self.tags))
+
+    @property
+    def balanced(self):
+        """A system is balanced when a full deck counts back to zero."""
+        return sum(self.tags) * 4 == 0
+
+    def tag(self, rank):
+        """Returns the tag of a rank name, e.g. '7' or 'King'."""
+        return self.tags[RANK_NAMES.index(rank)]
+
+
+def _tags(two, three, four, five, six, seven, eight, nine, ten, ace):
+    """Expands per-value tags into the 13-entry table (10, J, Q, K share one tag)."""
+    return (two, three, four, five, six, seven, eight, nine, ten, ten, ten, ten, ace)
+
+
+COUNTING_SYSTEMS = {}
+
+
+def register_system(key, system):
+    """Adds a counting system to the registry under key and returns it."""
+    COUNTING_SYSTEMS[key] = system
+    return system
+
+
+def get_system(system):
+    """Looks up a counting system by registry key. CountingSystem instances are returned as-is."""
+    if isinstance(system, CountingSystem):
+        return system
+    try:
+        return COUNTING_SYSTEMS[system]
+    except KeyError:
+        raise ValueError(f"Unknown counting system {system!r}. "
+                         f"Available: {', '.join(sorted(COUNTING_SYSTEMS))}") from None
+
+
+register_system('hilo', CountingSystem("Hi-Lo", _tags(1, 1, 1, 1, 1, 0, 0, 0, -1, -1), "Level 1, balanced"))
+register_system('ko', CountingSystem("KO", _tags(1, 1, 1, 1, 1, 1, 0, 0, -1, -1), "Knock-Out, level 1, unbalanced"))
+register_system('hiopt1', CountingSystem("Hi-Opt I", _tags(0, 1, 1, 1, 1, 0, 0, 0, -1, 0), "Level 1, ace neutral"))
+register_system('hiopt2', CountingSystem("Hi-Opt II", _tags(1, 1, 2, 2, 1, 1, 0, 0, -2, 0), "Level 2, ace neutral"))
+register_system('omega2', CountingSystem("Omega II", _tags(1, 1, 2, 2, 2, 1, 0, -1, -2, 0), "Level 2, ace neutral"))
+register_system('zen', CountingSystem("Zen", _tags(1, 1, 2, 2, 2, 1, 0, 0, -2, -1), "Level 2, balanced"))
+register_system('halves', CountingSystem("Wong Halves", _tags(0.5, 1, 1, 1.5, 1, 0.5, 0, -0.5, -1, -1), "Level 3, fractional"))
@@ -0,0 +1,119 @@
+from functools import lru_cache
+
+
+# Dealer final outcomes, in the order of the probability tuples
+OUTCOMES = ('17', '18', '19', '20', '21', 'bust', 'blackjack')
+BUST, BLACKJACK = 5, 6
+
+# Card values are indexed 0-9: 2 through 9, ten-valued cards, ace
+TEN, ACE = 8, 9
+
+
+def value_counts(composition):
+    """
+    Collapses a 13-slot rank composition (a ShoeComposition or any sequence of counts
+    indexed by rank code) into the 10 card values the dealer's play depends on.
+    """
+    counts = getattr(composition, 'counts', composition)
+    return tuple(counts[:8]) + (counts[8] + counts[9] + counts[10] + counts[11], counts[12])
+
+
+def _add_card(total, soft, value):
+    """Adds a card value index to a (total, soft) hand where a soft ace counts 11."""
+    if value == ACE:
+        if total + 11 <= 21:
+            return total + 11, True
+        total += 1
+    else:
+        total += 10 if value == TEN else value + 2
+    if total > 21 and soft:
+        return total - 10, False
+    return total, soft
+
+
+class DealerOutcomeEngine:
+    """
+    Exact dealer final-total probabilities by recursive enumeration over the remaining
+    cards, without replacement. Results are memoized per (composition, upcard) in an
+    LRU cache of maxsize entries.
+
+    With peek=True the dealer has already checked for blackjack under an ace or ten,
+    so the probabilities are conditioned on the dealer not having one.
+    """
+
+    def __init__(self, hits_soft_17=False, peek=True, maxsize=4096):
+        self.hits_soft_17 = hits_soft_17
+        self.peek = peek
+        self._cached = lru_cache(maxsize=maxsize)(self._outcomes)
+
+    def outcomes(self, composition, upcard):
+        """
+        Returns the probabilities of OUTCOMES for a dealer showing upcard (a rank code).
+        composition is the unseen cards with the upcard already removed.
+        """
+        up = 9 if upcard == 12 else min(upcard, TEN)
+        return self._cached(value_counts(composition), up)
+
+    def cache_info(self):
+        return self._cached.cache_info()
+
+    def cache_clear(self):
+        self._cached.cache_clear()
+
+    def _outcomes(self, counts, up):
+        start = (11, True) if up == ACE else (10 if up == TEN else up + 2, False)
+        memo = {}
+        result = [0.0] * 7
+        cards = sum(counts)
+        for value, count in enumerate(counts):
+            if not count:
+                continue
+            probability = count / cards
+            if (up == ACE and value == TEN) or (up == TEN and value == ACE):
+                result[BLACKJACK] += probability
+                continue
+            total, soft = _add_card(*start, value)
+            branch = self._finish(counts, value, total, soft, memo)
+            for outcome in range(6):
+                result[outcome] += probability * branch[outcome]
+
+        if self.peek and result[BLACKJACK]:
+            no_blackjack = 1.0 - result[BLACKJACK]
+            result = [probability / no_blackjack for probability in result[:6]] + [0.0]
+        return tuple(result)
+
+    def _finish(self, counts, drawn, total, soft, memo):
+        """Probabilities of 17-21 and bust once the dealer holds (total, soft) after drawing drawn."""
+        if total > 21:
+            return (0.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+        if total > 17 or (total == 17 and not (soft and self.hits_soft_17)):
+            result = [0.0] * 6
+            result[total - 17] = 1.0
+            return result
+        counts = counts[:drawn] + (counts[drawn] - 1,) + counts[drawn + 1:]
+        key = (counts, total, soft)
+        if key in memo:
+            return memo[key]
+
+        result = [0.0] * 6
+        cards = sum(counts)
+        for value, count in enumerate(counts):
+            if not count:
+                continue
+            probability = count / cards
+            branch = self._finish(counts, value, *_add_card(total, soft, value), memo)
+            for outcome in range(6):
+                result[outcome] += probability * branch[outcome]
+        memo[key] = result
+        return result
+
+
+_ENGINES = {}
+
+
+def dealer_outcomes(composition, upcard, hits_soft_17=False, peek=True):
+    """Module-level shortcut sharing one cached engine per rule set."""
+    key = (hits_soft_17, peek)
+    if key not in _ENGINES:
+        _ENGINES[key] = DealerOutcomeEngine(hits_soft_17, peek)
+    return _ENGINES[key].outcomes(composition, upcard)
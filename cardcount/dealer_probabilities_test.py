@@ -0,0 +1,61 @@
+#This file contains the tests for the dealer outcome probability engine.
+import unittest
+
+from cardcount.dealer_probabilities import BLACKJACK, BUST, DealerOutcomeEngine, dealer_outcomes, value_counts
+from cardcount.core import Deck
+
+
+def composition(**ranks):
+    counts = [0] * 13
+    for rank, count in ranks.items():
+        counts[int(rank[1:])] = count
+    return counts
+
+
+class DealerOutcomeTests(unittest.TestCase):
+
+    def test_small_composition_by_hand(self):
+        # dealer 7 up; a ten in the hole stands on 17, a seven makes 14 and the ten busts it
+        result = DealerOutcomeEngine().outcomes(composition(r5=1, r8=1), upcard=5)
+        self.assertAlmostEqual(result[0], 0.5)
+        self.assertAlmostEqual(result[BUST], 0.5)
+
+    def test_soft_17_rule(self):
+        # ace up, two sixes and a ten left: A6 is soft 17; hitting it gives
+        # A66 (hard 13, then the ten busts it) or A6T (hard 17)
+        counts = composition(r4=2, r8=1)
+        stand = DealerOutcomeEngine(hits_soft_17=False, peek=False).outcomes(counts, upcard=12)
+        hit = DealerOutcomeEngine(hits_soft_17=True, peek=False).outcomes(counts, upcard=12)
+        self.assertAlmostEqual(stand[0], 2 / 3)
+        self.assertAlmostEqual(stand[BLACKJACK], 1 / 3)
+        self.assertAlmostEqual(hit[0], 1 / 3)
+        self.assertAlmostEqual(hit[BUST], 1 / 3)
+        self.assertAlmostEqual(hit[BLACKJACK], 1 / 3)
+
+    def test_full_shoe_matches_published_values(self):
+        counts = [32] * 13
+        counts[4] -= 1
+        six = dealer_outcomes(counts, upcard=4)
+        self.assertAlmostEqual(six[BUST], 0.4229, places=3)
+        self.assertAlmostEqual(sum(six), 1.0)
+        counts = [32] * 13
+        counts[12] -= 1
+        ace = dealer_outcomes(counts, upcard=12, peek=False)
+        self.assertAlmostEqual(ace[BLACKJACK], 128 / 415)
+        self.assertAlmostEqual(sum(ace), 1.0)
+        self.assertEqual(dealer_outcomes(counts, upcard=12)[BLACKJACK], 0.0)
+
+    def test_memoized_by_composition(self):
+        engine = DealerOutcomeEngine(maxsize=2)
+        deck = Deck(num_decks=6, rng=4)
+        for _ in range(10):
+            deck.deal_code()
+        first = engine.outcomes(deck.composition, upcard=9)
+        again = engine.outcomes(deck.composition, upcard=11)  # any ten-valued upcard shares the entry
+        self.assertEqual(first, again)
+        self.assertEqual(engine.cache_info().hits, 1)
+        self.assertEqual(value_counts(deck.composition)[8], sum(deck.composition.counts[8:12]))
+
+
+if __name__ == "__main__":
+    unittest.main()
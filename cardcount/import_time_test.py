@@ -0,0 +1,62 @@
+#This file contains the import-time budget tests for the headless entry points.
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ('matplotlib', 'PIL', 'tkinter')
+
+LOAD_V2 = ("import importlib.util; "
+           "spec = importlib.util.spec_from_file_location('v2', 'v2_Consolidated Code.py'); "
+           "spec.loader.exec_module(importlib.util.module_from_spec(spec))")
+
+
+def _top_level_imports(code):
+    """Runs code under -X importtime and returns {top-level module: cumulative microseconds}."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    imports = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if len(name) - len(name.lstrip()) == 1:
+            imports[name.strip()] = int(cumulative)
+    return imports, result.stdout.split()
+
+
+def import_cost(code):
+    """
+    Returns (milliseconds spent in the imports code triggers, heavy modules it loaded),
+    leaving out what the interpreter imports at startup anyway.
+    """
+    baseline, _ = _top_level_imports('pass')
+    probe = code + f"; import sys; print(*[m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    imports, heavy = _top_level_imports(probe)
+    return sum(us for name, us in imports.items() if name not in baseline) / 1000, heavy
+
+
+class ImportTimeTests(unittest.TestCase):
+
+    def assertImportWithin(self, code, budget_ms):
+        cost, heavy = import_cost(code)
+        self.assertEqual(heavy, [], f"{code} pulled in {heavy}")
+        self.assertLess(cost, budget_ms, f"{code} took {cost:.0f} ms to import")
+
+    def test_counting_core(self):
+        self.assertImportWithin("import cardcount.core", 150)
+
+    def test_v2_entry_point(self):
+        self.assertImportWithin(LOAD_V2, 200)
+
+    def test_command_line(self):
+        self.assertImportWithin("import cardcount.cli", 150)
+
+    def test_batch_workers(self):
+        # NumPy is the only heavy dependency the simulation workers need
+        self.assertImportWithin("import cardcount.batch_simulation, cardcount.monte_carlo, cardcount.bankroll", 600)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from .batch_simulation import cards_per_shoe, simulate_shoes
+
+
+# Half-count bins from -20 to +20; more extreme true counts land in the end bins
+DEFAULT_BIN_EDGES = np.linspace(-20.0, 20.0, 81)
+
+
+@dataclass
+class TrueCountHistogram:
+    """Histogram of the true count seen after every dealt card."""
+    bin_edges: np.ndarray
+    counts: np.ndarray
+    num_shoes: int = 0
+
+    @property
+    def total(self):
+        return int(self.counts.sum())
+
+    @property
+    def frequencies(self):
+        return self.counts / max(self.total, 1)
+
+    def merge(self, other):
+        """Adds another histogram with the same bins into this one."""
+        if not np.array_equal(self.bin_edges, other.bin_edges):
+            raise ValueError("Cannot merge histograms with different bins")
+        self.counts += other.counts
+        self.num_shoes += other.num_shoes
+        return self
+
+
+def _simulate_chunk(task):
+    """Worker entry point: simulates one chunk of shoes and histograms its true counts."""
+    num_shoes, num_decks, reshuffle_threshold, system, bin_edges, seed = task
+    _, _, true = simulate_shoes(num_shoes, num_decks, reshuffle_threshold,
+                                rng=np.random.default_rng(seed), system=system)
+    counts, _ = np.histogram(np.clip(true, bin_edges[0], bin_edges[-1]), bins=bin_edges)
+    return TrueCountHistogram(bin_edges, counts.astype(np.int64), num_shoes)
+
+
+def run_monte_carlo(num_shoes, num_decks=1, workers=None, seed=None, system='hilo',
+                    reshuffle_threshold=0.25, bin_edges=DEFAULT_BIN_EDGES, chunk_size=1000):
+    """
+    Simulates num_shoes independent shoes over a process pool and returns the merged
+    TrueCountHistogram.
+
+    The shoes are split into fixed chunks of chunk_size and every chunk gets its own
+    child of SeedSequence(seed), so the result for a given seed does not depend on
+    the number of workers. workers=1 runs everything in the current process.
+    """
+    bin_edges = np.asarray(bin_edges, dtype=float)
+    sizes = [chunk_size] * (num_shoes // chunk_size)
+    if num_shoes % chunk_size:
+        sizes.append(num_shoes % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(size, num_decks, reshuffle_threshold, system, bin_edges, child)
+             for size, child in zip(sizes, seeds)]
+
+    result = TrueCountHistogram(bin_edges, np.zeros(len(bin_edges) - 1, dtype=np.int64))
+    if workers == 1:
+        for chunk in map(_simulate_chunk, tasks):
+            result.merge(chunk)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for chunk in pool.map(_simulate_chunk, tasks):
+                result.merge(chunk)
+    return result
+
+
+def expected_samples(num_shoes, num_decks=1, reshuffle_threshold=0.25):
+    """Number of true-count samples run_monte_carlo records for these settings."""
+    return num_shoes * cards_per_shoe(num_decks, reshuffle_threshold)
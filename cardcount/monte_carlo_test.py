@@ -0,0 +1,37 @@
+#This file contains the tests for the parallel Monte Carlo runner.
+import unittest
+
+import numpy as np
+
+from cardcount.monte_carlo import TrueCountHistogram, expected_samples, run_monte_carlo
+
+
+class MonteCarloTests(unittest.TestCase):
+
+    def test_counts_every_dealt_card(self):
+        result = run_monte_carlo(250, num_decks=2, workers=1, seed=5, chunk_size=100)
+        self.assertEqual(result.num_shoes, 250)
+        self.assertEqual(result.total, expected_samples(250, num_decks=2))
+
+    def test_result_independent_of_worker_count(self):
+        '''
+        Each chunk has its own seed, so the pool must reproduce the serial run exactly.
+        '''
+        serial = run_monte_carlo(300, workers=1, seed=11, chunk_size=50)
+        parallel = run_monte_carlo(300, workers=3, seed=11, chunk_size=50)
+        self.assertTrue(np.array_equal(serial.counts, parallel.counts))
+
+    def test_seeds_change_result(self):
+        first = run_monte_carlo(200, workers=1, seed=1, chunk_size=100)
+        second = run_monte_carlo(200, workers=1, seed=2, chunk_size=100)
+        self.assertFalse(np.array_equal(first.counts, second.counts))
+
+    def test_merge_rejects_different_bins(self):
+        first = TrueCountHistogram(np.array([0.0, 1.0]), np.zeros(1, dtype=np.int64))
+        second = TrueCountHistogram(np.array([0.0, 2.0]), np.zeros(1, dtype=np.int64))
+        with self.assertRaises(ValueError):
+            first.merge(second)
+
+
+if __name__ == "__main__":
+    unittest.main()
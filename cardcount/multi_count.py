@@ -0,0 +1,121 @@
+"""
+Several counting systems and side counts evaluated together in one pass over the cards.
+
+The systems are stacked into a K x 13 tag matrix (one row per count, one column per
+rank code). It is stored transposed, so each card reads one contiguous row of K tags
+and every count moves with a single vector add.
+"""
+import numpy as np
+
+from .core import RANK_CODES, decks_remaining
+from .counting_systems import get_system
+
+# Side counts: how many cards of these ranks have been seen
+SIDE_COUNTS = {
+    'aces': ('Ace',),
+    'fives': ('5',),
+    'sevens': ('7',),
+    'tens': ('10', 'Jack', 'Queen', 'King'),
+}
+
+
+def side_count_tags(ranks):
+    """13-entry tag table that counts 1 for every card of the given ranks."""
+    codes = {RANK_CODES[rank] for rank in ranks}
+    return tuple(1 if code in codes else 0 for code in range(13))
+
+
+class MultiCounter:
+    """
+    Tracks K counts at once: the counting systems first (registry keys or
+    CountingSystem instances), then the side counts (SIDE_COUNTS keys or tuples of
+    rank names). running holds the K running counts in that order.
+
+    For a counting system the true count is the running count per remaining deck,
+    as in CardCounter. For a side count the running count is the number of those
+    cards seen and the true count is their surplus per remaining deck: positive
+    when the rest of the shoe is rich in them (e.g. the ace adjustment).
+    """
+
+    def __init__(self, systems=('hilo',), side_counts=(), num_decks=1, resolution='exact'):
+        self.num_decks = num_decks
+        self.resolution = resolution
+        systems = [get_system(system) for system in systems]
+        sides = [(key, SIDE_COUNTS[key]) if isinstance(key, str) else ('+'.join(key), tuple(key))
+                 for key in side_counts]
+        self.names = tuple([system.name for system in systems] + [name for name, _ in sides])
+        rows = [system.tags for system in systems] + [side_count_tags(ranks) for _, ranks in sides]
+        if not rows:
+            raise ValueError("MultiCounter needs at least one counting system or side count")
+        self.tags = np.array(rows, dtype=np.result_type(*[np.asarray(row).dtype for row in rows]))
+        self._by_rank = np.ascontiguousarray(self.tags.T)
+
+        # true = (offset + sign * running) / decks - base, row by row
+        per_deck = np.array([0] * len(systems) + [4 * len(ranks) for _, ranks in sides], dtype=float)
+        is_side = np.arange(len(rows)) >= len(systems)
+        self._sign = np.where(is_side, -1.0, 1.0)
+        self._offset = per_deck * num_decks
+        self._base = per_deck
+        self._is_side = is_side
+        self.reset()
+
+    def __len__(self):
+        return len(self.names)
+
+    def reset(self):
+        self.running = np.zeros(len(self.names), dtype=self.tags.dtype)
+        self.cards_dealt = 0
+
+    @property
+    def remaining_cards(self):
+        return 52 * self.num_decks - self.cards_dealt
+
+    def _true(self, running, decks):
+        decks = np.asarray(decks, dtype=float)
+        if decks.ndim:
+            decks = decks[:, None]
+        divisor = np.where(decks == 0, 1.0, decks)
+        true = (self._offset + self._sign * running) / divisor - self._base
+        # An empty shoe keeps the running count (true_count_for) and has no side surplus
+        return np.where(decks == 0, np.where(self._is_side, 0.0, running), true)
+
+    def update_code(self, code: int):
+        """Counts one card by its compact code (rank * 4 + suit) and returns the K true counts."""
+        self.running += self._by_rank[code >> 2]
+        self.cards_dealt += 1
+        return self.true_counts()
+
+    def update_count(self, card):
+        """Same as update_code for a Card."""
+        self.running += self._by_rank[RANK_CODES[card.rank]]
+        self.cards_dealt += 1
+        return self.true_counts()
+
+    def true_counts(self, remaining_cards=None):
+        """The K true counts; remaining_cards defaults to the cards not yet counted."""
+        if remaining_cards is None:
+            remaining_cards = self.remaining_cards
+        return self._true(self.running, decks_remaining(remaining_cards, self.resolution))
+
+    def count_codes(self, codes):
+        """
+        Counts a whole stream of card codes in one pass and returns (running, true),
+        both shaped (len(codes), K): row i holds every count after card i. The counter
+        ends in the same state as after calling update_code on each card.
+        """
+        ranks = np.asarray(codes, dtype=np.intp) >> 2
+        running = np.cumsum(self._by_rank[ranks], axis=0, dtype=self.tags.dtype) + self.running
+        remaining = self.remaining_cards - np.arange(1, len(ranks) + 1)
+        if self.resolution == 'exact':
+            decks = remaining / 52.0
+        else:
+            decks = [decks_remaining(cards, self.resolution) for cards in remaining]
+        true = self._true(running, decks)
+        if len(ranks):
+            self.running = running[-1].copy()
+            self.cards_dealt += len(ranks)
+        return running, true
+
+    def as_dict(self):
+        """Running counts by name."""
+        return dict(zip(self.names, self.running.tolist()))
@@ -0,0 +1,73 @@
+#This file contains the tests for the single-pass multi-count tracker.
+import unittest
+
+import numpy as np
+
+from cardcount.core import CardCounter, CardSource, Deck, true_count_for
+from cardcount.counting_systems import COUNTING_SYSTEMS, CountingSystem
+from cardcount.multi_count import MultiCounter, side_count_tags
+
+
+class MultiCounterTests(unittest.TestCase):
+
+    def test_matches_one_card_counter_per_system(self):
+        keys = sorted(COUNTING_SYSTEMS)
+        tracker = MultiCounter(keys, num_decks=2)
+        counters = [CardCounter(num_decks=2, system=key) for key in keys]
+        deck = Deck(num_decks=2, rng=4)
+        for card in CardSource(deck.codes):
+            true = tracker.update_count(card)
+            for i, counter in enumerate(counters):
+                counter.update_count(card)
+                self.assertEqual(tracker.running[i], counter.running_count)
+                remaining = 104 - counter.cards_dealt
+                self.assertAlmostEqual(true[i], counter.true_count(remaining))
+        self.assertEqual(tracker.remaining_cards, 0)
+
+    def test_side_counts(self):
+        tracker = MultiCounter(['hilo'], side_counts=['aces', ('5', '7')], num_decks=1)
+        self.assertEqual(tracker.names, ('Hi-Lo', 'aces', '5+7'))
+        self.assertEqual(side_count_tags(['Ace']), (0,) * 12 + (1,))
+        # Ace of Hearts, five of Spades, King of Clubs
+        for code in (48, 15, 46):
+            true = tracker.update_code(code)
+        self.assertEqual(tracker.as_dict(), {'Hi-Lo': -1, 'aces': 1, '5+7': 1})
+        decks = 49 / 52.0
+        self.assertAlmostEqual(true[0], true_count_for(-1, 49))
+        self.assertAlmostEqual(true[1], 3 / decks - 4)
+        self.assertAlmostEqual(true[2], 7 / decks - 8)
+
+    def test_stream_matches_card_by_card(self):
+        keys = ['hilo', 'zen', 'halves']
+        codes = np.array(Deck(num_decks=1, rng=9).codes)
+        incremental = MultiCounter(keys, ['aces'], resolution='half')
+        expected = np.array([incremental.update_code(int(code)) for code in codes])
+        batch = MultiCounter(keys, ['aces'], resolution='half')
+        running, true = batch.count_codes(codes[:20])
+        running2, true2 = batch.count_codes(codes[20:])
+        self.assertEqual(running.shape, (20, 4))
+        self.assertTrue(np.allclose(np.vstack([true, true2]), expected))
+        self.assertTrue(np.array_equal(batch.running, incremental.running))
+        self.assertTrue(np.array_equal(running2[-1], batch.running))
+
+    def test_empty_shoe(self):
+        # Systems keep the running count (as CardCounter does), side counts have no surplus
+        tracker = MultiCounter(['ko'], ['aces'])
+        _, true = tracker.count_codes(Deck(rng=1).codes)
+        self.assertTrue(np.array_equal(true[-1], [4, 0]))
+
+    def test_scales_to_many_systems(self):
+        rng = np.random.default_rng(1)
+        systems = [CountingSystem(f"random {i}", tuple(rng.integers(-2, 3, 13).tolist())) for i in range(40)]
+        tracker = MultiCounter(systems, side_counts=['aces', 'fives', 'sevens'], num_decks=6)
+        self.assertEqual(tracker.tags.shape, (43, 13))
+        codes = Deck(num_decks=6, rng=2).codes
+        running, _ = tracker.count_codes(codes)
+        ranks = np.array(codes) >> 2
+        self.assertTrue(np.array_equal(running[-1], tracker.tags @ np.bincount(ranks, minlength=13)))
+        with self.assertRaises(ValueError):
+            MultiCounter([])
+
+
+if __name__ == "__main__":
+    unittest.main()
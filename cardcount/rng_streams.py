@@ -0,0 +1,22 @@
+import numpy as np
+
+
+BIT_GENERATORS = {
+    'pcg64': np.random.PCG64,
+    'philox': np.random.Philox,
+}
+
+
+def make_generator(seed=None, bit_generator='pcg64'):
+    """Returns a NumPy Generator on the named bit generator ('pcg64' or 'philox')."""
+    return np.random.Generator(BIT_GENERATORS[bit_generator](seed))
+
+
+def substreams(seed, count, bit_generator='pcg64'):
+    """
+    Returns count independent Generators for parallel workers.
+    Stream i is the seeded bit generator jumped ahead i times, so streams never overlap
+    and stream i is the same no matter how many streams are requested.
+    """
+    base = BIT_GENERATORS[bit_generator](seed)
+    return [np.random.Generator(base.jumped(i)) for i in range(count)]
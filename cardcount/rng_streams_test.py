@@ -0,0 +1,30 @@
+#This file contains the tests for the seeded random number streams.
+import unittest
+
+from cardcount.rng_streams import make_generator, substreams
+from cardcount.core import Deck
+
+
+class RngStreamTests(unittest.TestCase):
+
+    def test_substreams_are_stable_and_distinct(self):
+        for bit_generator in ('pcg64', 'philox'):
+            first = [stream.integers(1 << 30) for stream in substreams(3, 4, bit_generator)]
+            again = [stream.integers(1 << 30) for stream in substreams(3, 2, bit_generator)]
+            self.assertEqual(first[:2], again)
+            self.assertEqual(len(set(first)), 4)
+
+    def test_decks_from_substreams(self):
+        decks = [Deck(num_decks=6, rng=stream) for stream in substreams(9, 3, 'philox')]
+        replay = Deck(num_decks=6, rng=substreams(9, 3, 'philox')[2])
+        self.assertEqual(decks[2].codes, replay.codes)
+        self.assertNotEqual(decks[0].codes, decks[1].codes)
+
+    def test_make_generator(self):
+        self.assertEqual(make_generator(1).random(), make_generator(1).random())
+        with self.assertRaises(KeyError):
+            make_generator(1, 'mt')
+
+
+if __name__ == "__main__":
+    unittest.main()
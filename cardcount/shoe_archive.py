@@ -0,0 +1,150 @@
+"""
+Append-only binary archive of dealt shoes, for audits and regression replays.
+
+Layout: a fixed header followed by one byte per card code (rank * 4 + suit), each
+shoe stored whole in the order it was shuffled. Every shoe has the same size, so
+shoe i starts at HEADER.size + i * shoe_size and the archive can be read as a
+(num_shoes, shoe_size) array straight out of an mmap.
+"""
+import mmap
+import os
+import struct
+
+import numpy as np
+
+from .batch_simulation import cards_per_shoe, count_shoes
+from .core import CardSource
+from .monte_carlo import DEFAULT_BIN_EDGES, TrueCountHistogram
+
+MAGIC = b'CCSHOE'
+VERSION = 1
+HAS_SEED = 1
+# magic, version, flags, decks, seed, counting system name
+HEADER = struct.Struct('<6sBBHq16s')
+
+
+def _pack_header(num_decks, seed, system):
+    name = system.encode('ascii')
+    if len(name) > 16:
+        raise ValueError(f"Counting system name too long for the archive header: {system!r}")
+    flags = HAS_SEED if seed is not None else 0
+    return HEADER.pack(MAGIC, VERSION, flags, num_decks, seed if seed is not None else 0, name)
+
+
+def read_header(f):
+    """Reads the header at the start of an open archive and returns (num_decks, seed, system)."""
+    data = f.read(HEADER.size)
+    if len(data) < HEADER.size:
+        raise ValueError("Not a shoe archive: file is too short")
+    magic, version, flags, num_decks, seed, name = HEADER.unpack(data)
+    if magic != MAGIC:
+        raise ValueError("Not a shoe archive: bad magic bytes")
+    if version != VERSION:
+        raise ValueError(f"Unsupported shoe archive version {version}")
+    return num_decks, seed if flags & HAS_SEED else None, name.rstrip(b'\0').decode('ascii')
+
+
+class ShoeWriter:
+    """
+    Appends shoes to an archive through a buffered file. A new file gets the header;
+    an existing one must have been written with the same decks, seed and system.
+    Pass the writer as a deck's recorder to capture every shoe the deck deals.
+    """
+
+    def __init__(self, path, num_decks=1, seed=None, system='hilo', buffer_size=1 << 20):
+        self.path = path
+        self.num_decks = num_decks
+        self.shoe_size = 52 * num_decks
+        self.shoes_written = 0
+        header = _pack_header(num_decks, seed, system)
+        appending = os.path.exists(path) and os.path.getsize(path) > 0
+        if appending:
+            with open(path, 'rb') as f:
+                if read_header(f) != (num_decks, seed, system):
+                    raise ValueError(f"{path} was recorded with different decks, seed or counting system")
+        self._file = open(path, 'ab', buffering=buffer_size)
+        if not appending:
+            self._file.write(header)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write_shoe(self, codes):
+        """Appends one whole shoe of card codes (any bytes-like object or uint8 array)."""
+        if len(codes) != self.shoe_size:
+            raise ValueError(f"Expected a shoe of {self.shoe_size} cards, got {len(codes)}")
+        self._file.write(codes)
+        self.shoes_written += 1
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class ShoeArchive:
+    """
+    Read-only view of an archive: the shoes are memory-mapped and exposed as a
+    (num_shoes, shoe_size) uint8 array without copying. A partially written last
+    shoe (e.g. after a crash) is ignored.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.num_decks, self.seed, self.system = read_header(f)
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.shoe_size = 52 * self.num_decks
+        num_shoes = (len(self._mmap) - HEADER.size) // self.shoe_size
+        self.shoes = np.frombuffer(self._mmap, dtype=np.uint8, count=num_shoes * self.shoe_size,
+                                   offset=HEADER.size).reshape(num_shoes, self.shoe_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.shoes.shape[0]
+
+    def __getitem__(self, index):
+        return self.shoes[index]
+
+    def source(self, index):
+        """A CardSource replaying shoe index, for the tutorials and automated mode."""
+        return CardSource(self.shoes[index])
+
+    def chunks(self, chunk_size=10000):
+        """Yields consecutive (chunk_size, shoe_size) views of the archive."""
+        for start in range(0, len(self), chunk_size):
+            yield self.shoes[start:start + chunk_size]
+
+    def true_count_histogram(self, reshuffle_threshold=0.25, system=None, bin_edges=DEFAULT_BIN_EDGES,
+                             chunk_size=10000):
+        """
+        Replays every shoe through the batch counting engine, chunk by chunk, and
+        returns the TrueCountHistogram of the true count after each dealt card.
+        """
+        bin_edges = np.asarray(bin_edges, dtype=float)
+        result = TrueCountHistogram(bin_edges, np.zeros(len(bin_edges) - 1, dtype=np.int64))
+        dealt = cards_per_shoe(self.num_decks, reshuffle_threshold)
+        for chunk in self.chunks(chunk_size):
+            # Card codes to rank codes, only for the cards dealt before the reshuffle
+            ranks = chunk[:, :dealt] >> 2
+            _, true = count_shoes(ranks, self.num_decks, reshuffle_threshold, system or self.system)
+            counts, _ = np.histogram(np.clip(true, bin_edges[0], bin_edges[-1]), bins=bin_edges)
+            result.merge(TrueCountHistogram(bin_edges, counts.astype(np.int64), len(chunk)))
+        return result
+
+    def close(self):
+        self.shoes = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Views handed out by __getitem__ or source() still use the mapping;
+            # it is released with the last of them
+            pass
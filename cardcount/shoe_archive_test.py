@@ -0,0 +1,122 @@
+#This file contains the tests for the binary shoe archive.
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from cardcount.batch_simulation import count_shoes
+from cardcount.core import CardCounter, Deck, card_code
+from cardcount.monte_carlo import expected_samples
+from cardcount.shoe_archive import HEADER, ShoeArchive, ShoeWriter
+
+
+class ShoeArchiveTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "shoes.bin")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def record(self, num_shoes, num_decks=2, seed=7):
+        """Deals num_shoes shoes from a recording deck and returns the shoes it shuffled."""
+        shoes = []
+        with ShoeWriter(self.path, num_decks, seed=seed) as writer:
+            deck = Deck(num_decks=num_decks, rng=seed, recorder=writer)
+            shoes.append(bytes(deck.codes))
+            for _ in range(num_shoes - 1):
+                deck.reshuffle()
+                shoes.append(bytes(deck.codes))
+        return shoes
+
+    def test_records_every_shoe_with_header(self):
+        shoes = self.record(3)
+        self.assertEqual(os.path.getsize(self.path), HEADER.size + 3 * 104)
+        with ShoeArchive(self.path) as archive:
+            self.assertEqual((archive.num_decks, archive.seed, archive.system), (2, 7, 'hilo'))
+            self.assertEqual(len(archive), 3)
+            self.assertEqual([bytes(shoe) for shoe in archive.shoes], shoes)
+            # Read straight from the mapping, not copied
+            self.assertFalse(archive.shoes.flags.owndata)
+            self.assertFalse(archive.shoes.flags.writeable)
+
+    def test_appends_only_with_matching_header(self):
+        self.record(2)
+        with ShoeWriter(self.path, 2, seed=7) as writer:
+            writer.write_shoe(np.arange(104, dtype=np.uint8) % 52)
+        with ShoeArchive(self.path) as archive:
+            self.assertEqual(len(archive), 3)
+        with self.assertRaises(ValueError):
+            ShoeWriter(self.path, 2, seed=8)
+        with self.assertRaises(ValueError):
+            ShoeWriter(self.path, 1, seed=7)
+        with ShoeWriter(self.path, 2, seed=7) as writer, self.assertRaises(ValueError):
+            writer.write_shoe(bytes(52))
+
+    def test_partial_last_shoe_is_ignored(self):
+        self.record(2)
+        with open(self.path, 'ab') as f:
+            f.write(bytes(10))
+        with ShoeArchive(self.path) as archive:
+            self.assertEqual(len(archive), 2)
+
+    def test_rejects_other_files(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'not a shoe archive at all, really')
+        with self.assertRaises(ValueError):
+            ShoeArchive(self.path)
+
+    def test_replay_source_matches_the_dealt_shoe(self):
+        deck = Deck(num_decks=1, rng=3)
+        with ShoeWriter(self.path, 1) as writer:
+            writer.write_shoe(deck.codes)
+        dealt = []
+        counter = CardCounter()
+        while deck.remaining_cards:
+            dealt.append(deck.deal_card())
+            counter.update_count(dealt[-1])
+        with ShoeArchive(self.path) as archive:
+            self.assertIsNone(archive.seed)
+            source = archive.source(0)
+            self.assertEqual(source.peek(), dealt[0])
+            replayed = list(source)
+            del source
+        self.assertEqual(replayed, dealt)
+        self.assertEqual([card_code(card) for card in replayed], list(deck.codes))
+
+    def test_interrupted_session_keeps_its_shoes(self):
+        from v_1_1_2_automatedcardcounting import simulate_deal
+        answers = iter(['', '', KeyboardInterrupt])
+
+        def prompt(message):
+            answer = next(answers)
+            if answer is KeyboardInterrupt:
+                raise KeyboardInterrupt
+            return answer
+
+        close = ShoeWriter.close
+        with patch('builtins.input', prompt), \
+                patch.object(ShoeWriter, 'close', autospec=True, side_effect=close) as closed, \
+                self.assertRaises(KeyboardInterrupt):
+            simulate_deal(num_decks=1, record_to=self.path, seed=4)
+        closed.assert_called_once()
+        with ShoeArchive(self.path) as archive:
+            self.assertEqual(len(archive), 1)
+            self.assertEqual(bytes(archive[0]), bytes(Deck(num_decks=1, rng=4).codes))
+
+    def test_histogram_scans_in_chunks(self):
+        self.record(5)
+        with ShoeArchive(self.path) as archive:
+            histogram = archive.true_count_histogram(chunk_size=2)
+            _, true = count_shoes(archive.shoes >> 2, num_decks=2)
+        self.assertEqual(histogram.num_shoes, 5)
+        self.assertEqual(histogram.total, expected_samples(5, num_decks=2))
+        expected, _ = np.histogram(np.clip(true, -20, 20), bins=histogram.bin_edges)
+        self.assertTrue(np.array_equal(histogram.counts, expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
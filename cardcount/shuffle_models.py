@@ -0,0 +1,149 @@
+"""
+Casino shuffle models as vectorized permutations.
+
+Every step takes a (num_shoes, num_cards) array and a NumPy Generator and returns
+the rearranged array, so one call shuffles thousands of shoes at once. The values
+can be rank codes (batch_simulation) or card codes (CompactDeck).
+"""
+from functools import partial
+
+import numpy as np
+
+
+def uniform(shoes, rng):
+    """Perfectly random shuffle of every shoe."""
+    return rng.permuted(shoes, axis=1)
+
+
+def riffle(shoes, rng):
+    """
+    One Gilbert-Shannon-Reeds riffle per shoe: the cut is binomial and every card
+    drops from the top or bottom packet with probability proportional to the packet size.
+    """
+    from_bottom = rng.random(shoes.shape) < 0.5
+    # Positions fed by the top packet come first, each group in order
+    targets = np.argsort(from_bottom, axis=1, kind='stable')
+    out = np.empty_like(shoes)
+    np.put_along_axis(out, targets, shoes, axis=1)
+    return out
+
+
+def strip(shoes, rng, mean_packet=5.0):
+    """Strip cut: peels packets off the top (geometric sizes) and stacks them in reverse order."""
+    starts = rng.random(shoes.shape) < 1.0 / mean_packet
+    starts[:, 0] = False
+    packets = np.cumsum(starts, axis=1)
+    order = np.argsort(-packets, axis=1, kind='stable')
+    return np.take_along_axis(shoes, order, axis=1)
+
+
+def box(shoes, rng, packets=4, jitter=0.05):
+    """Box shuffle: splits each shoe into a few roughly equal packets and reverses their order."""
+    num_cards = shoes.shape[1]
+    edges = np.arange(1, packets) * num_cards / packets
+    edges = edges + rng.normal(0.0, jitter * num_cards, size=(shoes.shape[0], packets - 1))
+    edges = np.sort(np.clip(np.rint(edges), 1, num_cards - 1), axis=1)
+    positions = np.arange(num_cards)
+    packet_ids = (positions[None, :, None] >= edges[:, None, :]).sum(axis=2)
+    order = np.argsort(-packet_ids, axis=1, kind='stable')
+    return np.take_along_axis(shoes, order, axis=1)
+
+
+def cut(shoes, rng, low=0.25, high=0.75):
+    """Cuts each shoe at a uniform position between low and high of the way through."""
+    num_cards = shoes.shape[1]
+    offsets = rng.integers(int(low * num_cards), int(high * num_cards) + 1, size=shoes.shape[0])
+    index = (np.arange(num_cards)[None, :] + offsets[:, None]) % num_cards
+    return np.take_along_axis(shoes, index, axis=1)
+
+
+def _insert_at_random(kept, discards, rng, reserve=0):
+    """
+    Inserts each row of discards among the same row of kept, every card at an
+    independent uniform position after the first reserve kept cards. Kept card i
+    sorts under key i and a discard going in before kept card p under a key in
+    (p - 1, p), so one stable argsort per row does all the insertions.
+    """
+    num_kept = kept.shape[1]
+    low = min(reserve, num_kept)
+    positions = rng.integers(low, num_kept + 1, size=discards.shape)
+    keys = np.concatenate([np.broadcast_to(np.arange(num_kept, dtype=float), kept.shape),
+                           positions - 1 + rng.random(discards.shape)], axis=1)
+    order = np.argsort(keys, axis=1, kind='stable')
+    return np.take_along_axis(np.concatenate([kept, discards], axis=1), order, axis=1)
+
+
+def csm(shoes, rng, dealt=13, reserve=0):
+    """
+    One round through a continuous shuffling machine: the first dealt cards of every
+    shoe are played and go back in at random positions among the cards still in the
+    machine, never into the reserve of cards already staged for dealing.
+    """
+    return _insert_at_random(shoes[:, dealt:], shoes[:, :dealt], rng, reserve)
+
+
+def in_zones(step, zone_size):
+    """Applies step to consecutive zones of zone_size cards instead of the whole shoe."""
+    def zoned(shoes, rng):
+        num_shoes, num_cards = shoes.shape
+        if num_cards % zone_size:
+            raise ValueError(f"Shoe of {num_cards} cards does not split into zones of {zone_size}")
+        return step(shoes.reshape(-1, zone_size), rng).reshape(num_shoes, num_cards)
+    return zoned
+
+
+class ShuffleProcedure:
+    """A sequence of shuffle steps applied in order, e.g. riffle, riffle, strip, riffle, cut."""
+
+    def __init__(self, *steps):
+        self.steps = steps
+
+    def __call__(self, shoes, rng=None):
+        rng = np.random.default_rng(rng)
+        shoes = np.array(shoes, copy=True)
+        if shoes.ndim == 1:
+            return self(shoes[None, :], rng)[0]
+        for step in self.steps:
+            shoes = step(shoes, rng)
+        return shoes
+
+
+def continuous_shuffle(rounds, dealt=13, reserve=0):
+    """rounds rounds of play through a continuous shuffling machine, as a ShuffleProcedure."""
+    return ShuffleProcedure(*[partial(csm, dealt=dealt, reserve=reserve)] * rounds)
+
+
+UNIFORM = ShuffleProcedure(uniform)
+# Typical hand shuffle: riffle, riffle, strip, riffle, then the player cut
+HAND_SHUFFLE = ShuffleProcedure(riffle, riffle, strip, riffle, cut)
+# Multi-deck shoes are riffled in half-deck zones before the box and cut
+SHOE_SHUFFLE = ShuffleProcedure(in_zones(riffle, 26), in_zones(riffle, 26), box,
+                                in_zones(partial(strip, mean_packet=4.0), 26), cut)
+
+
+class ContinuousShufflingMachine:
+    """
+    One continuous shuffling machine dealt interactively: discards go back in at random
+    positions among the cards still in the machine, except the reserve of cards already
+    staged for dealing. Use csm / continuous_shuffle to simulate many machines at once.
+    """
+
+    def __init__(self, num_decks=1, rng=None, reserve=0):
+        self.rng = np.random.default_rng(rng)
+        self.reserve = reserve
+        self.cards = self.rng.permutation(np.tile(np.arange(52, dtype=np.uint8), num_decks))
+
+    def __len__(self):
+        return self.cards.size
+
+    def deal(self, count=1):
+        """Removes and returns the next count card codes."""
+        if count > self.cards.size:
+            raise ValueError("No cards left in the deck!")
+        dealt, self.cards = self.cards[:count], self.cards[count:]
+        return dealt
+
+    def reinsert(self, discards):
+        """Puts the discards back at independent uniform positions after the reserve."""
+        discards = np.asarray(discards, dtype=self.cards.dtype)
+        self.cards = _insert_at_random(self.cards[None, :], discards[None, :], self.rng, self.reserve)[0]
@@ -0,0 +1,87 @@
+#This file contains the tests for the casino shuffle models.
+import unittest
+
+import numpy as np
+
+from cardcount.batch_simulation import simulate_shoes
+from cardcount.shuffle_models import (HAND_SHUFFLE, SHOE_SHUFFLE, ContinuousShufflingMachine, ShuffleProcedure, box,
+                                      continuous_shuffle, csm, cut, in_zones, riffle, strip)
+
+
+def ordered(num_shoes, num_cards):
+    return np.tile(np.arange(num_cards), (num_shoes, 1))
+
+
+class ShuffleModelTests(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(2)
+
+    def assert_permutations(self, shoes, num_cards):
+        self.assertTrue(np.array_equal(np.sort(shoes, axis=1), ordered(len(shoes), num_cards)))
+
+    def test_steps_are_permutations(self):
+        for step in (riffle, strip, box, cut, in_zones(riffle, 26)):
+            self.assert_permutations(step(ordered(50, 104), self.rng), 104)
+
+    def test_riffle_interleaves_two_increasing_packets(self):
+        shoes = riffle(ordered(200, 52), self.rng)
+        for shoe in shoes:
+            # each packet keeps its order, so card positions rise with at most one descent (the cut)
+            positions = np.argsort(shoe)
+            self.assertLessEqual(np.sum(np.diff(positions) < 0), 1)
+        cuts = (shoes[:, 0] == 0).mean()
+        self.assertTrue(0.4 < cuts < 0.6)
+
+    def test_strip_with_single_card_packets_reverses(self):
+        shoes = strip(ordered(3, 52), self.rng, mean_packet=1.0)
+        self.assertTrue(np.array_equal(shoes, ordered(3, 52)[:, ::-1]))
+
+    def test_cut_rotates(self):
+        shoe = cut(ordered(1, 52), self.rng)[0]
+        self.assertTrue(np.array_equal(np.diff(shoe) % 52, np.ones(51)))
+
+    def test_procedures_on_single_shoe(self):
+        shoe = HAND_SHUFFLE(np.arange(52), rng=1)
+        self.assertEqual(shoe.shape, (52,))
+        self.assertTrue(np.array_equal(shoe, HAND_SHUFFLE(np.arange(52), rng=1)))
+        self.assert_permutations(SHOE_SHUFFLE(ordered(10, 312), rng=1), 312)
+        with self.assertRaises(ValueError):
+            ShuffleProcedure(in_zones(riffle, 26))(ordered(1, 40))
+
+    def test_batch_engine_accepts_procedure(self):
+        shoes, running, _ = simulate_shoes(20, num_decks=6, rng=3, shuffle=SHOE_SHUFFLE, reshuffle_threshold=0.0)
+        self.assertTrue(np.all(np.bincount(shoes.ravel(), minlength=13) == 20 * 24))
+        self.assertTrue(np.all(running[:, -1] == 0))
+
+    def test_batched_csm_round(self):
+        shoes = csm(ordered(2000, 52), self.rng, dealt=10, reserve=5)
+        self.assert_permutations(shoes, 52)
+        # Undealt cards keep their order and the staged reserve stays on top
+        self.assertTrue(np.all(shoes[:, :5] == np.arange(10, 15)))
+        kept = shoes[shoes >= 10].reshape(2000, 42)
+        self.assertTrue(np.all(np.diff(kept, axis=1) > 0))
+        # Each discard lands in one of the 38 gaps after the reserve with equal probability
+        positions = np.argwhere(shoes < 10)[:, 1]
+        self.assertAlmostEqual(positions.mean(), 5 + 37 / 2 + 4.5, delta=0.5)
+
+    def test_batch_engine_accepts_csm(self):
+        shoes, _, _ = simulate_shoes(50, num_decks=2, rng=4, shuffle=continuous_shuffle(6, dealt=20, reserve=8))
+        self.assertEqual(shoes.shape, (50, 104))
+        self.assertTrue(np.all(np.bincount(shoes.ravel(), minlength=13) == 50 * 8))
+
+    def test_csm_conserves_cards(self):
+        machine = ContinuousShufflingMachine(num_decks=2, rng=5, reserve=10)
+        dealt = machine.deal(30)
+        self.assertEqual(len(machine), 74)
+        staged = machine.cards[:10].copy()
+        machine.reinsert(dealt)
+        self.assertEqual(len(machine), 104)
+        self.assertTrue(np.array_equal(machine.cards[:10], staged))
+        self.assertTrue(np.array_equal(np.sort(machine.cards), np.repeat(np.arange(52), 2)))
+        with self.assertRaises(ValueError):
+            machine.deal(105)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+import math
+from abc import ABC, abstractmethod
+
+
+class CountSink(ABC):
+    """Receives every dealt card with the running and true count after it."""
+
+    @abstractmethod
+    def push(self, card, running_count, true_count):
+        """Called once per dealt card."""
+
+    def summary(self):
+        return ""
+
+
+class PrintSink(CountSink):
+    """Prints one line per card, the way automated_mode used to."""
+
+    def push(self, card, running_count, true_count):
+        print(f"Dealt {str(card):20} | Running Count: {running_count:3} | True Count: {true_count:5.2f}")
+
+
+class RunningStats:
+    """Online mean and variance (Welford's algorithm)."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def push(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+    @property
+    def variance(self):
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+
+class FixedHistogram:
+    """Histogram with equal-width bins over [low, high); values outside go to the end bins."""
+
+    def __init__(self, low=-10.0, high=10.0, bin_width=0.5):
+        self.low = low
+        self.bin_width = bin_width
+        self.counts = [0] * int(round((high - low) / bin_width))
+
+    def push(self, value):
+        index = int((value - self.low) // self.bin_width)
+        self.counts[min(max(index, 0), len(self.counts) - 1)] += 1
+
+    def bins(self):
+        """Yields (bin start, count) for every bin."""
+        for index, count in enumerate(self.counts):
+            yield self.low + index * self.bin_width, count
+
+
+class P2Quantile:
+    """
+    Constant-memory estimate of one quantile (the P-square algorithm by Jain and Chlamtac).
+    Keeps five markers whose heights are adjusted as values stream in.
+    """
+
+    def __init__(self, quantile):
+        self.quantile = quantile
+        self._heights = []
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0, 2 * quantile, 4 * quantile, 2 + 2 * quantile, 4]
+        self._increments = [0, quantile / 2, quantile, (1 + quantile) / 2, 1]
+
+    def push(self, value):
+        heights = self._heights
+        if len(heights) < 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while value >= heights[cell + 1]:
+                cell += 1
+
+        positions = self._positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in range(1, 4):
+            offset = self._desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or \
+                    (offset <= -1 and positions[i - 1] - positions[i] < -1):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = heights[i] + step * (heights[i + step] - heights[i]) / (positions[i + step] - positions[i])
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i, step):
+        q, n = self._heights, self._positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+
+    @property
+    def value(self):
+        heights = self._heights
+        if not heights:
+            return math.nan
+        if len(heights) < 5:
+            return heights[min(int(self.quantile * len(heights)), len(heights) - 1)]
+        return heights[2]
+
+
+class TrueCountStatistics(CountSink):
+    """
+    Aggregates the true count in constant memory: a fixed-bin histogram,
+    mean/variance and a set of streaming percentiles.
+    """
+
+    def __init__(self, low=-10.0, high=10.0, bin_width=0.5, quantiles=(0.05, 0.25, 0.5, 0.75, 0.95)):
+        self.histogram = FixedHistogram(low, high, bin_width)
+        self.stats = RunningStats()
+        self.quantiles = {quantile: P2Quantile(quantile) for quantile in quantiles}
+        self.final_running_count = 0
+
+    def push(self, card, running_count, true_count):
+        self.histogram.push(true_count)
+        self.stats.push(true_count)
+        for estimator in self.quantiles.values():
+            estimator.push(true_count)
+        self.final_running_count = running_count
+
+    def percentile(self, quantile):
+        return self.quantiles[quantile].value
+
+    def summary(self):
+        percentiles = ", ".join(f"p{quantile * 100:g}={estimator.value:.2f}"
+                                for quantile, estimator in self.quantiles.items())
+        return (f"Cards: {self.stats.count} | True Count mean {self.stats.mean:.2f}, "
+                f"sd {self.stats.std:.2f}, min {self.stats.minimum:.2f}, max {self.stats.maximum:.2f}\n"
+                f"Percentiles: {percentiles}")
@@ -0,0 +1,71 @@
+#This file contains the tests for the streaming true count statistics.
+import io
+import random
+import statistics
+import unittest
+from contextlib import redirect_stdout
+
+from cardcount.stats_sinks import CountSink, FixedHistogram, P2Quantile, PrintSink, RunningStats, TrueCountStatistics
+
+
+class StreamingStatisticsTests(unittest.TestCase):
+
+    def test_running_stats_match_statistics_module(self):
+        values = [random.uniform(-5, 5) for _ in range(1000)]
+        stats = RunningStats()
+        for value in values:
+            stats.push(value)
+        self.assertAlmostEqual(stats.mean, statistics.mean(values))
+        self.assertAlmostEqual(stats.variance, statistics.variance(values))
+        self.assertEqual(stats.minimum, min(values))
+
+    def test_histogram_clamps_to_end_bins(self):
+        histogram = FixedHistogram(low=-1.0, high=1.0, bin_width=0.5)
+        for value in (-7.0, -0.75, 0.0, 0.49, 0.5, 3.0):
+            histogram.push(value)
+        self.assertEqual(histogram.counts, [2, 0, 2, 2])
+        self.assertEqual(next(histogram.bins()), (-1.0, 2))
+
+    def test_p2_quantile_close_to_exact(self):
+        rng = random.Random(4)
+        values = [rng.gauss(0, 2) for _ in range(20000)]
+        for quantile in (0.1, 0.5, 0.9):
+            estimator = P2Quantile(quantile)
+            for value in values:
+                estimator.push(value)
+            exact = sorted(values)[int(quantile * len(values))]
+            self.assertAlmostEqual(estimator.value, exact, delta=0.1)
+
+    def test_p2_quantile_with_few_values(self):
+        estimator = P2Quantile(0.5)
+        for value in (3, 1, 2):
+            estimator.push(value)
+        self.assertEqual(estimator.value, 2)
+
+    def test_true_count_statistics_summary(self):
+        sink = TrueCountStatistics()
+        for index in range(100):
+            sink.push("card", index, index / 10)
+        self.assertEqual(sink.final_running_count, 99)
+        self.assertAlmostEqual(sink.stats.mean, 4.95)
+        self.assertIn("Cards: 100", sink.summary())
+
+    def test_print_sink(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            PrintSink().push("5 of Hearts", 1, 1.02)
+        self.assertEqual(output.getvalue(), f"Dealt {'5 of Hearts':20} | Running Count:   1 | True Count:  1.02\n")
+
+    def test_sinks_must_implement_push(self):
+        with self.assertRaises(TypeError):
+            CountSink()
+
+        class Quiet(CountSink):
+            def push(self, card, running_count, true_count):
+                pass
+
+        self.assertEqual(Quiet().summary(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
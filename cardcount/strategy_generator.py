@@ -0,0 +1,197 @@
+"""
+Basic strategy computed from the rules instead of pasted in as a chart.
+
+For every dealer upcard and every two-card player hand, the expected value of
+standing, hitting, doubling, splitting and surrendering is computed against the
+shoe with the upcard and both player cards removed: the dealer's final totals come
+from DealerOutcomeEngine (exact, without replacement) and the player's draws are
+taken from that same composition. The hands are then weighted by how likely they
+are to be dealt and folded into HARD_CHART / SOFT_CHART / PAIR_CHART style charts,
+one best action per (total, soft, upcard).
+
+Generated charts are saved in a JSON disk cache keyed by the rules that change the
+strategy, so a rule set is only ever computed once.
+"""
+import json
+import os
+
+from .blackjack import BasicStrategy, Rules
+from .dealer_probabilities import ACE, BUST, TEN, DealerOutcomeEngine, _add_card
+
+# Bump when the generator changes so stale cache files are recomputed
+CACHE_VERSION = 1
+
+# Rank code of each card value index (2-9, ten, ace) for DealerOutcomeEngine
+_VALUE_RANKS = (0, 1, 2, 3, 4, 5, 6, 7, 8, 12)
+
+
+def _remove(counts, *values):
+    counts = list(counts)
+    for value in values:
+        counts[value] -= 1
+    return tuple(counts)
+
+
+class HandEV:
+    """
+    Player EVs for one starting composition and one dealer outcome distribution.
+    hit() is memoized per (total, soft), since every draw uses the same composition.
+    """
+
+    def __init__(self, counts, dealer):
+        cards = sum(counts)
+        self.draws = tuple((value, count / cards) for value, count in enumerate(counts) if count)
+        self.dealer = dealer
+        self._hit = {}
+
+    def stand(self, total):
+        if total > 21:
+            return -1.0
+        dealer = self.dealer
+        bust = dealer[BUST]
+        if total < 17:
+            return bust - (1.0 - bust)
+        # dealer[0:5] are the final totals 17-21
+        win = bust + sum(dealer[:total - 17])
+        lose = sum(dealer[total - 16:5])
+        return win - lose
+
+    def best(self, total, soft):
+        """EV of playing on with (total, soft) by standing or hitting, whichever is better."""
+        if total >= 21:
+            return self.stand(total)
+        return max(self.stand(total), self.hit(total, soft))
+
+    def hit(self, total, soft):
+        key = (total, soft)
+        if key not in self._hit:
+            self._hit[key] = sum(probability * self.best(*_add_card(total, soft, value))
+                                 for value, probability in self.draws)
+        return self._hit[key]
+
+    def double(self, total, soft):
+        return 2 * sum(probability * self.stand(_add_card(total, soft, value)[0])
+                       for value, probability in self.draws)
+
+    def split(self, value, rules):
+        """EV of splitting a pair of value (both hands, no resplits)."""
+        start = _add_card(0, False, value)
+        one_hand = 0.0
+        for drawn, probability in self.draws:
+            total, soft = _add_card(*start, drawn)
+            if value == ACE and not rules.hit_split_aces:
+                ev = self.stand(total)
+            else:
+                ev = self.best(total, soft)
+                if rules.double_after_split and total < 21:
+                    ev = max(ev, self.double(total, soft))
+            one_hand += probability * ev
+        return 2 * one_hand
+
+
+def _chart_action(evs):
+    """Chart character of the best action in a {'S', 'H', 'D', 'R'} EV dict."""
+    action = max(evs, key=evs.get)
+    if action in 'DR':
+        # Fallback when doubling or surrendering is not allowed
+        hit = evs['H'] >= evs['S']
+        return {'D': 'D' if hit else 'd', 'R': 'R' if hit else 'r'}[action]
+    return action
+
+
+class StrategyGenerator:
+    """Computes basic strategy charts for a Rules instance."""
+
+    def __init__(self, rules=Rules()):
+        self.rules = rules
+        self.engine = DealerOutcomeEngine(rules.dealer_hits_soft_17, peek=True, maxsize=None)
+        decks = rules.num_decks
+        self.shoe = (4 * decks,) * 8 + (16 * decks, 4 * decks)
+
+    def dealer_outcomes(self, counts, upcard):
+        """Dealer OUTCOMES for a card value composition and upcard value index."""
+        composition = counts[:8] + (counts[TEN], 0, 0, 0, counts[ACE])
+        return self.engine.outcomes(composition, _VALUE_RANKS[upcard])
+
+    def hand_evs(self, first, second, upcard):
+        """
+        EV of each allowed action for a two-card hand (card value indexes) against
+        the upcard: 'S', 'H', 'D', 'R' if surrender is allowed and 'P' for pairs.
+        """
+        counts = _remove(self.shoe, upcard, first, second)
+        hand = HandEV(counts, self.dealer_outcomes(counts, upcard))
+        total, soft = _add_card(*_add_card(0, False, first), second)
+        evs = {'S': hand.stand(total), 'H': hand.hit(total, soft), 'D': hand.double(total, soft)}
+        if self.rules.surrender:
+            evs['R'] = -0.5
+        if first == second:
+            evs['P'] = hand.split(first, self.rules)
+        return evs
+
+    def charts(self):
+        """Returns {'hard': ..., 'soft': ..., 'pair': ...} in the blackjack chart format."""
+        columns = {'hard': {}, 'soft': {}, 'pair': {}}
+        for upcard in range(10):
+            remaining = _remove(self.shoe, upcard)
+            cards = sum(remaining)
+            cells = {}
+            for first in range(10):
+                for second in range(first, 10):
+                    total, soft = _add_card(*_add_card(0, False, first), second)
+                    if total == 21:
+                        continue  # blackjack, settled before any decision
+                    weight = remaining[first] / cards * (remaining[second] - (first == second)) / (cards - 1)
+                    if first != second:
+                        weight *= 2
+                    evs = self.hand_evs(first, second, upcard)
+                    if first == second:
+                        split = evs.pop('P')
+                        action = 'P' if split > max(evs.values()) else _chart_action(evs)
+                        columns['pair'].setdefault(1 if first == ACE else _VALUE_RANKS[first] + 2, []).append(action)
+                    cell = cells.setdefault(('soft' if soft else 'hard', total), dict.fromkeys(evs, 0.0))
+                    for action, ev in evs.items():
+                        cell[action] += weight * ev
+            for (name, total), evs in cells.items():
+                columns[name].setdefault(total, []).append(_chart_action(evs))
+            columns['hard'].setdefault(21, []).append('S')
+            columns['soft'].setdefault(21, []).append('S')
+        return {name: {total: ''.join(row) for total, row in sorted(rows.items())}
+                for name, rows in columns.items()}
+
+
+def cache_key(rules):
+    """File name of the cached charts for the rules that change basic strategy."""
+    return (f"strategy-v{CACHE_VERSION}-{rules.num_decks}d"
+            f"-{'h17' if rules.dealer_hits_soft_17 else 's17'}"
+            f"-{'das' if rules.double_after_split else 'nodas'}"
+            f"-{'ls' if rules.surrender else 'nols'}"
+            f"-{'hsa' if rules.hit_split_aces else 'nohsa'}.json")
+
+
+def default_cache_dir():
+    return os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'cardcount')
+
+
+def cached_charts(rules=Rules(), cache_dir=None):
+    """Charts for rules from the disk cache, generating and saving them on a miss."""
+    path = os.path.join(cache_dir or default_cache_dir(), cache_key(rules))
+    try:
+        with open(path) as f:
+            data = json.load(f)
+        return {name: {int(total): row for total, row in chart.items()} for name, chart in data.items()}
+    except (OSError, ValueError):
+        pass
+    charts = StrategyGenerator(rules).charts()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Write then rename, so a concurrent reader never sees half a file
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, 'w') as f:
+        json.dump(charts, f, indent=1)
+    os.replace(temporary, path)
+    return charts
+
+
+def generated_strategy(rules=Rules(), cache_dir=None):
+    """A BasicStrategy built from the generated (cached) charts for rules."""
+    charts = cached_charts(rules, cache_dir)
+    return BasicStrategy(rules, charts['hard'], charts['soft'], charts['pair'], h17_changes={})
@@ -0,0 +1,87 @@
+#This file contains the tests for the basic strategy generator.
+import os
+import tempfile
+import unittest
+
+from cardcount.blackjack import (HARD_CHART, H17_CHANGES, PAIR_CHART, SOFT_CHART, BasicStrategy, BlackjackTable,
+                                 Rules)
+from cardcount.strategy_generator import HandEV, StrategyGenerator, cache_key, cached_charts, generated_strategy
+
+
+class HandEVTests(unittest.TestCase):
+
+    def test_stand(self):
+        # Dealer ends on 17-21 or busts with these probabilities
+        hand = HandEV((4,) * 8 + (16, 4), (0.1, 0.1, 0.2, 0.2, 0.1, 0.3))
+        self.assertAlmostEqual(hand.stand(16), 0.3 - 0.7)
+        self.assertAlmostEqual(hand.stand(17), 0.3 - 0.6)
+        self.assertAlmostEqual(hand.stand(19), 0.5 - 0.3)
+        self.assertAlmostEqual(hand.stand(21), 0.9)
+        self.assertEqual(hand.stand(22), -1.0)
+        # Hitting hard 21 would always bust, so playing on means standing
+        self.assertAlmostEqual(hand.best(21, False), 0.9)
+
+
+class StrategyGeneratorTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.s17 = StrategyGenerator(Rules(num_decks=6)).charts()
+        cls.h17 = StrategyGenerator(Rules(num_decks=6, dealer_hits_soft_17=True, surrender=True)).charts()
+
+    def test_reproduces_the_s17_charts(self):
+        self.assertEqual(self.s17['hard'], {**HARD_CHART, 15: 'SSSSSHHHHH', 16: 'SSSSSHHHHH'})
+        # Soft 12 is only dealt as a pair of aces, which are always split
+        self.assertEqual({total: row for total, row in self.s17['soft'].items() if total != 12},
+                         {total: row for total, row in SOFT_CHART.items() if total != 12})
+        for value, row in PAIR_CHART.items():
+            self.assertEqual([action == 'P' for action in self.s17['pair'][value]],
+                             [action in 'Pp' for action in row])
+
+    def test_h17_and_surrender(self):
+        for (name, total, column), action in H17_CHANGES.items():
+            self.assertEqual(self.h17[name][total][column], action)
+        self.assertEqual(self.h17['hard'][15][7:], 'HRR')
+        self.assertEqual(self.h17['hard'][16][7:], 'RRR')
+
+    def test_hand_evs(self):
+        evs = StrategyGenerator(Rules(num_decks=6)).hand_evs(8, 8, 4)
+        self.assertGreater(evs['S'], evs['P'])
+        self.assertNotIn('R', evs)
+        evs = StrategyGenerator(Rules(num_decks=6, surrender=True)).hand_evs(8, 4, 8)
+        self.assertEqual(max(evs, key=evs.get), 'R')
+
+
+class StrategyCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_charts_are_cached_per_rules(self):
+        rules = Rules(num_decks=1)
+        charts = cached_charts(rules, self.directory.name)
+        path = os.path.join(self.directory.name, cache_key(rules))
+        self.assertTrue(os.path.exists(path))
+        self.assertNotEqual(cache_key(rules), cache_key(Rules(num_decks=1, surrender=True)))
+        self.assertEqual(cache_key(rules), cache_key(Rules(num_decks=1, penetration=0.5)))
+        self.assertEqual(cached_charts(rules, self.directory.name), charts)
+        # A corrupt file is regenerated
+        with open(path, 'w') as f:
+            f.write("{")
+        self.assertEqual(cached_charts(rules, self.directory.name), charts)
+
+    def test_generated_strategy_plays(self):
+        rules = Rules(num_decks=1, dealer_hits_soft_17=True)
+        strategy = generated_strategy(rules, self.directory.name)
+        self.assertIsInstance(strategy, BasicStrategy)
+        # The generated H17 chart is used as-is, without the S17 -> H17 patch
+        self.assertEqual(strategy.charts['hard'], cached_charts(rules, self.directory.name)['hard'])
+        results = BlackjackTable(rules, strategy=strategy, rng=5).simulate(2000)
+        self.assertEqual(results.total_rounds, 2000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,16 +1,11 @@
-import random
-import matplotlib.pyplot as plt
-from collections import deque
+import os
 
-# Card values for Hi-Lo counting system
-HI_LO_VALUES = {
-    '2': 1, '3': 1, '4': 1, '5': 1, '6': 1,
-    '7': 0, '8': 0, '9': 0,
-    '10': -1, 'J': -1, 'Q': -1, 'K': -1, 'A': -1
-}
+from cardcount import CardSource, decks_remaining, get_system
+from cardcount.accuracy_tracker import AccuracyTracker
+from cardcount.chart_renderer import AccuracyChartRenderer
 
-# Standard 52-card deck
-DECK = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A'] * 4
+# Card values for Hi-Lo counting system
+HI_LO = get_system('hilo')
 
 
 def get_true_count(running_count, decks_remaining):
@@ -18,53 +13,27 @@ def get_true_count(running_count, decks_remaining):
     return round(running_count / decks_remaining, 2) if decks_remaining > 0 else running_count
 
 
-def plot_accuracy(attempts, window_size=10):
-    """Plots the running accuracy of user's counting attempts."""
-    plt.figure(figsize=(10, 6))
-    
-    # Calculate running accuracy
-    correct_counts = [1 if result else 0 for result in attempts]
-    running_accuracy = []
-    window = deque(maxlen=window_size)
-    
-    for count in correct_counts:
-        window.append(count)
-        running_accuracy.append(sum(window) / len(window) * 100)
-    
-    plt.plot(range(1, len(running_accuracy) + 1), running_accuracy, 'b-', label='Running Accuracy')
-    plt.axhline(y=100, color='g', linestyle='--', label='Perfect Accuracy')
-    
-    plt.title('Card Counting Accuracy Over Time')
-    plt.xlabel('Number of Attempts')
-    plt.ylabel('Accuracy (%)')
-    plt.legend()
-    plt.grid(True)
-    
-    # Save the plot
-    plt.savefig(f"plots\+counting_accuracy{len(attempts)}.png")
-    plt.close()
+def plot_accuracy(tracker, path=os.path.join("plots", "counting_accuracy.png")):
+    """Plots the running accuracy of user's counting attempts, as recorded by an AccuracyTracker."""
+    with AccuracyChartRenderer(path) as renderer:
+        renderer.submit(tracker.history)
 
 
-def tutorial_mode(deck_count=1):
-    """Runs a step-by-step tutorial for card counting."""
-    deck = DECK * deck_count  # Adjust for multiple decks
-    random.shuffle(deck)
+def tutorial_mode(deck_count=1, source=None):
+    """Runs a step-by-step tutorial for card counting over source, by default a freshly shuffled shoe."""
+    shoe = source if source is not None else CardSource.shuffled(deck_count)  # Adjust for multiple decks
     running_count = 0
-    cards_seen = 0
-    total_cards = len(deck)
-    decks_remaining = deck_count
-    attempts = []  # Track correct/incorrect attempts
+    attempts = AccuracyTracker()  # Track correct/incorrect attempts
+    renderer = AccuracyChartRenderer(os.path.join("plots", "counting_accuracy.png"))
 
     print("Welcome to the Blackjack Card Counting Tutorial!")
     print("We will go through each card one by one. Enter the correct count after each card.")
     print("Press 'q' to quit the tutorial at any time.\n")
 
-    while deck:
-        card = deck.pop(0)
-        cards_seen += 1
-        running_count += HI_LO_VALUES[card]
-        decks_remaining = max(1, round((total_cards - cards_seen) / 52))  # Approximate decks left
-        true_count = get_true_count(running_count, decks_remaining)
+    for card in shoe:
+        value = HI_LO.tag(card.rank)
+        running_count += value
+        true_count = get_true_count(running_count, decks_remaining(shoe.remaining_cards, 'full'))  # Approximate decks left
 
         print(f"Card drawn: {card}")
         user_input = input("Enter the running count: ")
@@ -76,35 +45,31 @@ def tutorial_mode(deck_count=1):
         try:
             user_count = int(user_input)
             is_correct = user_count == running_count
-            attempts.append(is_correct)
+            attempts.record(is_correct)
             
             if is_correct:
                 print("✅ Correct! The count is updated.")
             else:
                 print(f"❌ Incorrect. The correct running count is {running_count}.")
-                print(f"Explanation: {card} has a value of {HI_LO_VALUES[card]}, so the new count is {running_count}.")
+                print(f"Explanation: {card} has a value of {value}, so the new count is {running_count}.")
         except ValueError:
             print("❌ Invalid input. Please enter a number.")
-            attempts.append(False)
+            attempts.record(False)
 
         print(f"Current True Count: {true_count}\n")
 
-        # Plot accuracy every attempt
-        print(f"plots\counting_accuracy{len(attempts)}.png", f"plots\counting_accuracy{len(attempts)}.png")
-        if len(attempts) % 1 == 0:
-            plot_accuracy(attempts)
-            current_accuracy = sum(attempts[-10:]) / min(10, len(attempts)) * 100
-            print(f"Your recent accuracy: {current_accuracy:.1f}%")
+        # Redraw the chart in the background; bursts of answers are coalesced
+        renderer.submit(attempts.history)
+        print(f"Your recent accuracy: {attempts.recent_accuracy:.1f}%")
 
     print("Tutorial complete! You've gone through the deck.")
     
     # Final accuracy plot
+    renderer.close()
     if attempts:
-        plot_accuracy(attempts)
-        final_accuracy = sum(attempts) / len(attempts) * 100
         print(f"\nFinal Statistics:")
         print(f"Total attempts: {len(attempts)}")
-        print(f"Overall accuracy: {final_accuracy:.1f}%")
+        print(f"Overall accuracy: {attempts.overall_accuracy:.1f}%")
 
 
 if __name__ == "__main__":
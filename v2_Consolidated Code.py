@@ -1,118 +1,40 @@
 #Consolidated Code
-import random
-import matplotlib.pyplot as plt
-from collections import deque
-from dataclasses import dataclass
+from cardcount import CardCounter, Deck, get_system, true_count_for
+from cardcount.accuracy_tracker import AccuracyTracker
+from cardcount.chart_renderer import AccuracyChartRenderer
+from cardcount.stats_sinks import PrintSink, TrueCountStatistics
 
 # Card values for Hi-Lo counting system
-HI_LO_VALUES = {
-    '2': 1, '3': 1, '4': 1, '5': 1, '6': 1,
-    '7': 0, '8': 0, '9': 0,
-    '10': -1, 'J': -1, 'Q': -1, 'K': -1, 'A': -1
-}
-
-# Standard 52-card deck
-DECK = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A'] * 4
-
-@dataclass
-class Card:
-    suit: str
-    rank: str
-
-    def __str__(self):
-        return f"{self.rank} of {self.suit}"
-
-class Deck:
-    suits = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
-    ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'Jack', 'Queen', 'King', 'Ace']
-    
-    def __init__(self, num_decks=1):
-        self.num_decks = num_decks
-        self.cards = []
-        for _ in range(num_decks):
-            for suit in self.suits:
-                for rank in self.ranks:
-                    self.cards.append(Card(suit, rank))
-        self.shuffle()
-
-    def shuffle(self):
-        random.shuffle(self.cards)
-
-    def deal_card(self):
-        if len(self.cards) == 0:
-            return None
-        return self.cards.pop()
-
-class CardCounter:
-    def __init__(self, num_decks=1):
-        self.running_count = 0
-        self.num_decks = num_decks
-        self.cards_dealt = 0
-
-    def update_count(self, card: Card):
-        if card.rank in ['2', '3', '4', '5', '6']:
-            self.running_count += 1
-        elif card.rank in ['10', 'Jack', 'Queen', 'King', 'Ace']:
-            self.running_count -= 1
-        self.cards_dealt += 1
-
-    def true_count(self, remaining_cards: int) -> float:
-        remaining_decks = remaining_cards / 52.0
-        if remaining_decks == 0:
-            return self.running_count
-        return self.running_count / remaining_decks
-
-    def reset(self):
-        self.running_count = 0
-        self.cards_dealt = 0
-
-
-def get_true_count(running_count, decks_remaining):
-    return round(running_count / decks_remaining, 2) if decks_remaining > 0 else running_count
-
-
-def plot_accuracy(attempts, window_size=10):
-    plt.figure(figsize=(10, 6))
-    correct_counts = [1 if result else 0 for result in attempts]
-    running_accuracy = []
-    window = deque(maxlen=window_size)
-    
-    for count in correct_counts:
-        window.append(count)
-        running_accuracy.append(sum(window) / len(window) * 100)
-    
-    plt.plot(range(1, len(running_accuracy) + 1), running_accuracy, 'b-', label='Running Accuracy')
-    plt.axhline(y=100, color='g', linestyle='--', label='Perfect Accuracy')
-    
-    plt.title('Card Counting Accuracy Over Time')
-    plt.xlabel('Number of Attempts')
-    plt.ylabel('Accuracy (%)')
-    plt.legend()
-    plt.grid(True)
-    
-    plt.savefig("counting_accuracy.png")
-    plt.close()
+HI_LO = get_system('hilo')
 
 
-def tutorial_mode(deck_count=1):
-    deck = DECK * deck_count
-    random.shuffle(deck)
+def plot_accuracy(tracker, path="counting_accuracy.png"):
+    """Draws the recent accuracy an AccuracyTracker recorded after every answer and waits for the file."""
+    with AccuracyChartRenderer(path) as renderer:
+        renderer.submit(tracker.history)
+
+
+def tutorial_mode(deck_count=1, resolution='exact', source=None):
+    """
+    Step-by-step counting drill. The true count uses the same deck resolution as
+    automated mode ('exact') unless 'half' or 'full' deck estimation is requested.
+    Cards come from source (any CardSource, e.g. a replayed shoe), by default a
+    freshly shuffled shoe of deck_count decks.
+    """
+    shoe = source if source is not None else Deck(num_decks=deck_count)
     running_count = 0
-    cards_seen = 0
-    total_cards = len(deck)
-    decks_remaining = deck_count
-    attempts = []
+    attempts = AccuracyTracker()
+    renderer = AccuracyChartRenderer()
 
     print("Welcome to the Blackjack Card Counting Tutorial!")
     print("We will go through each card one by one. Enter the correct count after each card.")
     print("Press 'q' to quit the tutorial.\n")
 
-    while deck:
-        card = deck.pop(0)
-        cards_seen += 1
-        running_count += HI_LO_VALUES[card]
-        decks_remaining = max(1, round((total_cards - cards_seen) / 52))  # Approximate decks left
-        true_count = get_true_count(running_count, decks_remaining)
+    for card in shoe:
+        value = HI_LO.tag(card.rank)
+        running_count += value
+        # Sized by the shoe actually being dealt, which may not have deck_count decks
+        true_count = round(true_count_for(running_count, shoe.remaining_cards, resolution), 2)
 
         print(f"Card drawn: {card}")
         user_input = input("Enter the running count: ")
@@ -124,48 +46,69 @@ def tutorial_mode(deck_count=1):
         try:
             user_count = int(user_input)
             is_correct = user_count == running_count
-            attempts.append(is_correct)
+            attempts.record(is_correct)
             
             if is_correct:
                 print("✅ Correct! The count is updated.")
             else:
                 print(f"❌ Incorrect. The correct running count is {running_count}.")
-                print(f"Explanation: {card} has a value of {HI_LO_VALUES[card]}, so the new count is {running_count}.")
+                print(f"Explanation: {card} has a value of {value}, so the new count is {running_count}.")
         except ValueError:
             print("❌ Invalid input. Please enter a number.")
-            attempts.append(False)
+            attempts.record(False)
 
         print(f"Current True Count: {true_count}\n")
 
-        # Plot accuracy every attempt
-        if len(attempts) % 1 == 0:
-            plot_accuracy(attempts)
-            current_accuracy = sum(attempts[-10:]) / min(10, len(attempts)) * 100
-            print(f"Your recent accuracy: {current_accuracy:.1f}%")
+        # Redraw the chart in the background; bursts of answers are coalesced
+        renderer.submit(attempts.history)
+        print(f"Your recent accuracy: {attempts.recent_accuracy:.1f}%")
 
     print("Tutorial complete! You've gone through the deck.")
     
+    renderer.close()
     if attempts:
-        plot_accuracy(attempts)
-        final_accuracy = sum(attempts) / len(attempts) * 100
         print(f"\nFinal Statistics:")
         print(f"Total attempts: {len(attempts)}")
-        print(f"Overall accuracy: {final_accuracy:.1f}%")
-
-
-def automated_mode(num_decks=1):
-    deck = Deck(num_decks=num_decks)
+        print(f"Overall accuracy: {attempts.overall_accuracy:.1f}%")
+
+
+def automated_mode(num_decks=1, sinks=None, verbose=False, source=None, record_to=None, seed=None):
+    """
+    Deals the whole shoe and pushes every card into the sinks.
+    By default only aggregate true count statistics are printed at the end;
+    verbose=True adds the per-card PrintSink. source replaces the shuffled
+    shoe with any CardSource. record_to appends the shuffled shoe to a shoe archive.
+    """
+    recorder = None
+    if record_to is not None:
+        if source is not None:
+            raise ValueError("record_to records a freshly shuffled shoe; it cannot be combined with source")
+        from cardcount.shoe_archive import ShoeWriter
+        recorder = ShoeWriter(record_to, num_decks, seed=seed)
+    try:
+        deck = source if source is not None else Deck(num_decks=num_decks, rng=seed, recorder=recorder)
+    finally:
+        # The whole shoe is written when the deck shuffles it, and it is never reshuffled here
+        if recorder is not None:
+            recorder.close()
     counter = CardCounter(num_decks=num_decks)
+    if sinks is None:
+        sinks = [TrueCountStatistics()]
+    if verbose:
+        sinks = [PrintSink()] + list(sinks)
     
     print("Starting Automated Card Counting (Hi-Lo System)...\n")
     
-    while len(deck.cards) > 0:
-        card = deck.deal_card()
+    for card in deck:
         counter.update_count(card)
-        remaining_cards = len(deck.cards)
-        current_true_count = counter.true_count(remaining_cards)
-        print(f"Dealt {str(card):20} | Running Count: {counter.running_count:3} | True Count: {current_true_count:5.2f}")
-
+        current_true_count = counter.true_count(deck.remaining_cards)
+        for sink in sinks:
+            sink.push(card, counter.running_count, current_true_count)
+
+    for sink in sinks:
+        summary = sink.summary()
+        if summary:
+            print(summary)
     print("\nFinal Running Count:", counter.running_count)
 
 
@@ -0,0 +1,40 @@
+#This file contains the tests for the v2 consolidated tutorial and automated modes.
+import importlib.util
+import io
+import os
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import MagicMock, patch
+
+from cardcount import CardSource, true_count_for
+
+_spec = importlib.util.spec_from_file_location(
+    'v2_consolidated', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'v2_Consolidated Code.py'))
+v2 = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(v2)
+
+
+class TutorialModeTests(unittest.TestCase):
+
+    def test_true_count_follows_the_source_not_deck_count(self):
+        source = CardSource.shuffled(6, rng=1)
+        cards = [source.peek(offset) for offset in range(4)]
+        output = io.StringIO()
+        answers = iter(['0'] * 4 + ['q'])
+        with patch.object(v2, 'AccuracyChartRenderer', MagicMock()), \
+                patch('builtins.input', lambda prompt: next(answers)), redirect_stdout(output):
+            v2.tutorial_mode(source=source)
+
+        printed = [float(line.split(':')[1]) for line in output.getvalue().splitlines()
+                   if line.startswith("Current True Count")]
+        running_count = 0
+        expected = []
+        for dealt, card in enumerate(cards, 1):
+            running_count += v2.HI_LO.tag(card.rank)
+            expected.append(round(true_count_for(running_count, 312 - dealt), 2))
+        self.assertEqual(printed, expected)
+        self.assertTrue(all(abs(count) < 1 for count in printed))
+
+
+if __name__ == "__main__":
+    unittest.main()